@@ -0,0 +1,11 @@
+"""DownloadStation benchmarks, with 5000 tasks."""
+from .payloads import tasks_payload
+from synology_dsm.api.download_station import SynoDownloadStation
+
+
+def test_download_station_update(benchmark, dsm):
+    """Updates 5000 tasks."""
+    dsm.responses[(SynoDownloadStation.TASK_API_KEY, "List")] = tasks_payload(5000)
+    download_station = SynoDownloadStation(dsm)
+    benchmark(download_station.update)
+    assert len(download_station.get_all_tasks()) == 5000
@@ -0,0 +1,48 @@
+"""JSON decoders benchmarks over the API fixtures.
+
+Run with ``nox --session=benchmarks -- benchmarks/bench_json_decode.py``.
+"""
+import json
+
+import pytest
+from tests.api_data import dsm_5
+from tests.api_data import dsm_6
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+DECODERS = {"json": json.loads}
+if orjson:
+    DECODERS["orjson"] = orjson.loads
+
+PAYLOADS = {
+    name: json.dumps(getattr(module, name)).encode()
+    for module in (dsm_5, dsm_6)
+    for name in dir(module)
+    if name.startswith("DSM_") and isinstance(getattr(module, name), dict)
+}
+
+
+def decode_all(decoder):
+    """Decodes every fixture payload."""
+    for payload in PAYLOADS.values():
+        decoder(payload)
+
+
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_decode_all(benchmark, decoder):
+    """Decodes all the fixture payloads."""
+    benchmark.group = "decode all fixtures"
+    benchmark(decode_all, DECODERS[decoder])
+
+
+@pytest.mark.parametrize("payload", sorted(PAYLOADS))
+@pytest.mark.parametrize("decoder", DECODERS)
+def test_decode(benchmark, decoder, payload):
+    """Decodes a fixture payload."""
+    benchmark.group = f"decode {payload} ({len(PAYLOADS[payload])} bytes)"
+    assert benchmark(DECODERS[decoder], PAYLOADS[payload]) == json.loads(
+        PAYLOADS[payload]
+    )
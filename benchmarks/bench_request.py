@@ -0,0 +1,45 @@
+"""Request building benchmarks."""
+from tests import FakeResponse
+from tests.api_data.dsm_6 import DSM_6_CORE_UTILIZATION
+
+from synology_dsm import SynologyDSM
+from synology_dsm.api.core.utilization import SynoCoreUtilization
+
+
+class CannedSession:
+    """HTTP session answering every request with the same response."""
+
+    def __init__(self, response):
+        """Constructor method."""
+        self.response = response
+
+    def get(self, url, params=None, **kwargs):
+        """Returns the response."""
+        return self.response
+
+    post = get
+
+
+def test_prepare_request(benchmark, dsm):
+    """Builds the URL and params of a request."""
+    benchmark(
+        dsm._prepare_request,
+        SynoCoreUtilization.API_KEY,
+        "get",
+        {"type": "current", "resource": "cpu"},
+        {},
+    )
+
+
+def test_get(benchmark, dsm):
+    """Sends a GET request through the whole client, without network."""
+    response = FakeResponse("", 200, DSM_6_CORE_UTILIZATION)
+    dsm._execute_request = SynologyDSM._execute_request.__get__(dsm)
+    dsm._session = CannedSession(response)
+    result = benchmark(
+        dsm.get,
+        SynoCoreUtilization.API_KEY,
+        "get",
+        {"type": "current", "resource": "cpu"},
+    )
+    assert result == DSM_6_CORE_UTILIZATION
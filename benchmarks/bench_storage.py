@@ -0,0 +1,55 @@
+"""Storage accessors benchmarks, on 60 disks and 20 volumes."""
+import pytest
+
+from .payloads import storage_payload
+from synology_dsm.api.storage.storage import SynoStorage
+
+
+@pytest.fixture
+def storage(dsm):
+    """Returns an updated storage of 60 disks and 20 volumes."""
+    dsm.responses[(SynoStorage.API_KEY, "load_info")] = storage_payload(60, 20)
+    storage = SynoStorage(dsm)
+    storage.update()
+    return storage
+
+
+def read_volumes(storage):
+    """Reads the accessors of every volume."""
+    for volume_id in storage.volumes_ids:
+        storage.volume_status(volume_id)
+        storage.volume_device_type(volume_id)
+        storage.volume_size_total(volume_id)
+        storage.volume_size_used(volume_id)
+        storage.volume_percentage_used(volume_id)
+        storage.volume_disk_temp_avg(volume_id)
+        storage.volume_disk_temp_max(volume_id)
+
+
+def read_disks(storage):
+    """Reads the accessors of every disk."""
+    for disk_id in storage.disks_ids:
+        storage.disk_name(disk_id)
+        storage.disk_device(disk_id)
+        storage.disk_smart_status(disk_id)
+        storage.disk_status(disk_id)
+        storage.disk_exceed_bad_sector_thr(disk_id)
+        storage.disk_below_remain_life_thr(disk_id)
+        storage.disk_temp(disk_id)
+
+
+def test_storage_update(benchmark, storage):
+    """Updates the storage."""
+    benchmark(storage.update)
+
+
+def test_volumes_accessors(benchmark, storage):
+    """Reads the accessors of the 20 volumes."""
+    benchmark(read_volumes, storage)
+    assert storage.volume_disk_temp_max("volume_20") == 44
+
+
+def test_disks_accessors(benchmark, storage):
+    """Reads the accessors of the 60 disks."""
+    benchmark(read_disks, storage)
+    assert storage.disk_temp("sd59") == 44
@@ -0,0 +1,39 @@
+"""SurveillanceStation benchmarks, with 200 cameras."""
+from .payloads import cameras_payload
+from .payloads import live_view_payload
+from .payloads import motion_payload
+from synology_dsm.api.surveillance_station import SynoSurveillanceStation
+
+
+def _responses(dsm):
+    """Sets the payloads of 200 cameras."""
+    dsm.responses.update(
+        {
+            (SynoSurveillanceStation.CAMERA_API_KEY, "List"): cameras_payload(200),
+            (
+                SynoSurveillanceStation.CAMERA_EVENT_API_KEY,
+                "MotionEnum",
+            ): motion_payload(),
+            (
+                SynoSurveillanceStation.CAMERA_API_KEY,
+                "GetLiveViewPath",
+            ): live_view_payload(200),
+        }
+    )
+
+
+def test_surveillance_station_update(benchmark, dsm):
+    """Updates 200 cameras, their motion settings cached."""
+    _responses(dsm)
+    surveillance = SynoSurveillanceStation(dsm)
+    benchmark(surveillance.update)
+    assert len(surveillance.get_all_cameras()) == 200
+
+
+def test_surveillance_station_update_motion_detection(benchmark, dsm):
+    """Updates 200 cameras and their motion settings."""
+    _responses(dsm)
+    surveillance = SynoSurveillanceStation(dsm)
+    surveillance.motion_detection_ttl = 0
+    benchmark(surveillance.update)
+    assert len(surveillance.get_all_cameras()) == 200
@@ -0,0 +1,33 @@
+"""Benchmarks fixtures."""
+import pytest
+from tests.api_data.dsm_6 import DSM_6_API_INFO
+from tests.api_data.dsm_6 import DSM_6_API_INFO_SURVEILLANCE_STATION
+from tests.api_data.dsm_6 import DSM_6_DSM_INFORMATION
+
+from synology_dsm import SynologyDSM
+from synology_dsm.api.dsm.information import SynoDSMInformation
+
+
+class BenchmarkDSM(SynologyDSM):
+    """Logged in SynologyDSM answering requests from a dict of payloads."""
+
+    def __init__(self, responses: dict = None, **kwargs):
+        """Constructor method."""
+        super().__init__("nas.local", 5001, "user", "password", **kwargs)
+        self.responses = responses or {}
+        self._apis = {
+            **DSM_6_API_INFO["data"],
+            **DSM_6_API_INFO_SURVEILLANCE_STATION["data"],
+        }
+        self._session_id = "session_id"
+        self._information = SynoDSMInformation(self)
+        self._information._data = DSM_6_DSM_INFORMATION["data"]
+
+    def _execute_request(self, method, url, params, **kwargs):
+        return self.responses[(params["api"], params["method"])]
+
+
+@pytest.fixture
+def dsm():
+    """Returns a DSM client answering from payloads set in ``responses``."""
+    return BenchmarkDSM()
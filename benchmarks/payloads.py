@@ -0,0 +1,89 @@
+"""Synthetic API payloads, scaled up from the test fixtures."""
+from copy import deepcopy
+
+from tests.api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_TASK_LIST
+from tests.api_data.dsm_6 import DSM_6_STORAGE_STORAGE_DS1819_PLUS_SHR2_8DISKS_1VOL
+from tests.api_data.dsm_6 import DSM_6_SURVEILLANCE_STATION_CAMERA_EVENT_MOTION_ENUM
+from tests.api_data.dsm_6 import DSM_6_SURVEILLANCE_STATION_CAMERA_GET_LIVE_VIEW_PATH
+from tests.api_data.dsm_6 import DSM_6_SURVEILLANCE_STATION_CAMERA_LIST
+
+
+def storage_payload(disks_count: int = 60, volumes_count: int = 20) -> dict:
+    """Returns a storage load_info payload.
+
+    Each volume has its own pool of ``disks_count / volumes_count`` disks,
+    half of the pools are RAID (deploy_path) and half SHR (pool_child).
+    """
+    template = DSM_6_STORAGE_STORAGE_DS1819_PLUS_SHR2_8DISKS_1VOL["data"]
+    data = deepcopy(template)
+    disks_per_volume = disks_count // volumes_count
+
+    data["disks"] = []
+    for index in range(disks_count):
+        disk = deepcopy(template["disks"][0])
+        disk["id"] = f"sd{index}"
+        disk["name"] = f"Disk {index + 1}"
+        disk["temp"] = 30 + index % 15
+        data["disks"].append(disk)
+
+    data["storagePools"] = []
+    data["volumes"] = []
+    for index in range(volumes_count):
+        volume_id = f"volume_{index + 1}"
+        pool = deepcopy(template["storagePools"][0])
+        pool["id"] = f"reuse_{index + 1}"
+        pool["disks"] = [
+            f"sd{disk}"
+            for disk in range(index * disks_per_volume, (index + 1) * disks_per_volume)
+        ]
+        if index % 2:
+            pool["deploy_path"] = volume_id
+            pool["pool_child"] = None
+        else:
+            pool["pool_child"][0]["id"] = volume_id
+        data["storagePools"].append(pool)
+
+        volume = deepcopy(template["volumes"][0])
+        volume["id"] = volume_id
+        data["volumes"].append(volume)
+
+    return {"data": data, "success": True}
+
+
+def cameras_payload(cameras_count: int = 200) -> dict:
+    """Returns a SurveillanceStation camera List payload."""
+    payload = deepcopy(DSM_6_SURVEILLANCE_STATION_CAMERA_LIST)
+    template = payload["data"]["cameras"][0]
+    payload["data"]["cameras"] = [
+        {**deepcopy(template), "id": index, "name": f"Camera {index}"}
+        for index in range(1, cameras_count + 1)
+    ]
+    payload["data"]["total"] = cameras_count
+    return payload
+
+
+def motion_payload() -> dict:
+    """Returns a SurveillanceStation camera MotionEnum payload."""
+    return deepcopy(DSM_6_SURVEILLANCE_STATION_CAMERA_EVENT_MOTION_ENUM)
+
+
+def live_view_payload(cameras_count: int = 200) -> dict:
+    """Returns a SurveillanceStation camera GetLiveViewPath payload."""
+    payload = deepcopy(DSM_6_SURVEILLANCE_STATION_CAMERA_GET_LIVE_VIEW_PATH)
+    template = payload["data"][0]
+    payload["data"] = [
+        {**template, "id": index} for index in range(1, cameras_count + 1)
+    ]
+    return payload
+
+
+def tasks_payload(tasks_count: int = 5000) -> dict:
+    """Returns a DownloadStation task List payload."""
+    payload = deepcopy(DSM_6_DOWNLOAD_STATION_TASK_LIST)
+    templates = payload["data"]["tasks"]
+    payload["data"]["tasks"] = [
+        {**deepcopy(templates[index % len(templates)]), "id": f"dbid_{index}"}
+        for index in range(tasks_count)
+    ]
+    payload["data"]["total"] = tasks_count
+    return payload
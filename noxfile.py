@@ -1,4 +1,5 @@
 """Nox sessions."""
+import os
 import shutil
 import sys
 from pathlib import Path
@@ -109,7 +110,7 @@ def safety(session: Session) -> None:
 def mypy(session: Session) -> None:
     """Type-check using mypy."""
     args = session.posargs or ["src", "tests"]
-    session.install(".")
+    session.install(".[async]")
     session.install("mypy", "pytest")
     session.run("mypy", *args)
     if not session.posargs:
@@ -119,7 +120,7 @@ def mypy(session: Session) -> None:
 @nox.session(python=python_versions)
 def tests(session: Session) -> None:
     """Run the test suite."""
-    session.install(".")
+    session.install(".[async]")
     session.install("coverage[toml]", "pytest", "pygments")
     try:
         session.run("coverage", "run", "--parallel", "-m", "pytest", *session.posargs)
@@ -128,6 +129,32 @@ def tests(session: Session) -> None:
             session.notify("coverage")
 
 
+@nox.session(python="3.9")
+def benchmarks(session: Session) -> None:
+    """Run the benchmarks, compared with the last baseline of this machine.
+
+    Timings depend on the hardware, so baselines are stored by machine and
+    not committed: store one with
+    ``nox -s benchmarks -- benchmarks --benchmark-save=baseline``.
+    The comparison is informational, set ``BENCHMARK_COMPARE_FAIL`` (like
+    ``mean:25%``) to fail on regressions.
+    """
+    # Last, --benchmark-compare would take the next argument as its baseline
+    args = [*(session.posargs or ["benchmarks"]), "--benchmark-compare"]
+    compare_fail = os.environ.get("BENCHMARK_COMPARE_FAIL")
+    if compare_fail:
+        args.append(f"--benchmark-compare-fail={compare_fail}")
+    session.install(".[fast]")
+    session.install("pytest", "pytest-benchmark")
+    session.run(
+        "pytest",
+        "-o",
+        "python_files=bench_*.py",
+        "--benchmark-storage=benchmarks/baselines",
+        *args,
+    )
+
+
 @nox.session
 def coverage(session: Session) -> None:
     """Produce the coverage report."""
@@ -146,7 +173,7 @@ def coverage(session: Session) -> None:
 @nox.session(python=python_versions)
 def typeguard(session: Session) -> None:
     """Runtime type checking using Typeguard."""
-    session.install(".")
+    session.install(".[async]")
     session.install("pytest", "typeguard", "pygments")
     session.run("pytest", f"--typeguard-packages={package}", *session.posargs)
 
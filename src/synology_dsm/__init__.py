@@ -1,4 +1,5 @@
 """The python-synology library."""
 from .synology_dsm import SynologyDSM
+from .synology_dsm_async import AsyncSynologyDSM
 
-__all__ = ["SynologyDSM"]
+__all__ = ["AsyncSynologyDSM", "SynologyDSM"]
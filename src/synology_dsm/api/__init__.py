@@ -1 +1,29 @@
 """Synology API models."""
+from functools import wraps
+from typing import NamedTuple
+
+
+class SynoRequest(NamedTuple):
+    """A DSM API request, yielded by the API models request flows."""
+
+    request_method: str
+    api: str
+    method: str
+    params: dict = None
+    kwargs: dict = None
+
+
+def request_flow(func):
+    """Decorates an API model method written as a request flow.
+
+    The decorated method is a generator yielding ``SynoRequest`` objects and
+    receiving their responses, or lists of independent ones, receiving the
+    list of their responses. The DSM client drives it, so the method returns
+    its result with ``SynologyDSM`` and an awaitable with ``AsyncSynologyDSM``.
+    """
+
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        return self._dsm._run_flow(func(self, *args, **kwargs))
+
+    return wrapper
@@ -1,4 +1,6 @@
 """DSM Security data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 
 
 class SynoCoreSecurity:
@@ -11,9 +13,10 @@ class SynoCoreSecurity:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates security data."""
-        raw_data = self._dsm.get(self.API_KEY, "system_get")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "system_get")
         if raw_data:
             self._data = raw_data["data"]
 
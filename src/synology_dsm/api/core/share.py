@@ -1,4 +1,6 @@
 """Shared Folders data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 from synology_dsm.helpers import SynoFormatHelper
 
 
@@ -25,9 +27,12 @@ class SynoCoreShare:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates share data."""
-        raw_data = self._dsm.post(self.API_KEY, "list", data=self.REQUEST_DATA)
+        raw_data = yield SynoRequest(
+            "POST", self.API_KEY, "list", kwargs={"data": self.REQUEST_DATA}
+        )
         if raw_data:
             self._data = raw_data["data"]
 
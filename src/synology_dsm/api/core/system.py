@@ -1,4 +1,6 @@
 """DSM System data and actions."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 
 
 class SynoCoreSystem:
@@ -11,9 +13,10 @@ class SynoCoreSystem:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates System data."""
-        raw_data = self._dsm.get(self.API_KEY, "info")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "info")
         if raw_data:
             self._data = raw_data["data"]
 
@@ -1,4 +1,6 @@
 """DSM Upgrade data and actions."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 
 
 class SynoCoreUpgrade:
@@ -12,9 +14,10 @@ class SynoCoreUpgrade:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates Upgrade data."""
-        raw_data = self._dsm.get(self.API_SERVER_KEY, "check")
+        raw_data = yield SynoRequest("GET", self.API_SERVER_KEY, "check")
         if raw_data:
             self._data = raw_data["data"].get("update", raw_data["data"])
 
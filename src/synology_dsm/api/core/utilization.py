@@ -1,7 +1,35 @@
 """DSM Utilization data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 from synology_dsm.helpers import SynoFormatHelper
 
 
+def utilization_values(data: dict) -> dict:
+    """Returns the values of an utilization payload by series name.
+
+    Series are named like ``cpu.total_load``, ``memory.real_usage``,
+    ``network.eth0.rx``, ``disk.sda.read_byte`` or ``volume.md2.write_byte``.
+    """
+    values = {}
+    cpu = data.get("cpu") or {}
+    loads = [cpu.get(load) for load in ("system_load", "user_load", "other_load")]
+    if None not in loads:
+        values["cpu.total_load"] = sum(loads)
+    if data.get("memory"):
+        values["memory.real_usage"] = data["memory"]["real_usage"]
+    for network in data.get("network") or []:
+        values[f"network.{network['device']}.rx"] = network["rx"]
+        values[f"network.{network['device']}.tx"] = network["tx"]
+    for section, devices in (
+        ("disk", (data.get("disk") or {}).get("disk", [])),
+        ("volume", (data.get("space") or {}).get("volume", [])),
+    ):
+        for device in devices:
+            values[f"{section}.{device['device']}.read_byte"] = device["read_byte"]
+            values[f"{section}.{device['device']}.write_byte"] = device["write_byte"]
+    return values
+
+
 class SynoCoreUtilization:
     """Class containing Utilization data."""
 
@@ -11,12 +39,32 @@ class SynoCoreUtilization:
         """Constructor method."""
         self._dsm = dsm
         self._data = {}
+        self._index()
 
+    @request_flow
     def update(self):
         """Updates utilization data."""
-        raw_data = self._dsm.get(self.API_KEY, "get")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "get")
         if raw_data:
             self._data = raw_data["data"]
+            self._index()
+
+    def _index(self):
+        """Indexes the devices of each section by their name."""
+        self._networks_by_device = {
+            network["device"]: network for network in self.network
+        }
+        self._disks_by_device = {
+            disk["device"]: disk for disk in self.disk.get("disk", [])
+        }
+        self._volumes_by_device = {
+            volume["device"]: volume for volume in self.space.get("volume", [])
+        }
+        self._luns_by_device = {lun["device"]: lun for lun in self.lun}
+        if self.disk.get("total"):
+            self._disks_by_device["total"] = self.disk["total"]
+        if self.space.get("total"):
+            self._volumes_by_device["total"] = self.space["total"]
 
     @property
     def cpu(self):
@@ -136,34 +184,183 @@ class SynoCoreUtilization:
             return return_data
         return None
 
+    @property
+    def disk(self):
+        """Gets disks utilization."""
+        return self._data.get("disk", {})
+
+    @property
+    def space(self):
+        """Gets volumes utilization."""
+        return self._data.get("space", {})
+
+    @property
+    def lun(self):
+        """Gets LUNs utilization."""
+        return self._data.get("lun", [])
+
     @property
     def network(self):
         """Gets network utilization."""
         return self._data.get("network", [])
 
+    def values(self):
+        """Gets the current values by series name (see ``utilization_values``)."""
+        return utilization_values(self._data)
+
+    def columns(self):
+        """Gets the devices of each section as columns.
+
+        Sections (disk, volume, lun, network) map each field to the list of
+        its values, one per device, without the totals.
+        """
+        columns = {}
+        for section, devices in (
+            ("disk", self._disks_by_device),
+            ("volume", self._volumes_by_device),
+            ("lun", self._luns_by_device),
+            ("network", self._networks_by_device),
+        ):
+            rows = [row for device, row in devices.items() if device != "total"]
+            fields = {}
+            for row in rows:
+                fields.update(dict.fromkeys(row))
+            columns[section] = {
+                field: [row.get(field) for row in rows] for field in fields
+            }
+        return columns
+
+    @staticmethod
+    def _get_value(devices, device_id, key, human_readable=False):
+        """Returns the value of a device, or None."""
+        device = devices.get(device_id)
+        if device is None or device.get(key) is None:
+            return None
+        return_data = int(device[key])
+        if human_readable:
+            return SynoFormatHelper.bytes_to_readable(return_data)
+        return return_data
+
+    # Network
+    @property
+    def networks_ids(self):
+        """Returns the network interfaces ids (eth0, eth1, etc)."""
+        return [device for device in self._networks_by_device if device != "total"]
+
     def _get_network(self, network_id):
         """Function to get specific network (eth0, total, etc)."""
-        for network in self.network:
-            if network["device"] == network_id:
-                return network
-        return None
+        return self._networks_by_device.get(network_id)
 
     def network_up(self, human_readable=False):
         """Total upload speed being used."""
-        network = self._get_network("total")
-        if network:
-            return_data = int(network["tx"])
-            if human_readable:
-                return SynoFormatHelper.bytes_to_readable(return_data)
-            return return_data
-        return None
+        return self.network_tx("total", human_readable)
 
     def network_down(self, human_readable=False):
         """Total download speed being used."""
-        network = self._get_network("total")
-        if network:
-            return_data = int(network["rx"])
-            if human_readable:
-                return SynoFormatHelper.bytes_to_readable(return_data)
-            return return_data
-        return None
+        return self.network_rx("total", human_readable)
+
+    def network_tx(self, network_id, human_readable=False):
+        """Upload speed of a network interface (eth0, total, etc)."""
+        return self._get_value(
+            self._networks_by_device, network_id, "tx", human_readable
+        )
+
+    def network_rx(self, network_id, human_readable=False):
+        """Download speed of a network interface (eth0, total, etc)."""
+        return self._get_value(
+            self._networks_by_device, network_id, "rx", human_readable
+        )
+
+    # Disk
+    @property
+    def disks_ids(self):
+        """Returns the disks ids (sda, sdb, etc)."""
+        return [device for device in self._disks_by_device if device != "total"]
+
+    def get_disk(self, disk_id):
+        """Returns the utilization of a specific disk, or of all (total)."""
+        return self._disks_by_device.get(disk_id, {})
+
+    def disk_read_bytes(self, disk_id, human_readable=False):
+        """Read speed of a disk."""
+        return self._get_value(
+            self._disks_by_device, disk_id, "read_byte", human_readable
+        )
+
+    def disk_write_bytes(self, disk_id, human_readable=False):
+        """Write speed of a disk."""
+        return self._get_value(
+            self._disks_by_device, disk_id, "write_byte", human_readable
+        )
+
+    def disk_read_access(self, disk_id):
+        """Read operations per second of a disk."""
+        return self._get_value(self._disks_by_device, disk_id, "read_access")
+
+    def disk_write_access(self, disk_id):
+        """Write operations per second of a disk."""
+        return self._get_value(self._disks_by_device, disk_id, "write_access")
+
+    def disk_utilization(self, disk_id):
+        """Busy percentage of a disk."""
+        return self._get_value(self._disks_by_device, disk_id, "utilization")
+
+    # Volume
+    @property
+    def volumes_ids(self):
+        """Returns the volumes devices ids (md2, md3, etc)."""
+        return [device for device in self._volumes_by_device if device != "total"]
+
+    def get_volume(self, volume_id):
+        """Returns the utilization of a specific volume, or of all (total)."""
+        return self._volumes_by_device.get(volume_id, {})
+
+    def volume_read_bytes(self, volume_id, human_readable=False):
+        """Read speed of a volume."""
+        return self._get_value(
+            self._volumes_by_device, volume_id, "read_byte", human_readable
+        )
+
+    def volume_write_bytes(self, volume_id, human_readable=False):
+        """Write speed of a volume."""
+        return self._get_value(
+            self._volumes_by_device, volume_id, "write_byte", human_readable
+        )
+
+    def volume_read_access(self, volume_id):
+        """Read operations per second of a volume."""
+        return self._get_value(self._volumes_by_device, volume_id, "read_access")
+
+    def volume_write_access(self, volume_id):
+        """Write operations per second of a volume."""
+        return self._get_value(self._volumes_by_device, volume_id, "write_access")
+
+    def volume_utilization(self, volume_id):
+        """Busy percentage of a volume."""
+        return self._get_value(self._volumes_by_device, volume_id, "utilization")
+
+    # LUN
+    @property
+    def luns_ids(self):
+        """Returns the LUNs ids."""
+        return list(self._luns_by_device)
+
+    def get_lun(self, lun_id):
+        """Returns the utilization of a specific LUN."""
+        return self._luns_by_device.get(lun_id, {})
+
+    def lun_read_bytes(self, lun_id, human_readable=False):
+        """Read speed of a LUN."""
+        return self._get_value(
+            self._luns_by_device, lun_id, "read_byte", human_readable
+        )
+
+    def lun_write_bytes(self, lun_id, human_readable=False):
+        """Write speed of a LUN."""
+        return self._get_value(
+            self._luns_by_device, lun_id, "write_byte", human_readable
+        )
+
+    def lun_utilization(self, lun_id):
+        """Busy percentage of a LUN."""
+        return self._get_value(self._luns_by_device, lun_id, "utilization")
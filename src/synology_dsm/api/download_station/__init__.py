@@ -1,5 +1,21 @@
 """Synology DownloadStation API wrapper."""
+import asyncio
+import os
+from contextlib import contextmanager
+
 from .task import SynoDownloadTask
+from .task import SynoDownloadTaskChanges
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
+
+# Status of the tasks not transferring data
+INACTIVE_STATUSES = ("paused", "finished", "error")
+
+# Status of the tasks after an action, until the next update
+_PATCHED_STATUSES = {"Pause": "paused", "Resume": "waiting"}
+
+# Task ids per GetInfo request of update_progress(), to keep the URLs short
+_PROGRESS_IDS_PER_REQUEST = 100
 
 
 class SynoDownloadStation:
@@ -18,18 +34,211 @@ class SynoDownloadStation:
             "detail",
             "file",
         ]  # Can contain: detail, transfer, file, tracker, peer
+        self.page_size = None  # Tasks listed per request, all at once if None
+        # After an action: "update" lists the tasks, "patch" changes their local
+        # status (listing them after a creation), "lazy" waits for next update()
+        self.refresh_after_action = "update"
+        self._stale = False
+        self._stat = None
+        self._subscribers = []
 
-    def update(self):
-        """Update tasks from API."""
-        self._tasks_by_id = {}
-        list_data = self._dsm.get(
-            self.TASK_API_KEY, "List", {"additional": ",".join(self.additionals)}
-        )["data"]
-        for task_data in list_data["tasks"]:
-            if task_data["id"] in self._tasks_by_id:
-                self._tasks_by_id[task_data["id"]].update(task_data)
-            else:
-                self._tasks_by_id[task_data["id"]] = SynoDownloadTask(task_data)
+    def subscribe(self, callback):
+        """Call callback with the SynoDownloadTaskChanges of every refresh.
+
+        Only refreshes changing tasks call it, from update(), update_progress()
+        and the refreshes after actions.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Stop calling a subscribed callback."""
+        self._subscribers.remove(callback)
+
+    def _notify(self, changes):
+        """Call the subscribers if tasks changed."""
+        if changes:
+            for callback in list(self._subscribers):
+                callback(changes)
+
+    @request_flow
+    def update(self, additionals=None):
+        """Update tasks from API, with other additionals than the default ones.
+
+        Return the SynoDownloadTaskChanges since the previous update.
+        """
+        return (yield from self._update_flow(additionals))
+
+    def _update_flow(self, additionals=None):
+        """Request flow refreshing the tasks, returning their changes."""
+        tasks_by_id = {}
+        changes = SynoDownloadTaskChanges([], [], [], [])
+        offset = 0
+        while True:
+            list_data = yield from self._list_flow(offset, self.page_size, additionals)
+            for task_data in list_data["tasks"]:
+                task = self._tasks_by_id.get(task_data["id"])
+                if task:
+                    status, size_downloaded = task.status, task.size_downloaded
+                    task.update(task_data)
+                    _add_changes(changes, task, status, size_downloaded)
+                else:
+                    task = SynoDownloadTask(task_data)
+                    changes.added.append(task)
+                tasks_by_id[task_data["id"]] = task
+            offset += len(list_data["tasks"])
+            if (
+                not self.page_size
+                or not list_data["tasks"]
+                or offset >= list_data["total"]
+            ):
+                break
+        changes.removed.extend(
+            task
+            for task_id, task in self._tasks_by_id.items()
+            if task_id not in tasks_by_id
+        )
+        self._tasks_by_id = tasks_by_id
+        self._stale = False
+        self._notify(changes)
+        return changes
+
+    def _list_flow(self, offset=0, limit=None, additionals=None):
+        """Request flow listing a page of tasks."""
+        if additionals is None:
+            additionals = self.additionals
+        params = {"additional": ",".join(additionals)}
+        if offset:
+            params["offset"] = offset
+        if limit:
+            params["limit"] = limit
+        return (yield SynoRequest("GET", self.TASK_API_KEY, "List", params))["data"]
+
+    def iter_tasks(self, additionals=None, page_size=100, offset=0, limit=None):
+        """Iterate over the tasks, requesting them by pages of page_size.
+
+        The tasks are not kept by the Download Station, so a large queue is
+        never held at once. Use ``async for`` with ``AsyncSynologyDSM``.
+        """
+        if asyncio.iscoroutinefunction(self._dsm._run_flow):
+            return self._aiter_tasks(additionals, page_size, offset, limit)
+        return self._iter_tasks(additionals, page_size, offset, limit)
+
+    def _iter_tasks(self, additionals, page_size, offset, limit):
+        """Iterate over the tasks with SynologyDSM."""
+        while limit is None or limit > 0:
+            page_limit = page_size if limit is None else min(page_size, limit)
+            list_data = self._dsm._run_flow(
+                self._list_flow(offset, page_limit, additionals)
+            )
+            for task_data in list_data["tasks"]:
+                yield SynoDownloadTask(task_data)
+            offset += len(list_data["tasks"])
+            if limit is not None:
+                limit -= len(list_data["tasks"])
+            if not list_data["tasks"] or offset >= list_data["total"]:
+                return
+
+    async def _aiter_tasks(self, additionals, page_size, offset, limit):
+        """Iterate over the tasks with AsyncSynologyDSM."""
+        while limit is None or limit > 0:
+            page_limit = page_size if limit is None else min(page_size, limit)
+            list_data = await self._dsm._run_flow(
+                self._list_flow(offset, page_limit, additionals)
+            )
+            for task_data in list_data["tasks"]:
+                yield SynoDownloadTask(task_data)
+            offset += len(list_data["tasks"])
+            if limit is not None:
+                limit -= len(list_data["tasks"])
+            if not list_data["tasks"] or offset >= list_data["total"]:
+                return
+
+    @request_flow
+    def update_progress(self, with_stat=False):
+        """Update the transfer data of the active tasks only.
+
+        Tasks are updated in place with their ``transfer`` additional and
+        status, requested by 100 tasks at once. ``with_stat`` also requests the
+        global statistics, to cross-check ``transfer_totals()``. Return the
+        SynoDownloadTaskChanges.
+        """
+        changes = SynoDownloadTaskChanges([], [], [], [])
+        task_ids = [
+            task.id
+            for task in self._tasks_by_id.values()
+            if task.status not in INACTIVE_STATUSES
+        ]
+        if task_ids:
+            responses = yield [
+                SynoRequest(
+                    "GET",
+                    self.TASK_API_KEY,
+                    "GetInfo",
+                    {
+                        "id": ",".join(
+                            task_ids[index : index + _PROGRESS_IDS_PER_REQUEST]
+                        ),
+                        "additional": "transfer",
+                    },
+                )
+                for index in range(0, len(task_ids), _PROGRESS_IDS_PER_REQUEST)
+            ]
+            tasks_data = [
+                task_data
+                for response in responses
+                for task_data in response["data"]["tasks"]
+            ]
+            for task_data in tasks_data:
+                task = self._tasks_by_id.get(task_data["id"])
+                if task:
+                    status, size_downloaded = task.status, task.size_downloaded
+                    task.patch(
+                        status=task_data["status"],
+                        additional={
+                            **task.additional,
+                            **task_data.get("additional", {}),
+                        },
+                    )
+                    _add_changes(changes, task, status, size_downloaded)
+        if with_stat:
+            self._stat = (yield SynoRequest("GET", self.STAT_API_KEY, "GetInfo"))[
+                "data"
+            ]
+        self._notify(changes)
+        return changes
+
+    def transfer_totals(self):
+        """Return the transfer totals of the tasks.
+
+        Sizes are summed from the tasks ``transfer`` additional, speeds from
+        the active tasks only. ``eta`` is the seconds left to download all
+        tasks at current speed. ``stat_speed_download`` and
+        ``stat_speed_upload`` come from the last ``update_progress(with_stat=True)``.
+        """
+        speed_download = speed_upload = size_downloaded = size_uploaded = 0
+        size_left = 0
+        for task in self._tasks_by_id.values():
+            transfer = task.additional.get("transfer")
+            if not transfer:
+                continue
+            size_downloaded += transfer["size_downloaded"]
+            size_uploaded += transfer["size_uploaded"]
+            if task.status not in INACTIVE_STATUSES:
+                # Inactive tasks keep the speeds of their last poll
+                speed_download += transfer["speed_download"]
+                speed_upload += transfer["speed_upload"]
+                size_left += max(task.size - transfer["size_downloaded"], 0)
+
+        stat = self._stat or {}
+        return {
+            "speed_download": speed_download,
+            "speed_upload": speed_upload,
+            "size_downloaded": size_downloaded,
+            "size_uploaded": size_uploaded,
+            "eta": int(size_left / speed_download) if speed_download else None,
+            "stat_speed_download": stat.get("speed_download"),
+            "stat_speed_upload": stat.get("speed_upload"),
+        }
 
     # Global
     def get_info(self):
@@ -53,9 +262,20 @@ class SynoDownloadStation:
         """Return task matching task_id."""
         return self._tasks_by_id[task_id]
 
+    @property
+    def stale(self):
+        """Return True if tasks changed since the last update (lazy refresh)."""
+        return self._stale
+
+    def batch(self):
+        """Return a batch queueing actions, sent together by its flush()."""
+        return SynoDownloadBatch(self)
+
+    @request_flow
     def create(self, uri, unzip_password=None, destination=None):
         """Create a new task (uri accepts HTTP/FTP/magnet/ED2K links)."""
-        res = self._dsm.post(
+        res = yield SynoRequest(
+            "POST",
             self.TASK_API_KEY,
             "Create",
             {
@@ -64,38 +284,194 @@ class SynoDownloadStation:
                 "destination": destination,
             },
         )
-        self.update()
+        yield from self._refresh_flow([("Create", [])])
         return res
 
+    @request_flow
+    def create_from_files(self, files, unzip_password=None, destination=None):
+        """Create new tasks from .torrent/.nzb files, then refresh the tasks once.
+
+        ``files`` is one or a list of paths or binary file objects, each is
+        streamed in its own request. Return the responses of the requests.
+        """
+        if not isinstance(files, (list, tuple)):
+            files = [files]
+        results = []
+        for file in files:
+            with _open_file(file) as fileobj:
+                filename = os.path.basename(getattr(fileobj, "name", "") or "task")
+                res = yield SynoRequest(
+                    "POST",
+                    self.TASK_API_KEY,
+                    "Create",
+                    {"unzip_password": unzip_password, "destination": destination},
+                    {
+                        "files": {
+                            "file": (filename, fileobj, "application/octet-stream")
+                        }
+                    },
+                )
+                results.append(res)
+        if files:
+            yield from self._refresh_flow([("Create", [])])
+        return results
+
+    @request_flow
     def pause(self, task_id):
         """Pause a download task."""
-        res = self._dsm.get(
-            self.TASK_API_KEY,
-            "Pause",
-            {"id": ",".join(task_id) if isinstance(task_id, list) else task_id},
-        )
-        self.update()
+        res = yield self._action_request("Pause", _task_ids(task_id))
+        yield from self._refresh_flow([("Pause", _task_ids(task_id))])
         return res
 
+    @request_flow
     def resume(self, task_id):
         """Resume a paused download task."""
-        res = self._dsm.get(
-            self.TASK_API_KEY,
-            "Resume",
-            {"id": ",".join(task_id) if isinstance(task_id, list) else task_id},
-        )
-        self.update()
+        res = yield self._action_request("Resume", _task_ids(task_id))
+        yield from self._refresh_flow([("Resume", _task_ids(task_id))])
         return res
 
+    @request_flow
     def delete(self, task_id, force_complete=False):
         """Delete a download task."""
-        res = self._dsm.get(
-            self.TASK_API_KEY,
-            "Delete",
-            {
-                "id": ",".join(task_id) if isinstance(task_id, list) else task_id,
-                "force_complete": force_complete,
-            },
+        res = yield self._action_request(
+            "Delete", _task_ids(task_id), {"force_complete": force_complete}
         )
-        self.update()
+        yield from self._refresh_flow([("Delete", _task_ids(task_id))])
         return res
+
+    def _action_request(self, method, task_ids, params=None):
+        """Return the request of an action on tasks."""
+        return SynoRequest(
+            "GET",
+            self.TASK_API_KEY,
+            method,
+            {"id": ",".join(task_ids), **(params or {})},
+        )
+
+    def _refresh_flow(self, actions):
+        """Request flow refreshing the tasks after actions, per refresh_after_action.
+
+        ``actions`` is a list of (method, task ids).
+        """
+        if self.refresh_after_action == "lazy":
+            self._stale = True
+            return
+        if self.refresh_after_action == "patch" and all(
+            method in _PATCHED_STATUSES or method == "Delete" for method, _ in actions
+        ):
+            changes = SynoDownloadTaskChanges([], [], [], [])
+            for method, task_ids in actions:
+                for task_id in task_ids:
+                    if method == "Delete":
+                        if task_id in self._tasks_by_id:
+                            changes.removed.append(self._tasks_by_id.pop(task_id))
+                    elif task_id in self._tasks_by_id:
+                        task = self._tasks_by_id[task_id]
+                        status = task.status
+                        task.patch(status=_PATCHED_STATUSES[method])
+                        _add_changes(changes, task, status, task.size_downloaded)
+            self._notify(changes)
+            return
+        yield from self._update_flow()
+
+
+def _add_changes(changes, task, status, size_downloaded):
+    """Add an updated task to the changes if its status or progress changed."""
+    if task.status != status:
+        changes.status_changed.append(task)
+    if task.size_downloaded != size_downloaded and None not in (
+        size_downloaded,
+        task.size_downloaded,
+    ):
+        # Unknown when the additionals did not include transfer nor file
+        changes.progress_changed.append(task)
+
+
+def _task_ids(task_id):
+    """Return a list of task ids from one or a list of them."""
+    return list(task_id) if isinstance(task_id, (list, tuple)) else [task_id]
+
+
+@contextmanager
+def _open_file(file):
+    """Open a file from its path, or use it as is if already a file object."""
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as fileobj:
+            yield fileobj
+    else:
+        yield file
+
+
+class SynoDownloadBatch:
+    """Download Station actions, queued then sent together by flush().
+
+    Consecutive actions of the same kind are merged into a single request,
+    followed by one refresh of the tasks at most.
+    """
+
+    def __init__(self, download_station):
+        """Initialize a batch of actions."""
+        self._download_station = download_station
+        self._dsm = download_station._dsm
+        self._actions = []
+
+    def __len__(self):
+        """Return the number of queued requests."""
+        return len(self._actions)
+
+    def _queue(self, method, params, values):
+        """Queue an action, merging it with the previous one if alike."""
+        if self._actions:
+            last_method, last_params, last_values = self._actions[-1]
+            if last_method == method and last_params == params:
+                last_values.extend(values)
+                return
+        self._actions.append((method, params, list(values)))
+
+    def create(self, uri, unzip_password=None, destination=None):
+        """Queue the creation of tasks."""
+        self._queue(
+            "Create",
+            {"unzip_password": unzip_password, "destination": destination},
+            _task_ids(uri),
+        )
+
+    def pause(self, task_id):
+        """Queue pausing tasks."""
+        self._queue("Pause", {}, _task_ids(task_id))
+
+    def resume(self, task_id):
+        """Queue resuming tasks."""
+        self._queue("Resume", {}, _task_ids(task_id))
+
+    def delete(self, task_id, force_complete=False):
+        """Queue deleting tasks."""
+        self._queue("Delete", {"force_complete": force_complete}, _task_ids(task_id))
+
+    @request_flow
+    def flush(self):
+        """Send the queued actions, then refresh the tasks once.
+
+        Return the responses of the requests.
+        """
+        actions, self._actions = self._actions, []
+        results = []
+        for method, params, values in actions:
+            if method == "Create":
+                request = SynoRequest(
+                    "POST",
+                    self._download_station.TASK_API_KEY,
+                    "Create",
+                    {"uri": ",".join(values), **params},
+                )
+            else:
+                request = self._download_station._action_request(method, values, params)
+            results.append((yield request))
+        if actions:
+            yield from self._download_station._refresh_flow(
+                [
+                    (method, [] if method == "Create" else values)
+                    for method, _, values in actions
+                ]
+            )
+        return results
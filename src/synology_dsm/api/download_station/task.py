@@ -1,4 +1,7 @@
 """DownloadStation task."""
+from operator import itemgetter
+from typing import List
+from typing import NamedTuple
 
 
 class SynoDownloadTask:
@@ -6,11 +9,17 @@ class SynoDownloadTask:
 
     def __init__(self, data):
         """Initialize a Download Station task."""
-        self._data = data
+        self.update(data)
 
     def update(self, data):
         """Update the task."""
         self._data = data
+        # Computed once, compared at every refresh
+        self._size_downloaded = _size_downloaded(data)
+
+    def patch(self, **values):
+        """Change some values of the task."""
+        self.update({**self._data, **values})
 
     @property
     def id(self):
@@ -54,4 +63,42 @@ class SynoDownloadTask:
     @property
     def additional(self):
         """Return additional data of the task."""
-        return self._data["additional"]
+        return self._data.get("additional", {})
+
+    @property
+    def size_downloaded(self):
+        """Return downloaded size of the task, from its transfer or file additional.
+
+        None if neither was requested.
+        """
+        return self._size_downloaded
+
+
+def _size_downloaded(data):
+    """Return the downloaded size of task data, None if unknown."""
+    additional = data.get("additional")
+    if not additional:
+        return None
+    transfer = additional.get("transfer")
+    if transfer:
+        return transfer["size_downloaded"]
+    files = additional.get("file")
+    if files is None:
+        return None
+    return sum(map(_get_size_downloaded, files))
+
+
+_get_size_downloaded = itemgetter("size_downloaded")
+
+
+class SynoDownloadTaskChanges(NamedTuple):
+    """Tasks changed by a refresh of the Download Station."""
+
+    added: List[SynoDownloadTask]
+    removed: List[SynoDownloadTask]
+    status_changed: List[SynoDownloadTask]
+    progress_changed: List[SynoDownloadTask]
+
+    def __bool__(self):
+        """Return True if any task changed."""
+        return any(self)
@@ -1,4 +1,6 @@
 """DSM Information data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 
 
 class SynoDSMInformation:
@@ -11,9 +13,10 @@ class SynoDSMInformation:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates information data."""
-        raw_data = self._dsm.get(self.API_KEY, "getinfo")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "getinfo")
         if raw_data:
             self._data = raw_data["data"]
 
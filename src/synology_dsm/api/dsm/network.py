@@ -1,4 +1,6 @@
 """DSM Network data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
 
 
 class SynoDSMNetwork:
@@ -11,9 +13,10 @@ class SynoDSMNetwork:
         self._dsm = dsm
         self._data = {}
 
+    @request_flow
     def update(self):
         """Updates network data."""
-        raw_data = self._dsm.get(self.API_KEY, "list")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "list")
         if raw_data:
             self._data = raw_data["data"]
 
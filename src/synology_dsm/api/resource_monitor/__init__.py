@@ -0,0 +1,82 @@
+"""Synology ResourceMonitor API wrapper."""
+from array import array
+
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
+from synology_dsm.api.core.utilization import utilization_values
+
+_MISSING = float("nan")
+
+
+class SynoResourceMonitor:
+    """An implementation of the Synology Resource Monitor history."""
+
+    API_KEY = "SYNO.ResourceMonitor.*"
+    LOG_API_KEY = "SYNO.ResourceMonitor.Log"
+    SETTING_API_KEY = "SYNO.ResourceMonitor.Setting"
+
+    # Logs requested at once
+    PAGE_SIZE = 1000
+
+    def __init__(self, dsm):
+        """Initialize a Resource Monitor."""
+        self._dsm = dsm
+
+    def get_setting(self):
+        """Return the Resource Monitor settings, like the history recording."""
+        return self._dsm.get(self.SETTING_API_KEY, "get")
+
+    @request_flow
+    def get_history(
+        self,
+        start_time: int = None,
+        end_time: int = None,
+        offset: int = 0,
+        limit: int = None,
+        page_size: int = None,
+    ):
+        """Return the utilization history recorded by the NAS, as columns.
+
+        Logs between the ``start_time`` and ``end_time`` timestamps are
+        requested by pages of ``page_size``, from ``offset`` and up to ``limit``
+        logs. The result maps ``time`` and every series name (see
+        ``utilization_values``) to an ``array`` of floats, oldest first, with
+        NaN where a device is missing from a log.
+        """
+        page_size = page_size or self.PAGE_SIZE
+        logs = []
+        while limit is None or len(logs) < limit:
+            params = {"offset": offset, "limit": page_size}
+            if limit is not None:
+                params["limit"] = min(page_size, limit - len(logs))
+            if start_time is not None:
+                params["start_time"] = start_time
+            if end_time is not None:
+                params["end_time"] = end_time
+
+            data = (yield SynoRequest("GET", self.LOG_API_KEY, "list", params))["data"]
+            page = data.get("logs", [])
+            logs.extend(page)
+            offset += len(page)
+            if not page or offset >= data.get("total", 0):
+                break
+
+        return self._columns(logs)
+
+    @staticmethod
+    def _columns(logs: list) -> dict:
+        """Converts logs to columns."""
+        times = array("d")
+        columns = {}
+        for index, log in enumerate(logs):
+            times.append(log["time"])
+            for name, value in utilization_values(log).items():
+                column = columns.get(name)
+                if column is None:
+                    # New device
+                    column = columns[name] = array("d", [_MISSING] * index)
+                column.append(value)
+            for column in columns.values():
+                if len(column) == index:
+                    column.append(_MISSING)
+        return {"time": times, **columns}
@@ -0,0 +1,191 @@
+"""DSM Storage models, parsed once from the load_info payload."""
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+
+def _to_int(value) -> Optional[int]:
+    """Converts a DSM number, often sent as a string."""
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _to_float(value) -> Optional[float]:
+    """Converts a DSM decimal number, often sent as a string."""
+    if value is None or value == "":
+        return None
+    return float(value)
+
+
+def _to_bool(value) -> Optional[bool]:
+    """Converts a DSM boolean, sometimes sent as a string."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def _to_str(value) -> Optional[str]:
+    """Strips the padding of a DSM string."""
+    if value is None:
+        return None
+    return value.strip()
+
+
+class SynoStorageDisk(NamedTuple):
+    """A disk of the storage."""
+
+    id: Optional[str]
+    name: Optional[str]
+    device: Optional[str]
+    status: Optional[str]
+    smart_status: Optional[str]
+    temp: Optional[int]
+    exceed_bad_sector_thr: Optional[bool]
+    below_remain_life_thr: Optional[bool]
+    disk_type: Optional[str]
+    model: Optional[str]
+    vendor: Optional[str]
+    firm: Optional[str]
+    serial: Optional[str]
+    size_total: Optional[int]
+    is_ssd: Optional[bool]
+    used_by: Optional[str]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "SynoStorageDisk":
+        """Parses a disk of the load_info payload."""
+        return cls(
+            id=data.get("id"),
+            name=data.get("name"),
+            device=data.get("device"),
+            status=data.get("status"),
+            smart_status=data.get("smart_status"),
+            temp=_to_int(data.get("temp")),
+            exceed_bad_sector_thr=_to_bool(data.get("exceed_bad_sector_thr")),
+            below_remain_life_thr=_to_bool(data.get("below_remain_life_thr")),
+            disk_type=data.get("diskType"),
+            model=_to_str(data.get("model")),
+            vendor=_to_str(data.get("vendor")),
+            firm=data.get("firm"),
+            serial=data.get("serial"),
+            size_total=_to_int(data.get("size_total")),
+            is_ssd=_to_bool(data.get("isSsd")),
+            used_by=data.get("used_by"),
+        )
+
+
+class SynoStorageVolume(NamedTuple):
+    """A volume of the storage."""
+
+    id: Optional[str]
+    status: Optional[str]
+    device_type: Optional[str]
+    fs_type: Optional[str]
+    path: Optional[str]
+    pool_path: Optional[str]
+    size_total: Optional[int]
+    size_used: Optional[int]
+    disk_failure_number: Optional[int]
+    is_writable: Optional[bool]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "SynoStorageVolume":
+        """Parses a volume of the load_info payload."""
+        size = data.get("size") or {}
+        return cls(
+            id=data.get("id"),
+            status=data.get("status"),
+            device_type=data.get("device_type"),
+            fs_type=data.get("fs_type"),
+            path=data.get("vol_path"),
+            pool_path=data.get("pool_path"),
+            size_total=_to_int(size.get("total")),
+            size_used=_to_int(size.get("used")),
+            disk_failure_number=_to_int(data.get("disk_failure_number")),
+            is_writable=_to_bool(data.get("is_writable")),
+        )
+
+    @property
+    def percentage_used(self) -> Optional[float]:
+        """Used size in percentage of the volume."""
+        if (
+            self.size_used
+            and self.size_used > 0
+            and self.size_total
+            and self.size_total > 0
+        ):
+            return round((float(self.size_used) / float(self.size_total)) * 100.0, 1)
+        return None
+
+
+class SynoStoragePool(NamedTuple):
+    """A storage pool, its disks and its volumes."""
+
+    id: Optional[str]
+    status: Optional[str]
+    device_type: Optional[str]
+    raid_type: Optional[str]
+    disks: Tuple[str, ...]
+    volumes_ids: Tuple[str, ...]
+    size_total: Optional[int]
+    size_used: Optional[int]
+    disk_failure_number: Optional[int]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "SynoStoragePool":
+        """Parses a storage pool of the load_info payload."""
+        volumes_ids = []
+        if data.get("deploy_path"):
+            # RAID disk redundancy
+            volumes_ids.append(data["deploy_path"])
+        for pool_child in data.get("pool_child") or []:
+            # SHR disk redundancy
+            volumes_ids.append(pool_child["id"])
+        size = data.get("size") or {}
+        return cls(
+            id=data.get("id"),
+            status=data.get("status"),
+            device_type=data.get("device_type"),
+            raid_type=data.get("raidType"),
+            disks=tuple(data.get("disks") or ()),
+            volumes_ids=tuple(volumes_ids),
+            size_total=_to_int(size.get("total")),
+            size_used=_to_int(size.get("used")),
+            disk_failure_number=_to_int(data.get("disk_failure_number")),
+        )
+
+
+class SynoStorageEnv(NamedTuple):
+    """The storage environment of the NAS."""
+
+    model_name: Optional[str]
+    bay_number: Optional[int]
+    ram_size: Optional[int]
+    max_fs_bytes: Optional[int]
+    system_crashed: Optional[bool]
+    system_need_repair: Optional[bool]
+    volume_full_critical: Optional[float]
+    volume_full_warning: Optional[float]
+
+    @classmethod
+    def from_data(cls, data: dict) -> "SynoStorageEnv":
+        """Parses the env of the load_info payload."""
+        status = data.get("status") or {}
+        return cls(
+            model_name=data.get("model_name"),
+            bay_number=_to_int(data.get("bay_number")),
+            ram_size=_to_int(data.get("ram_size")),
+            max_fs_bytes=_to_int(data.get("max_fs_bytes")),
+            system_crashed=_to_bool(status.get("system_crashed")),
+            system_need_repair=_to_bool(status.get("system_need_repair")),
+            volume_full_critical=_to_float(data.get("volume_full_critical")),
+            volume_full_warning=_to_float(data.get("volume_full_warning")),
+        )
+
+
+# Returned by the accessors for unknown ids
+EMPTY_DISK = SynoStorageDisk.from_data({})
+EMPTY_VOLUME = SynoStorageVolume.from_data({})
@@ -1,4 +1,12 @@
 """DSM Storage data."""
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
+from synology_dsm.api.storage.models import EMPTY_DISK
+from synology_dsm.api.storage.models import EMPTY_VOLUME
+from synology_dsm.api.storage.models import SynoStorageDisk
+from synology_dsm.api.storage.models import SynoStorageEnv
+from synology_dsm.api.storage.models import SynoStoragePool
+from synology_dsm.api.storage.models import SynoStorageVolume
 from synology_dsm.helpers import SynoFormatHelper
 
 
@@ -11,14 +19,63 @@ class SynoStorage:
         """Constructor method."""
         self._dsm = dsm
         self._data = {}
+        # Set to False to only keep the parsed models after an update
+        self.keep_raw_data = True
+        self._parse()
+        self._index()
 
+    @request_flow
     def update(self):
         """Updates storage data."""
-        raw_data = self._dsm.get(self.API_KEY, "load_info")
+        raw_data = yield SynoRequest("GET", self.API_KEY, "load_info")
         if raw_data:
             self._data = raw_data
             if raw_data.get("data"):
                 self._data = raw_data["data"]
+            self._parse()
+            if not self.keep_raw_data:
+                self._data = {}
+            self._index()
+
+    def _parse(self):
+        """Parses disks, volumes and storage pools, and their relations."""
+        self._disk_models = {}
+        for disk in self.disks:
+            self._disk_models.setdefault(disk["id"], SynoStorageDisk.from_data(disk))
+        self._volume_models = {}
+        for volume in self.volumes:
+            self._volume_models.setdefault(
+                volume["id"], SynoStorageVolume.from_data(volume)
+            )
+        self._env_model = SynoStorageEnv.from_data(self.env) if self.env else None
+
+        self._storage_pool_models = {}
+        self._storage_pool_by_disk = {}
+        self._disks_by_volume = {}
+        for pool in self.storage_pools:
+            pool = SynoStoragePool.from_data(pool)
+            self._storage_pool_models.setdefault(pool.id, pool)
+            for disk_id in pool.disks:
+                self._storage_pool_by_disk.setdefault(disk_id, pool.id)
+            pool_disks = [
+                self._disk_models[disk_id]
+                for disk_id in pool.disks
+                if disk_id in self._disk_models
+            ]
+            for volume_id in pool.volumes_ids:
+                self._disks_by_volume.setdefault(volume_id, []).extend(pool_disks)
+
+    def _index(self):
+        """Indexes the raw disks, volumes and storage pools by id."""
+        self._disks_by_id = {}
+        for disk in self.disks:
+            self._disks_by_id.setdefault(disk["id"], disk)
+        self._volumes_by_id = {}
+        for volume in self.volumes:
+            self._volumes_by_id.setdefault(volume["id"], volume)
+        self._storage_pools_by_id = {}
+        for pool in self.storage_pools:
+            self._storage_pools_by_id.setdefault(pool.get("id"), pool)
 
     # Root
     @property
@@ -41,60 +98,66 @@ class SynoStorage:
         """Gets all volumes."""
         return self._data.get("volumes", [])
 
+    def get_storage_pool(self, pool_id):
+        """Returns a specific storage pool."""
+        return self._storage_pools_by_id.get(pool_id, {})
+
+    # Models
+    @property
+    def disk_models(self):
+        """Gets the parsed disks, by id."""
+        return self._disk_models
+
+    @property
+    def env_model(self):
+        """Gets the parsed storage env."""
+        return self._env_model
+
+    @property
+    def storage_pool_models(self):
+        """Gets the parsed storage pools, by id."""
+        return self._storage_pool_models
+
+    @property
+    def volume_models(self):
+        """Gets the parsed volumes, by id."""
+        return self._volume_models
+
     # Volume
     @property
     def volumes_ids(self):
         """Returns volumes ids."""
-        volumes = []
-        for volume in self.volumes:
-            volumes.append(volume["id"])
-        return volumes
+        return list(self._volume_models)
 
     def get_volume(self, volume_id):
         """Returns a specific volume."""
-        for volume in self.volumes:
-            if volume["id"] == volume_id:
-                return volume
-        return {}
+        return self._volumes_by_id.get(volume_id, {})
 
     def volume_status(self, volume_id):
         """Status of the volume (normal, degraded, etc)."""
-        return self.get_volume(volume_id).get("status")
+        return self._volume_models.get(volume_id, EMPTY_VOLUME).status
 
     def volume_device_type(self, volume_id):
         """Returns the volume type (RAID1, RAID2, etc)."""
-        return self.get_volume(volume_id).get("device_type")
+        return self._volume_models.get(volume_id, EMPTY_VOLUME).device_type
 
     def volume_size_total(self, volume_id, human_readable=False):
         """Total size of volume."""
-        volume = self.get_volume(volume_id)
-        if volume.get("size"):
-            return_data = int(volume["size"]["total"])
-            if human_readable:
-                return SynoFormatHelper.bytes_to_readable(return_data)
-            return return_data
-        return None
+        return_data = self._volume_models.get(volume_id, EMPTY_VOLUME).size_total
+        if return_data is not None and human_readable:
+            return SynoFormatHelper.bytes_to_readable(return_data)
+        return return_data
 
     def volume_size_used(self, volume_id, human_readable=False):
         """Total used size in volume."""
-        volume = self.get_volume(volume_id)
-        if volume.get("size"):
-            return_data = int(volume["size"]["used"])
-            if human_readable:
-                return SynoFormatHelper.bytes_to_readable(return_data)
-            return return_data
-        return None
+        return_data = self._volume_models.get(volume_id, EMPTY_VOLUME).size_used
+        if return_data is not None and human_readable:
+            return SynoFormatHelper.bytes_to_readable(return_data)
+        return return_data
 
     def volume_percentage_used(self, volume_id):
         """Total used size in percentage for volume."""
-        volume = self.get_volume(volume_id)
-        if volume.get("size"):
-            total = int(volume["size"]["total"])
-            used = int(volume["size"]["used"])
-
-            if used and used > 0 and total and total > 0:
-                return round((float(used) / float(total)) * 100.0, 1)
-        return None
+        return self._volume_models.get(volume_id, EMPTY_VOLUME).percentage_used
 
     def volume_disk_temp_avg(self, volume_id):
         """Average temperature of all disks making up the volume."""
@@ -104,7 +167,7 @@ class SynoStorage:
             total_disks = 0
 
             for vol_disk in vol_disks:
-                disk_temp = self.disk_temp(vol_disk["id"])
+                disk_temp = vol_disk.temp
                 if disk_temp:
                     total_disks += 1
                     total_temp += disk_temp
@@ -120,7 +183,7 @@ class SynoStorage:
             max_temp = 0
 
             for vol_disk in vol_disks:
-                disk_temp = self.disk_temp(vol_disk["id"])
+                disk_temp = vol_disk.temp
                 if disk_temp and disk_temp > max_temp:
                     max_temp = disk_temp
             return max_temp
@@ -130,61 +193,44 @@ class SynoStorage:
     @property
     def disks_ids(self):
         """Returns (internal) disks ids."""
-        disks = []
-        for disk in self.disks:
-            disks.append(disk["id"])
-        return disks
+        return list(self._disk_models)
 
     def get_disk(self, disk_id):
         """Returns a specific disk."""
-        for disk in self.disks:
-            if disk["id"] == disk_id:
-                return disk
-        return {}
+        return self._disks_by_id.get(disk_id, {})
 
     def _get_disks_for_volume(self, volume_id):
         """Returns a list of disk for a specific volume."""
-        disks = []
-        for pool in self.storage_pools:
-
-            if pool.get("deploy_path") == volume_id:
-                # RAID disk redundancy
-                for disk_id in pool["disks"]:
-                    disks.append(self.get_disk(disk_id))
-
-            if pool.get("pool_child"):
-                # SHR disk redundancy
-                for pool_child in pool.get("pool_child"):
-                    if pool_child["id"] == volume_id:
-                        for disk_id in pool["disks"]:
-                            disks.append(self.get_disk(disk_id))
+        return self._disks_by_volume.get(volume_id, [])
 
-        return disks
+    def get_disk_storage_pool(self, disk_id):
+        """Returns the storage pool of a specific disk."""
+        return self.get_storage_pool(self._storage_pool_by_disk.get(disk_id))
 
     def disk_name(self, disk_id):
         """The name of this disk."""
-        return self.get_disk(disk_id).get("name")
+        return self._disk_models.get(disk_id, EMPTY_DISK).name
 
     def disk_device(self, disk_id):
         """The mount point of this disk."""
-        return self.get_disk(disk_id).get("device")
+        return self._disk_models.get(disk_id, EMPTY_DISK).device
 
     def disk_smart_status(self, disk_id):
         """Status of disk according to S.M.A.R.T)."""
-        return self.get_disk(disk_id).get("smart_status")
+        return self._disk_models.get(disk_id, EMPTY_DISK).smart_status
 
     def disk_status(self, disk_id):
         """Status of disk."""
-        return self.get_disk(disk_id).get("status")
+        return self._disk_models.get(disk_id, EMPTY_DISK).status
 
     def disk_exceed_bad_sector_thr(self, disk_id):
         """Checks if disk has exceeded maximum bad sector threshold."""
-        return self.get_disk(disk_id).get("exceed_bad_sector_thr")
+        return self._disk_models.get(disk_id, EMPTY_DISK).exceed_bad_sector_thr
 
     def disk_below_remain_life_thr(self, disk_id):
         """Checks if disk has fallen below minimum life threshold."""
-        return self.get_disk(disk_id).get("below_remain_life_thr")
+        return self._disk_models.get(disk_id, EMPTY_DISK).below_remain_life_thr
 
     def disk_temp(self, disk_id):
         """Returns the temperature of the disk."""
-        return self.get_disk(disk_id).get("temp")
+        return self._disk_models.get(disk_id, EMPTY_DISK).temp
@@ -1,7 +1,16 @@
 """Synology SurveillanceStation API wrapper."""
+import asyncio
+import time
+from concurrent.futures import as_completed
+from concurrent.futures import ThreadPoolExecutor
+
 from .camera import SynoCamera
+from .camera import SynoCameraImage
 from .const import MOTION_DETECTION_BY_SURVEILLANCE
 from .const import MOTION_DETECTION_DISABLED
+from synology_dsm.api import request_flow
+from synology_dsm.api import SynoRequest
+from synology_dsm.exceptions import SynologyDSMException
 
 
 class SynoSurveillanceStation:
@@ -18,31 +27,68 @@ class SynoSurveillanceStation:
         """Initialize a Surveillance Station."""
         self._dsm = dsm
         self._cameras_by_id = {}
+        # Seconds the motion settings of a camera are kept before requested again
+        self.motion_detection_ttl = 300
+        self._motion_detection_updated = {}
 
+    @request_flow
     def update(self):
-        """Update cameras and motion settings with latest from API."""
-        self._cameras_by_id = {}
-        list_data = self._dsm.get(self.CAMERA_API_KEY, "List", max_version=7)["data"]
+        """Update cameras and motion settings with latest from API.
+
+        Motion settings older than ``motion_detection_ttl`` seconds are
+        requested together, in one compound request if possible.
+        """
+        list_data = (
+            yield SynoRequest(
+                "GET", self.CAMERA_API_KEY, "List", kwargs={"max_version": 7}
+            )
+        )["data"]
+        cameras_by_id = {}
         for camera_data in list_data["cameras"]:
-            if camera_data["id"] in self._cameras_by_id:
-                self._cameras_by_id[camera_data["id"]].update(camera_data)
+            camera = self._cameras_by_id.get(camera_data["id"])
+            if camera:
+                camera.update(camera_data)
             else:
-                self._cameras_by_id[camera_data["id"]] = SynoCamera(camera_data)
+                camera = SynoCamera(camera_data)
+            cameras_by_id[camera_data["id"]] = camera
+        self._cameras_by_id = cameras_by_id
 
-        for camera_id in self._cameras_by_id:
-            self._cameras_by_id[camera_id].update_motion_detection(
-                self._dsm.get(
-                    self.CAMERA_EVENT_API_KEY, "MotionEnum", {"camId": camera_id}
-                )["data"]
-            )
+        now = time.monotonic()
+        motion_detection_updated = {
+            camera_id: updated
+            for camera_id, updated in self._motion_detection_updated.items()
+            if camera_id in cameras_by_id and now - updated < self.motion_detection_ttl
+        }
+        camera_ids = [
+            camera_id
+            for camera_id in cameras_by_id
+            if camera_id not in motion_detection_updated
+        ]
+        if camera_ids:
+            motion_datas = yield [
+                SynoRequest(
+                    "GET",
+                    self.CAMERA_EVENT_API_KEY,
+                    "MotionEnum",
+                    {"camId": camera_id},
+                )
+                for camera_id in camera_ids
+            ]
+            for camera_id, motion_data in zip(camera_ids, motion_datas):
+                cameras_by_id[camera_id].update_motion_detection(motion_data["data"])
+                motion_detection_updated[camera_id] = now
+        self._motion_detection_updated = motion_detection_updated
 
         if not self._cameras_by_id:
             return
 
-        live_view_datas = self._dsm.get(
-            self.CAMERA_API_KEY,
-            "GetLiveViewPath",
-            {"idList": ",".join(str(k) for k in self._cameras_by_id)},
+        live_view_datas = (
+            yield SynoRequest(
+                "GET",
+                self.CAMERA_API_KEY,
+                "GetLiveViewPath",
+                {"idList": ",".join(str(k) for k in self._cameras_by_id)},
+            )
         )["data"]
         for live_view_data in live_view_datas:
             self._cameras_by_id[live_view_data["id"]].live_view.update(live_view_data)
@@ -72,23 +118,94 @@ class SynoSurveillanceStation:
             return getattr(self._cameras_by_id[camera_id].live_view, video_format)
         return self._cameras_by_id[camera_id].live_view
 
-    def get_camera_image(self, camera_id):
-        """Return bytes of camera image for camera matching camera_id."""
+    def get_camera_image(self, camera_id, timeout=None):
+        """Return bytes of camera image for camera matching camera_id.
+
+        ``timeout`` overrides the client timeout in seconds.
+        """
         return self._dsm.get(
-            self.CAMERA_API_KEY, "GetSnapshot", {"id": camera_id, "cameraId": camera_id}
+            self.CAMERA_API_KEY,
+            "GetSnapshot",
+            {"id": camera_id, "cameraId": camera_id},
+            timeout=timeout,
         )
 
+    def iter_camera_images(self, camera_ids=None, max_concurrency=8, timeout=None):
+        """Fetch the images of cameras concurrently, yielding them as completed.
+
+        Images of ``camera_ids`` (all the cameras by default) are fetched
+        ``max_concurrency`` at a time, with a ``timeout`` in seconds for each.
+        Yields a SynoCameraImage by camera, holding the error if it failed
+        (``async for`` with ``AsyncSynologyDSM``).
+        """
+        if camera_ids is None:
+            camera_ids = list(self._cameras_by_id)
+        if asyncio.iscoroutinefunction(self._dsm._run_flow):
+            return self._aiter_camera_images(camera_ids, max_concurrency, timeout)
+        return self._iter_camera_images(camera_ids, max_concurrency, timeout)
+
+    def _iter_camera_images(self, camera_ids, max_concurrency, timeout):
+        """Fetch the images of cameras on a thread pool, for SynologyDSM."""
+        if not camera_ids:
+            return
+        executor = ThreadPoolExecutor(min(max_concurrency, len(camera_ids)))
+        futures = {
+            executor.submit(self.get_camera_image, camera_id, timeout): camera_id
+            for camera_id in camera_ids
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    yield SynoCameraImage(futures[future], future.result(), None)
+                except SynologyDSMException as err:
+                    yield SynoCameraImage(futures[future], None, err)
+        finally:
+            # Stopped iterating: skip the images not fetched yet
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def _aiter_camera_images(self, camera_ids, max_concurrency, timeout):
+        """Fetch the images of cameras concurrently, for AsyncSynologyDSM."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        started = set()
+
+        async def fetch(camera_id):
+            async with semaphore:
+                started.add(asyncio.current_task())
+                try:
+                    image = await self.get_camera_image(camera_id, timeout)
+                except SynologyDSMException as err:
+                    return SynoCameraImage(camera_id, None, err)
+                return SynoCameraImage(camera_id, image, None)
+
+        tasks = [asyncio.ensure_future(fetch(camera_id)) for camera_id in camera_ids]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            # Stopped iterating: skip the images not fetched yet
+            for task in tasks:
+                if task not in started:
+                    task.cancel()
+
+    @request_flow
     def enable_camera(self, camera_id):
         """Enable camera(s) - multiple ID or single ex 1 or 1,2,3."""
-        return self._dsm.get(self.CAMERA_API_KEY, "Enable", {"idList": camera_id})[
-            "success"
-        ]
+        return (
+            yield SynoRequest(
+                "GET", self.CAMERA_API_KEY, "Enable", {"idList": camera_id}
+            )
+        )["success"]
 
+    @request_flow
     def disable_camera(self, camera_id):
         """Disable camera(s) - multiple ID or single ex 1 or 1,2,3."""
-        return self._dsm.get(self.CAMERA_API_KEY, "Disable", {"idList": camera_id})[
-            "success"
-        ]
+        return (
+            yield SynoRequest(
+                "GET", self.CAMERA_API_KEY, "Disable", {"idList": camera_id}
+            )
+        )["success"]
 
     # Snapshot
     def capture_camera_image(self, camera_id, save=True):
@@ -122,6 +239,7 @@ class SynoSurveillanceStation:
 
     def enable_motion_detection(self, camera_id):
         """Enable motion detection for camera matching camera_id."""
+        self._motion_detection_updated.pop(camera_id, None)
         return self._dsm.get(
             self.CAMERA_EVENT_API_KEY,
             "MDParamSave",
@@ -130,6 +248,7 @@ class SynoSurveillanceStation:
 
     def disable_motion_detection(self, camera_id):
         """Disable motion detection for camera matching camera_id."""
+        self._motion_detection_updated.pop(camera_id, None)
         return self._dsm.get(
             self.CAMERA_EVENT_API_KEY,
             "MDParamSave",
@@ -137,12 +256,18 @@ class SynoSurveillanceStation:
         )
 
     # Home mode
+    @request_flow
     def get_home_mode_status(self):
         """Get the state of Home Mode."""
-        return self._dsm.get(self.HOME_MODE_API_KEY, "GetInfo")["data"]["on"]
+        return (yield SynoRequest("GET", self.HOME_MODE_API_KEY, "GetInfo"))["data"][
+            "on"
+        ]
 
+    @request_flow
     def set_home_mode(self, state):
         """Set the state of Home Mode (state: bool)."""
-        return self._dsm.get(
-            self.HOME_MODE_API_KEY, "Switch", {"on": str(state).lower()}
+        return (
+            yield SynoRequest(
+                "GET", self.HOME_MODE_API_KEY, "Switch", {"on": str(state).lower()}
+            )
         )["success"]
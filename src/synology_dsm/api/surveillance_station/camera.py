@@ -1,4 +1,7 @@
 """SurveillanceStation camera."""
+from typing import NamedTuple
+from typing import Optional
+
 from .const import MOTION_DETECTION_DISABLED
 from .const import RECORDING_STATUS
 
@@ -98,3 +101,11 @@ class SynoCameraLiveView:
     def rtsp(self):
         """Return the RTSP stream path of the camera."""
         return self._data["rtspPath"]
+
+
+class SynoCameraImage(NamedTuple):
+    """A camera image fetched by iter_camera_images(), or the error fetching it."""
+
+    camera_id: int
+    image: Optional[bytes]
+    error: Optional[Exception]
@@ -0,0 +1,122 @@
+"""Persistent caches of the DSM API discovery results and sessions."""
+import json
+import os
+import tempfile
+from abc import ABC
+from abc import abstractmethod
+
+
+class _SynoJsonFile:
+    """JSON file holding entries by key."""
+
+    def __init__(self, path: str):
+        """Constructor method."""
+        self._path = path
+
+    def _load(self) -> dict:
+        """Loads the whole file."""
+        try:
+            with open(self._path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, data: dict):
+        """Writes the whole file atomically, readable by its owner only."""
+        directory = os.path.dirname(os.path.abspath(self._path))
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as cache_file:
+                json.dump(data, cache_file, separators=(",", ":"))
+            os.replace(tmp_path, self._path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+
+
+class SynoApiCache(_SynoJsonFile):
+    """JSON file cache of the SYNO.API.Info query results.
+
+    Entries are keyed by the NAS base URL (host and port) and hold the DSM
+    build they were discovered on, so a DSM upgrade invalidates them.
+    """
+
+    def get(self, key: str) -> dict:
+        """Returns the cached entry of a NAS: {"build": str, "apis": dict}."""
+        return self._load().get(key)
+
+    def set(self, key: str, build: str, apis: dict):
+        """Stores the APIs discovered on a NAS running a DSM build."""
+        data = self._load()
+        data[key] = {"build": build, "apis": apis}
+        self._save(data)
+
+    def delete(self, key: str):
+        """Removes the cached entry of a NAS."""
+        data = self._load()
+        if data.pop(key, None) is not None:
+            self._save(data)
+
+
+class SynoSessionStore(ABC):
+    """Storage of logged sessions, reused across process restarts.
+
+    A session state is a dict holding the session id, SynoToken, device token
+    and DSM information of a user on a NAS. Implement ``load``, ``save`` and
+    ``delete`` to use another backend.
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> dict:
+        """Returns the stored session state, None if there is none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, key: str, state: dict):
+        """Stores a session state."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Removes a stored session state."""
+        raise NotImplementedError
+
+
+class SynoMemorySessionStore(SynoSessionStore):
+    """In-memory session store, shared by the clients of a process."""
+
+    def __init__(self):
+        """Constructor method."""
+        self._states = {}
+
+    def load(self, key: str) -> dict:
+        """Returns the stored session state, None if there is none."""
+        return self._states.get(key)
+
+    def save(self, key: str, state: dict):
+        """Stores a session state."""
+        self._states[key] = state
+
+    def delete(self, key: str):
+        """Removes a stored session state."""
+        self._states.pop(key, None)
+
+
+class SynoFileSessionStore(_SynoJsonFile, SynoSessionStore):
+    """JSON file session store."""
+
+    def load(self, key: str) -> dict:
+        """Returns the stored session state, None if there is none."""
+        return self._load().get(key)
+
+    def save(self, key: str, state: dict):
+        """Stores a session state."""
+        data = self._load()
+        data[key] = state
+        self._save(data)
+
+    def delete(self, key: str):
+        """Removes a stored session state."""
+        data = self._load()
+        if data.pop(key, None) is not None:
+            self._save(data)
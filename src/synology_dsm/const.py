@@ -2,6 +2,7 @@
 # APIs
 API_INFO = "SYNO.API.Info"
 API_AUTH = "SYNO.API.Auth"
+API_ENTRY_REQUEST = "SYNO.Entry.Request"
 
 # SYNO.*
 ERROR_COMMON = {
@@ -43,9 +43,9 @@ class SynologyDSMRequestException(SynologyDSMException):
     def __init__(self, exception):
         """Constructor method."""
         ex_class = exception.__class__.__name__
-        ex_reason = exception.args[0]
-        if hasattr(exception.args[0], "reason"):
-            ex_reason = exception.args[0].reason
+        ex_reason = exception.args[0] if exception.args else None
+        if hasattr(ex_reason, "reason"):
+            ex_reason = ex_reason.reason
         super().__init__(None, -1, f"{ex_class} = {ex_reason}")
 
 
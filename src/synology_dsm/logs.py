@@ -0,0 +1,55 @@
+"""Debug logging helpers."""
+import re
+from collections.abc import Mapping
+
+# Keys of the request params, responses and headers hidden from the logs
+REDACTED_KEYS = {
+    "_sid",
+    "cookie",
+    "device_id",
+    "did",
+    "otp_code",
+    "passwd",
+    "set-cookie",
+    "sid",
+    "synotoken",
+}
+REDACTED_VALUE = "***"
+_REDACTED_PARAMS = re.compile(
+    r"\b(" + "|".join(sorted(REDACTED_KEYS)) + r")=[^&\s'\"]*", re.IGNORECASE
+)
+
+
+def redact(value):
+    """Returns a copy of a payload without its secrets."""
+    if isinstance(value, Mapping):
+        return {
+            key: REDACTED_VALUE if str(key).lower() in REDACTED_KEYS else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    if isinstance(value, str):
+        return _REDACTED_PARAMS.sub(r"\1=" + REDACTED_VALUE, value)
+    return value
+
+
+class LogPayload:
+    """A payload formatted only when its log record is output.
+
+    It is redacted, and truncated to ``max_length`` characters if set.
+    """
+
+    __slots__ = ("_value", "_max_length")
+
+    def __init__(self, value, max_length: int = None):
+        """Constructor method."""
+        self._value = value
+        self._max_length = max_length
+
+    def __str__(self) -> str:
+        """Formats the payload."""
+        text = str(redact(self._value))
+        if self._max_length and len(text) > self._max_length:
+            return f"{text[: self._max_length]}... ({len(text)} characters)"
+        return text
@@ -0,0 +1,113 @@
+"""Instrumentation of the DSM API requests."""
+import threading
+from bisect import bisect_left
+
+# Upper bounds in seconds of the latency histogram buckets, the last is unbounded
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class SynoMetrics:
+    """Statistics of the DSM API requests, by (api, method, version).
+
+    ``on_request`` is called with a dict describing every request, and
+    ``on_relogin`` with the API whose request hit an expired session.
+    A registry can be shared by several clients.
+    """
+
+    def __init__(self, on_request=None, on_relogin=None):
+        """Constructor method."""
+        self.on_request = on_request
+        self.on_relogin = on_relogin
+        self._lock = threading.Lock()
+        self._requests = {}
+        self._relogins = 0
+
+    def reset(self):
+        """Clears the statistics."""
+        with self._lock:
+            self._requests = {}
+            self._relogins = 0
+
+    def record_request(
+        self,
+        params: dict,
+        latency: float = None,
+        status: int = None,
+        size: int = 0,
+        decode_time: float = 0.0,
+        response=None,
+    ):
+        """Records a request from its params and response.
+
+        ``latency`` is None for the requests of a compound request, and
+        ``status`` is None when no HTTP response was received.
+        """
+        error = None
+        if isinstance(response, dict) and response.get("error"):
+            error = response["error"].get("code")
+        key = (params.get("api"), params.get("method"), params.get("version"))
+
+        with self._lock:
+            stats = self._requests.get(key)
+            if stats is None:
+                stats = self._requests[key] = {
+                    "count": 0,
+                    "latency": 0.0,
+                    "max_latency": 0.0,
+                    "histogram": [0] * (len(LATENCY_BUCKETS) + 1),
+                    "bytes": 0,
+                    "decode_time": 0.0,
+                    "statuses": {},
+                    "errors": {},
+                }
+            stats["count"] += 1
+            if latency is not None:
+                stats["latency"] += latency
+                stats["max_latency"] = max(stats["max_latency"], latency)
+                stats["histogram"][bisect_left(LATENCY_BUCKETS, latency)] += 1
+            stats["bytes"] += size
+            stats["decode_time"] += decode_time
+            if status is not None:
+                stats["statuses"][status] = stats["statuses"].get(status, 0) + 1
+            if error is not None:
+                stats["errors"][error] = stats["errors"].get(error, 0) + 1
+
+        if self.on_request:
+            self.on_request(
+                {
+                    "api": key[0],
+                    "method": key[1],
+                    "version": key[2],
+                    "latency": latency,
+                    "status": status,
+                    "bytes": size,
+                    "decode_time": decode_time,
+                    "error": error,
+                }
+            )
+
+    def record_relogin(self, api: str):
+        """Records a session expiry, followed by a new login."""
+        with self._lock:
+            self._relogins += 1
+        if self.on_relogin:
+            self.on_relogin(api)
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the statistics.
+
+        Requests are keyed by (api, method, version), their latency histogram
+        maps the bucket upper bounds to the number of requests.
+        """
+        with self._lock:
+            requests = {}
+            for key, stats in self._requests.items():
+                requests[key] = {
+                    **stats,
+                    "histogram": dict(
+                        zip(LATENCY_BUCKETS + (float("inf"),), stats["histogram"])
+                    ),
+                    "statuses": dict(stats["statuses"]),
+                    "errors": dict(stats["errors"]),
+                }
+            return {"requests": requests, "relogins": self._relogins}
@@ -0,0 +1,136 @@
+"""Streamed multipart/form-data bodies."""
+import io
+import os
+import secrets
+
+CHUNK_SIZE = 64 * 1024
+
+# Escapes of the header param values, like urllib3 does
+_PARAM_ESCAPES = str.maketrans({'"': "%22", "\r": "%0D", "\n": "%0A"})
+
+
+def file_fields(files: dict) -> list:
+    """Returns the (name, filename, file object, content type) of upload files.
+
+    Values are like ``requests`` ones: a file object, bytes or str, or a
+    (filename, file object[, content type]) tuple.
+    """
+    fields = []
+    for name, value in files.items():
+        filename = content_type = None
+        if isinstance(value, tuple):
+            filename, value, *extra = value
+            content_type = extra[0] if extra else None
+        if isinstance(value, str):
+            value = value.encode()
+        if isinstance(value, bytes):
+            value = io.BytesIO(value)
+        if filename is None:
+            filename = getattr(value, "name", None)
+            filename = os.path.basename(filename) if isinstance(filename, str) else name
+        fields.append(
+            (name, filename, value, content_type or "application/octet-stream")
+        )
+    return fields
+
+
+def _remaining_size(fileobj) -> int:
+    """Returns the number of bytes left to read from a file object."""
+    position = fileobj.tell()
+    try:
+        return os.fstat(fileobj.fileno()).st_size - position
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        size = fileobj.seek(0, io.SEEK_END) - position
+        fileobj.seek(position)
+        return size
+
+
+class SynoMultipartEncoder:
+    """A multipart/form-data body read by chunks.
+
+    Files are read while the body is sent, never loaded whole, and the
+    length of the body is known beforehand to send it with a Content-Length.
+    """
+
+    def __init__(self, fields: dict, files: dict, boundary: str = None):
+        """Constructor method."""
+        self.boundary = boundary or secrets.token_hex(16)
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        # Parts are bytes or (file object, its start position, size)
+        self._parts = []
+        for name, value in fields.items():
+            if value is None:
+                continue
+            self._parts.append(
+                self._header(name).encode() + str(value).encode() + b"\r\n"
+            )
+        for name, filename, fileobj, content_type in file_fields(files):
+            self._parts.append(self._header(name, filename, content_type).encode())
+            self._parts.append((fileobj, fileobj.tell(), _remaining_size(fileobj)))
+            self._parts.append(b"\r\n")
+        self._parts.append(f"--{self.boundary}--\r\n".encode())
+
+        self.len = sum(
+            len(part) if isinstance(part, bytes) else part[2] for part in self._parts
+        )
+        self._index = 0
+        self._offset = 0
+
+    def _header(self, name: str, filename: str = None, content_type: str = None):
+        """Returns the header of a part."""
+        header = (
+            f"--{self.boundary}\r\nContent-Disposition: form-data; "
+            f'name="{name.translate(_PARAM_ESCAPES)}"'
+        )
+        if filename is not None:
+            header += (
+                f'; filename="{filename.translate(_PARAM_ESCAPES)}"'
+                f"\r\nContent-Type: {content_type}"
+            )
+        return header + "\r\n\r\n"
+
+    def __len__(self) -> int:
+        """Returns the length of the body."""
+        return self.len
+
+    def __iter__(self):
+        """Iterates over the body chunks."""
+        chunk = self.read(CHUNK_SIZE)
+        while chunk:
+            yield chunk
+            chunk = self.read(CHUNK_SIZE)
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to ``size`` bytes of the body, all of it if negative."""
+        chunks = []
+        while self._index < len(self._parts) and size != 0:
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                chunk = (
+                    part[self._offset :]
+                    if size < 0
+                    else part[self._offset : self._offset + size]
+                )
+                self._offset += len(chunk)
+                done = self._offset >= len(part)
+            else:
+                fileobj, _, part_size = part
+                left = part_size - self._offset
+                chunk = fileobj.read(left if size < 0 else min(size, left))
+                self._offset += len(chunk)
+                done = not chunk or self._offset >= part_size
+            chunks.append(chunk)
+            if size > 0:
+                size -= len(chunk)
+            if done:
+                self._index += 1
+                self._offset = 0
+        return b"".join(chunks)
+
+    def rewind(self):
+        """Moves the files back to their start, to send the body again."""
+        for part in self._parts:
+            if not isinstance(part, bytes):
+                part[0].seek(part[1])
+        self._index = 0
+        self._offset = 0
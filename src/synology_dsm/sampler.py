@@ -0,0 +1,164 @@
+"""Background sampling of the NAS utilization."""
+import asyncio
+import logging
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from math import ceil
+from math import isnan
+
+from .exceptions import SynologyDSMException
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = float("nan")
+
+
+class SynoUtilizationSampler:
+    """Polls ``SYNO.Core.System.Utilization`` and keeps its history.
+
+    Every ``interval`` seconds the client ``utilisation`` is updated, then
+    its values are stored in ring buffers of ``capacity`` samples, by series
+    name like ``cpu.total_load`` (see ``utilization_values``).
+    """
+
+    def __init__(self, dsm, interval: float = 5.0, capacity: int = 720):
+        """Constructor method."""
+        self._dsm = dsm
+        self.interval = interval
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._times = array("d", [0.0] * capacity)
+        self._series = {}
+        self._position = 0
+        self._count = 0
+        self._stopped = threading.Event()
+        self._thread = None
+        self._task = None
+
+    @property
+    def series(self) -> list:
+        """Gets the names of the sampled series."""
+        with self._lock:
+            return list(self._series)
+
+    @property
+    def samples_count(self) -> int:
+        """Gets the number of samples kept."""
+        return self._count
+
+    def start(self):
+        """Starts sampling, in a thread or in an asyncio task for async clients."""
+        self._stopped.clear()
+        if asyncio.iscoroutinefunction(self._dsm.update):
+            self._task = asyncio.ensure_future(self._run_async())
+        else:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops sampling."""
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        """Samples until stopped."""
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            try:
+                self._dsm.utilisation.update()
+                self.record()
+            except SynologyDSMException as err:
+                _LOGGER.warning("Utilization sampling failed: %s", err)
+            self._stopped.wait(max(0.0, self.interval - time.monotonic() + started))
+
+    async def _run_async(self):
+        """Samples until stopped, for async clients."""
+        while not self._stopped.is_set():
+            started = time.monotonic()
+            try:
+                await self._dsm.utilisation.update()
+                self.record()
+            except SynologyDSMException as err:
+                _LOGGER.warning("Utilization sampling failed: %s", err)
+            await asyncio.sleep(max(0.0, self.interval - time.monotonic() + started))
+
+    def record(self, timestamp: float = None):
+        """Stores the current values of the client ``utilisation``.
+
+        ``timestamp`` defaults to ``time.monotonic()``.
+        """
+        values = self._dsm.utilisation.values()
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        with self._lock:
+            position = self._position
+            self._times[position] = timestamp
+            for name, series in self._series.items():
+                series[position] = values.pop(name, _MISSING)
+            for name, value in values.items():
+                # New device
+                series = self._series[name] = array("d", [_MISSING] * self.capacity)
+                series[position] = value
+            self._position = (position + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def _ranges(self, window: float = None) -> list:
+        """Returns the (start, stop) positions of the samples, oldest first.
+
+        Only the samples of the last ``window`` seconds are kept if set.
+        """
+        if self._count < self.capacity:
+            ranges = [(0, self._position)]
+        else:
+            ranges = [(self._position, self.capacity), (0, self._position)]
+        if window is None:
+            return ranges
+
+        cutoff = time.monotonic() - window
+        in_window = []
+        for start, stop in ranges:
+            start = bisect_left(self._times, cutoff, start, stop)
+            if start < stop:
+                in_window.append((start, stop))
+        return in_window
+
+    def values(self, name: str, window: float = None) -> list:
+        """Returns the values of a series, oldest first.
+
+        Only the samples of the last ``window`` seconds are returned if set.
+        """
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                return []
+            values = []
+            for start, stop in self._ranges(window):
+                values.extend(series[start:stop])
+        return [value for value in values if not isnan(value)]
+
+    def stats(self, name: str, window: float = None) -> dict:
+        """Returns the count, min, max, mean and 95th percentile of a series.
+
+        Only the samples of the last ``window`` seconds are used if set,
+        None is returned when there are no samples.
+        """
+        values = self.values(name, window)
+        if not values:
+            return None
+        values.sort()
+        return {
+            "count": len(values),
+            "min": values[0],
+            "max": values[-1],
+            "mean": sum(values) / len(values),
+            "p95": values[ceil(0.95 * len(values)) - 1],
+        }
@@ -1,12 +1,24 @@
 """Class to interact with Synology DSM."""
+import json
+import logging
 import socket
+import threading
+import time
+from concurrent.futures import CancelledError
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from json import JSONDecodeError
 from urllib.parse import quote
+from weakref import WeakKeyDictionary
 
 import urllib3
 from requests import Session
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
+from .api import SynoRequest
 from .api.core.security import SynoCoreSecurity
 from .api.core.share import SynoCoreShare
 from .api.core.system import SynoCoreSystem
@@ -15,9 +27,13 @@ from .api.core.utilization import SynoCoreUtilization
 from .api.download_station import SynoDownloadStation
 from .api.dsm.information import SynoDSMInformation
 from .api.dsm.network import SynoDSMNetwork
+from .api.resource_monitor import SynoResourceMonitor
 from .api.storage.storage import SynoStorage
 from .api.surveillance_station import SynoSurveillanceStation
+from .cache import SynoApiCache
+from .cache import SynoSessionStore
 from .const import API_AUTH
+from .const import API_ENTRY_REQUEST
 from .const import API_INFO
 from .exceptions import SynologyDSMAPIErrorException
 from .exceptions import SynologyDSMAPINotExistsException
@@ -28,6 +44,50 @@ from .exceptions import SynologyDSMLoginFailedException
 from .exceptions import SynologyDSMLoginInvalidException
 from .exceptions import SynologyDSMLoginPermissionDeniedException
 from .exceptions import SynologyDSMRequestException
+from .logs import LogPayload
+from .metrics import SynoMetrics
+from .multipart import SynoMultipartEncoder
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as json_loads
+
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_ERROR_CODES = [
+    106,  # Session timeout
+    119,  # Session ID not valid
+]
+
+# Methods of GET requests only reading data, the ones coalesced when made
+# concurrently: DSM also changes data over GET (Pause, Switch, TakeSnapshot...)
+READ_METHODS = {
+    "check",
+    "get",
+    "getconfig",
+    "getinfo",
+    "getliveviewpath",
+    "getsnapshot",
+    "info",
+    "list",
+    "load_info",
+    "loadsnapshot",
+    "motionenum",
+    "system_get",
+}
+
+# Threads sending the requests yielded together when max_workers is not set
+DEFAULT_MAX_WORKERS = 4
+
+# Seconds a module data is kept by SynologyDSM.update(), 0 updates it every call
+DEFAULT_UPDATE_INTERVALS = {
+    SynoCoreSecurity.API_KEY: 300,
+    SynoCoreSystem.API_KEY: 300,
+    SynoCoreUpgrade.API_KEY: 3600,  # Makes the NAS contact Synology servers
+    SynoDSMNetwork.API_KEY: 300,
+}
 
 
 class SynologyDSM:
@@ -48,30 +108,60 @@ class SynologyDSM:
         timeout: int = None,
         device_token: str = None,
         debugmode: bool = False,
+        batch_requests: bool = False,
+        max_workers: int = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = None,
+        keep_alive: bool = True,
+        api_cache: SynoApiCache = None,
+        session_store: SynoSessionStore = None,
+        update_intervals: dict = None,
+        metrics: SynoMetrics = None,
+        log_payload_length: int = 2000,
+        json_decoder=None,
     ):
         """Constructor method."""
         self.username = username
         self._password = password
         self._timeout = timeout or 10
         self._debugmode = debugmode
+        self._log_payload_length = log_payload_length
+        self._json_decoder = json_decoder or json_loads
         self._verify = verify_ssl & use_https
+        self._batch_requests = batch_requests
+        self._max_workers = max_workers
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize or max(DEFAULT_POOLSIZE, max_workers or 0)
+        self._keep_alive = keep_alive
+        self._update_intervals = {
+            **DEFAULT_UPDATE_INTERVALS,
+            **(update_intervals or {}),
+        }
+        self._updated_at = WeakKeyDictionary()
+        self._metrics = metrics or SynoMetrics()
 
         # Session
-        self._session = Session()
-        self._session.verify = self._verify
+        self._session = self._new_session()
+        self._login_lock = threading.RLock()
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         # Login
         self._session_id = None
         self._syno_token = None
         self._device_token = device_token
+        self._session_store = session_store
 
         # Services
-        self._apis = {
-            "SYNO.API.Info": {"maxVersion": 1, "minVersion": 1, "path": "query.cgi"}
-        }
+        self._api_cache = api_cache
+        self._apis_cached = False
+        self._reset_apis()
         self._download = None
         self._information = None
         self._network = None
+        self._resource_monitor = None
         self._security = None
         self._share = None
         self._storage = None
@@ -91,10 +181,19 @@ class SynologyDSM:
         else:
             self._base_url = f"http://{dsm_ip}:{dsm_port}"
 
-    def _debuglog(self, message: str):
-        """Outputs message if debug mode is enabled."""
+    def _debuglog(self, message: str, *args):
+        """Outputs a debug message, formatted with its args only if it is output.
+
+        It is printed if debug mode is enabled, logged at DEBUG level otherwise.
+        """
         if self._debugmode:
-            print("DEBUG: " + message)
+            print("DEBUG: " + (message % args if args else message))
+        elif _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(message, *args)
+
+    def _log_payload(self, payload) -> LogPayload:
+        """Wraps a payload to log, redacted and truncated."""
+        return LogPayload(payload, self._log_payload_length)
 
     def _is_weird_api_url(self, api: str) -> bool:
         """Returns True if the API URL is not common.
@@ -123,7 +222,69 @@ class SynologyDSM:
         """Retreives available API infos from the NAS."""
         if self._apis.get(API_AUTH):
             return
-        self._apis = self.get(API_INFO, "query")["data"]
+        with self._login_lock:
+            if not self._apis.get(API_AUTH) and not self._load_cached_apis():
+                self._apis = self.get(API_INFO, "query")["data"]
+                self._store_apis()
+
+    def _reset_apis(self):
+        """Forgets the discovered APIs."""
+        self._apis = {
+            "SYNO.API.Info": {"maxVersion": 1, "minVersion": 1, "path": "query.cgi"}
+        }
+        self._apis_cached = False
+
+    def _load_cached_apis(self) -> bool:
+        """Loads the APIs from the discovery cache, returns True if found."""
+        if not self._api_cache:
+            return False
+        entry = self._api_cache.get(self._base_url)
+        if not entry or not entry["apis"].get(API_AUTH):
+            return False
+        self._apis = entry["apis"]
+        self._apis_cached = True
+        self._debuglog("APIs loaded from cache, DSM build: %s", entry["build"])
+        return True
+
+    def _store_apis(self):
+        """Stores the discovered APIs in the discovery cache."""
+        if self._api_cache:
+            build = self._information.version if self._information else None
+            self._api_cache.set(self._base_url, build, self._apis)
+
+    def _invalidate_cached_apis(self) -> bool:
+        """Drops APIs coming from the discovery cache.
+
+        Returns True if they need to be discovered again.
+        """
+        if not self._apis_cached:
+            return False
+        self._debuglog("Invalidating cached APIs")
+        self._api_cache.delete(self._base_url)
+        self._reset_apis()
+        return True
+
+    def _check_cached_apis(self) -> bool:
+        """Checks the cached APIs were discovered on the current DSM build.
+
+        Returns True if they need to be discovered again.
+        """
+        if not self._api_cache or not self._information:
+            return False
+        entry = self._api_cache.get(self._base_url)
+        build = self._information.version
+        if entry and entry["build"] == build:
+            return False
+        if self._apis_cached and entry and entry["build"] is not None:
+            # Discovered on another DSM build
+            return self._invalidate_cached_apis()
+        self._store_apis()
+        return False
+
+    @property
+    def metrics(self) -> SynoMetrics:
+        """Gets the requests statistics."""
+        return self._metrics
 
     @property
     def apis(self):
@@ -131,12 +292,107 @@ class SynologyDSM:
         return self._apis
 
     def login(self, otp_code: str = None) -> bool:
-        """Create a logged session."""
-        # First reset the session
-        self._debuglog("Creating new session")
-        self._session = Session()
-        self._session.verify = self._verify
+        """Create a logged session.
+
+        Reuses the session of the session store if there is one, a new login
+        is made only when DSM rejects it.
+        """
+        if not otp_code and self._restore_session():
+            return True
+
+        # First reset the session credentials, keeping the pooled connections
+        self._debuglog("Resetting session")
+        self._reset_session()
+
+        # Request login
+        result = self.get(API_AUTH, "login", self._login_params(otp_code))
+        self._handle_login(result)
+
+        if not self._information:
+            self._information = SynoDSMInformation(self)
+            self._information.update()
+
+        if self._check_cached_apis():
+            self.discover_apis()
+
+        self._save_session()
+        return result["success"]
+
+    @property
+    def _session_key(self) -> str:
+        """Key of the session in the session store."""
+        return f"{self.username}@{self._base_url}"
+
+    def _restore_session(self) -> bool:
+        """Restores the session of the session store, returns True if found."""
+        if not self._session_store:
+            return False
+        state = self._session_store.load(self._session_key)
+        if not state:
+            return False
+
+        self._session_id = state["session_id"]
+        self._syno_token = state["syno_token"]
+        self._device_token = self._device_token or state["device_token"]
+        if not self._information:
+            self._information = SynoDSMInformation(self)
+        self._information._data = state["information"]
+        self._debuglog("Session restored for %s", self._session_key)
+        return True
+
+    def _save_session(self):
+        """Saves the session in the session store."""
+        if self._session_store:
+            self._session_store.save(
+                self._session_key,
+                {
+                    "session_id": self._session_id,
+                    "syno_token": self._syno_token,
+                    "device_token": self._device_token,
+                    "information": self._information._data,
+                },
+            )
 
+    def _forget_session(self):
+        """Clears the session, and removes it from the session store."""
+        self._session_id = None
+        self._syno_token = None
+        if self._session_store:
+            self._session_store.delete(self._session_key)
+
+    def _expire_session(self, api: str, session_id: str):
+        """Forgets an expired session.
+
+        Callers which sent a request with the same session all get the error,
+        only the first one forgets it: the others retry with the next session.
+        """
+        with self._login_lock:
+            if self._session_id == session_id:
+                self._forget_session()
+                self._device_token = None
+                self._metrics.record_relogin(api)
+
+    def _new_session(self) -> Session:
+        """Returns a new HTTP session."""
+        session = Session()
+        session.verify = self._verify
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections, pool_maxsize=self._pool_maxsize
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self._keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _reset_session(self):
+        """Clears the session cookies without closing its connections."""
+        if self._session is None:
+            self._session = self._new_session()
+        self._session.cookies.clear()
+
+    def _login_params(self, otp_code: str = None) -> dict:
+        """Builds the login request params."""
         params = {
             "account": self.username,
             "passwd": self._password,
@@ -151,9 +407,10 @@ class SynologyDSM:
         if self._device_token:
             params["device_id"] = self._device_token
 
-        # Request login
-        result = self.get(API_AUTH, "login", params)
+        return params
 
+    def _handle_login(self, result: dict):
+        """Stores the login tokens or raises the login error."""
         # Handle errors
         if result.get("error"):
             switcher = {
@@ -177,20 +434,21 @@ class SynologyDSM:
             # Not available on API version < 6 && device token is given once
             # per device_name
             self._device_token = result["data"]["did"]
-        self._debuglog("Authentication successful, token: " + str(self._session_id))
-
-        if not self._information:
-            self._information = SynoDSMInformation(self)
-            self._information.update()
-
-        return result["success"]
+        self._debuglog("Authentication successful for %s", self.username)
 
     def logout(self) -> bool:
         """Log out of the session."""
         result = self.get(API_AUTH, "logout")
-        self._session = None
+        self._forget_session()
+        self._reset_session()
+        self._shutdown_executor()
         return result["success"]
 
+    def close(self):
+        """Stops the worker threads and closes the HTTP connections."""
+        self._shutdown_executor()
+        self._session.close()
+
     @property
     def device_token(self) -> str:
         """Gets the device token.
@@ -216,15 +474,109 @@ class SynologyDSM:
         retry_once: bool = True,
         **kwargs,
     ):
-        """Handles API request."""
+        """Handles API request.
+
+        Identical read requests made concurrently share a single response.
+        """
+        if not self._is_read_request(request_method, api, method):
+            return self._do_request(
+                request_method, api, method, params, retry_once, **kwargs
+            )
+
+        key = self._request_key(api, method, params, kwargs)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                leader = self._in_flight[key] = Future()
+        if future is not None:
+            self._debuglog("Waiting for in-flight request: %s", api)
+            try:
+                return future.result()
+            except CancelledError:
+                # The request was interrupted, send it again
+                return self._request(
+                    request_method, api, method, params, retry_once, **kwargs
+                )
+
+        try:
+            response = self._do_request(
+                request_method, api, method, params, retry_once, **kwargs
+            )
+        except Exception as exp:
+            leader.set_exception(exp)
+            raise
+        except BaseException:
+            leader.cancel()
+            raise
+        else:
+            leader.set_result(response)
+            return response
+        finally:
+            with self._in_flight_lock:
+                if self._in_flight.get(key) is leader:
+                    del self._in_flight[key]
+
+    @staticmethod
+    def _is_read_request(request_method: str, api: str, method: str) -> bool:
+        """Returns True if the request only reads data, so can be coalesced."""
+        return (
+            request_method == "GET"
+            and api != API_AUTH
+            and method.lower() in READ_METHODS
+        )
+
+    @staticmethod
+    def _request_key(api: str, method: str, params: dict, kwargs: dict) -> tuple:
+        """Returns the key identifying identical requests."""
+        return (
+            api,
+            method,
+            json.dumps(params, sort_keys=True, default=str),
+            json.dumps(kwargs, sort_keys=True, default=str),
+        )
+
+    def _do_request(
+        self,
+        request_method: str,
+        api: str,
+        method: str,
+        params: dict = None,
+        retry_once: bool = True,
+        **kwargs,
+    ):
+        """Executes an API request, logs in again once if the session expired."""
         # Discover existing APIs
         if api != API_INFO:
             self.discover_apis()
+            if self._is_unknown_api(api) and self._invalidate_cached_apis():
+                self.discover_apis()
 
-        # Check if logged
+        # Check if logged, only one thread logs in
         if not self._session_id and api not in [API_AUTH, API_INFO]:
-            self.login()
+            with self._login_lock:
+                if not self._session_id:
+                    self.login()
 
+        # The kwargs are kept whole for the retry, like the files to send again
+        request_kwargs = dict(kwargs)
+        url, params = self._prepare_request(api, method, params, request_kwargs)
+
+        # Request data
+        response = self._execute_request(request_method, url, params, **request_kwargs)
+        self._debuglog("Request Method: %s", request_method)
+
+        if self._handle_response(api, response, retry_once, params.get("_sid")):
+            return self._do_request(
+                request_method, api, method, params, False, **kwargs
+            )
+        return response
+
+    def _is_unknown_api(self, api: str) -> bool:
+        """Returns True if the API is not in the discovered APIs."""
+        return not self._is_weird_api_url(api) and not self.apis.get(api)
+
+    def _prepare_request(self, api: str, method: str, params: dict, kwargs: dict):
+        """Builds the URL and params of an API request."""
         # Build request params
         if not params:
             params = {}
@@ -233,7 +585,7 @@ class SynologyDSM:
 
         if not self._is_weird_api_url(api):
             # Check if API is available
-            if not self.apis.get(api):
+            if self._is_unknown_api(api):
                 raise SynologyDSMAPINotExistsException(api)
             params["version"] = self.apis[api]["maxVersion"]
             max_version = kwargs.pop("max_version", None)
@@ -249,33 +601,258 @@ class SynologyDSM:
         if self._syno_token:
             params["SynoToken"] = self._syno_token
 
-        url = self._build_url(api)
+        return self._build_url(api), params
 
-        # Request data
-        response = self._execute_request(request_method, url, params, **kwargs)
-        self._debuglog("Request Method: " + request_method)
-        self._debuglog("Successful returned data")
-        self._debuglog("API: " + api)
-        self._debuglog("RESPONSE: " + str(response))
+    def _handle_response(
+        self, api: str, response, retry_once: bool, session_id: str = None
+    ) -> bool:
+        """Raises the DSM error of a response.
+
+        Returns True if the session expired and the request should be retried.
+        """
+        self._debuglog(
+            "Successful returned data, API: %s, RESPONSE: %s",
+            api,
+            self._log_payload(response),
+        )
 
         # Handle data errors
         if isinstance(response, dict) and response.get("error") and api != API_AUTH:
-            self._debuglog("Session error: " + str(response["error"]["code"]))
-            if response["error"]["code"] == 119 and retry_once:
-                # Session ID not valid
+            self._debuglog("Session error: %s", response["error"]["code"])
+            if response["error"]["code"] == 102:
+                # API does not exist, the cached APIs are outdated
+                self._invalidate_cached_apis()
+            if response["error"]["code"] in SESSION_ERROR_CODES and retry_once:
+                # Session ID not valid or timed out
                 # see https://github.com/aerialls/synology-srm/pull/3
-                self._session_id = None
-                self._syno_token = None
-                self._device_token = None
-                return self._request(request_method, api, method, params, False)
+                self._expire_session(api, session_id)
+                return True
             raise SynologyDSMAPIErrorException(
                 api, response["error"]["code"], response["error"].get("errors")
             )
 
-        return response
+        return False
+
+    def _run_flow(self, flow):
+        """Executes the requests yielded by an API model request flow."""
+        try:
+            request = next(flow)
+            while True:
+                request = flow.send(self._send(request))
+        except StopIteration as stop:
+            return stop.value
+
+    def _send(self, request: SynoRequest):
+        """Executes a request yielded by a request flow, or a list of them."""
+        if isinstance(request, list):
+            return self._send_many(request)
+        return self._request(
+            request.request_method,
+            request.api,
+            request.method,
+            request.params,
+            **(request.kwargs or {}),
+        )
+
+    def _run_flows(self, flows: list):
+        """Executes several request flows together.
+
+        Each round gathers the next request of every flow, so they can be sent
+        in a single compound request. A failing flow does not stop the others,
+        its error is raised once they are all done.
+        """
+        errors = []
+        pending = {}
+        for flow in flows:
+            try:
+                pending[flow] = next(flow)
+            except StopIteration:
+                pass
+
+        while pending:
+            requests = []
+            for request in pending.values():
+                requests.extend(request if isinstance(request, list) else [request])
+            responses = iter(self._send_all(requests))
+            for flow, request in list(pending.items()):
+                if isinstance(request, list):
+                    response = [next(responses) for _ in request]
+                    error = next(
+                        (item for item in response if isinstance(item, Exception)),
+                        None,
+                    )
+                else:
+                    response = next(responses)
+                    error = response if isinstance(response, Exception) else None
+                try:
+                    if error:
+                        pending[flow] = flow.throw(error)
+                    else:
+                        pending[flow] = flow.send(response)
+                except StopIteration:
+                    del pending[flow]
+                except Exception as err:
+                    del pending[flow]
+                    errors.append(err)
+
+        if errors:
+            raise errors[0]
+
+    def _send_many(self, requests: list) -> list:
+        """Executes requests, raises the first error once they are all done."""
+        responses = self._send_all(requests)
+        for response in responses:
+            if isinstance(response, Exception):
+                raise response
+        return responses
+
+    def _send_all(self, requests: list) -> list:
+        """Executes requests, batched through SYNO.Entry.Request when possible.
+
+        Requests are sent concurrently on a pool of ``max_workers`` threads.
+        The error of a failed request is returned in place of its response.
+        """
+        self.discover_apis()
+        with self._login_lock:
+            if not self._session_id:
+                self.login()
+
+        batchable = [
+            index
+            for index, request in enumerate(requests)
+            if self._is_batchable(request)
+        ]
+        jobs = []
+        if len(batchable) > 1:
+            compound = [requests[index] for index in batchable]
+            jobs.append((batchable, partial(self._send_compound, compound)))
+        else:
+            batchable = []
+        for index, request in enumerate(requests):
+            if index not in batchable:
+                jobs.append(([index], partial(self._send_as_list, request)))
+
+        responses = [None] * len(requests)
+        for (indexes, _), results in zip(jobs, self._map([job for _, job in jobs])):
+            if isinstance(results, Exception):
+                results = [results] * len(indexes)
+            for index, response in zip(indexes, results):
+                responses[index] = response
+        return responses
+
+    def _send_as_list(self, request: SynoRequest) -> list:
+        """Executes a request, returns its response in a list."""
+        return [self._send(request)]
+
+    def _map(self, jobs: list) -> list:
+        """Runs jobs on a pool of ``max_workers`` threads, 4 if not set.
+
+        The error of a failed job is returned in place of its result.
+        """
+        if len(jobs) < 2:
+            return [self._call(job) for job in jobs]
+
+        futures = [self._get_executor().submit(self._call, job) for job in jobs]
+        return [future.result() for future in futures]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Returns the worker pool, creates it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers or DEFAULT_MAX_WORKERS,
+                    thread_name_prefix="synology_dsm",
+                )
+            return self._executor
+
+    def _shutdown_executor(self):
+        """Stops the threads of the worker pool, a new one is created if needed."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    @staticmethod
+    def _call(job):
+        """Runs a job, returns its error instead of raising it."""
+        try:
+            return job()
+        except Exception as err:
+            return err
+
+    def _is_batchable(self, request: SynoRequest) -> bool:
+        """Returns True if the request can be part of a compound request."""
+        entry_api = self.apis.get(API_ENTRY_REQUEST)
+        return (
+            self._batch_requests
+            and entry_api is not None
+            and not self._is_weird_api_url(request.api)
+            and request.api in self.apis
+            and self.apis[request.api]["path"] == entry_api["path"]
+            and not (request.kwargs or {}).get("files")
+        )
+
+    def _send_compound(self, requests: list) -> list:
+        """Executes requests in a single SYNO.Entry.Request compound request.
+
+        The error of a failed sub-request is returned in place of its response.
+        """
+        compound = []
+        for request in requests:
+            kwargs = dict(request.kwargs or {})
+            _, params = self._prepare_request(
+                request.api, request.method, dict(request.params or {}), kwargs
+            )
+            params.update(kwargs.get("data", {}))
+            params.pop("_sid", None)
+            params.pop("SynoToken", None)
+            compound.append(
+                {key: self._compound_value(value) for key, value in params.items()}
+            )
+
+        result = self._request(
+            "POST",
+            API_ENTRY_REQUEST,
+            "request",
+            {"stop_when_error": "false", "mode": '"sequential"'},
+            data={"compound": json.dumps(compound)},
+            max_version=1,
+        )["data"]["result"]
+
+        for params, response in zip(compound, result):
+            self._metrics.record_request(params, response=response)
+        responses = []
+        for request, response in zip(requests, result):
+            try:
+                self._handle_response(request.api, response, False)
+            except SynologyDSMAPIErrorException as err:
+                response = err
+            responses.append(response)
+        return responses
+
+    @staticmethod
+    def _compound_value(value):
+        """Converts a request param value to its JSON compound value."""
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return value
+        return value
 
     def _execute_request(self, method: str, url: str, params: dict, **kwargs):
-        """Function to execute and handle a request."""
+        """Function to execute and handle a request.
+
+        A ``timeout`` kwarg overrides the client timeout for this request.
+        """
+        timeout = kwargs.pop("timeout", None) or self._timeout
+        start = time.perf_counter()
+        status = None
+        size = 0
+        decode_time = 0.0
+        result = None
+        body = None
+
         # Execute Request
         try:
             if method == "GET":
@@ -283,7 +860,7 @@ class SynologyDSM:
                     f"{key}={quote(str(value))}" for key, value in params.items()
                 )
                 response = self._session.get(
-                    url, params=encoded_params, timeout=self._timeout, **kwargs
+                    url, params=encoded_params, timeout=timeout, **kwargs
                 )
             elif method == "POST":
                 data = {}
@@ -291,15 +868,28 @@ class SynologyDSM:
                 data.update(kwargs.pop("data", {}))
                 data["mimeType"] = "application/json"
                 kwargs["data"] = data
-                self._debuglog("POST data: " + str(data))
+                self._debuglog("POST data: %s", self._log_payload(data))
+                if kwargs.get("files"):
+                    # Stream the files instead of loading them in memory
+                    body = SynoMultipartEncoder(data, kwargs.pop("files"))
+                    kwargs["data"] = body
+                    kwargs["headers"] = {
+                        **kwargs.get("headers", {}),
+                        "Content-Type": body.content_type,
+                    }
 
                 response = self._session.post(
-                    url, params=params, timeout=self._timeout, **kwargs
+                    url, params=params, timeout=timeout, **kwargs
                 )
 
-            self._debuglog("Request url: " + response.url)
-            self._debuglog("Request status_code: " + str(response.status_code))
-            self._debuglog("Request headers: " + str(response.headers))
+            self._debuglog(
+                "Request url: %s, status_code: %s, headers: %s",
+                self._log_payload(response.url),
+                response.status_code,
+                self._log_payload(response.headers),
+            )
+            status = response.status_code
+            size = len(response.content)
 
             if response.status_code == 200:
                 # We got a DSM response
@@ -310,7 +900,10 @@ class SynologyDSM:
                     "text/json",
                     "text/plain",  # Can happen with some API
                 ]:
-                    return response.json()
+                    decode_start = time.perf_counter()
+                    result = self._json_decoder(response.content)
+                    decode_time = time.perf_counter() - decode_start
+                    return result
 
                 return response.content
 
@@ -320,37 +913,82 @@ class SynologyDSM:
         except (RequestException, JSONDecodeError) as exp:
             raise SynologyDSMRequestException(exp) from exp
 
-    def update(self, with_information: bool = False, with_network: bool = False):
-        """Updates the various instanced modules."""
-        if self._download:
-            self._download.update()
-
-        if self._information and with_information:
-            self._information.update()
-
-        if self._network and with_network:
-            self._network.update()
-
-        if self._security:
-            self._security.update()
-
-        if self._utilisation:
-            self._utilisation.update()
-
-        if self._storage:
-            self._storage.update()
-
-        if self._share:
-            self._share.update()
+        finally:
+            if body:
+                # The request may be sent again after a relogin
+                body.rewind()
+            self._metrics.record_request(
+                params,
+                time.perf_counter() - start,
+                status,
+                size,
+                decode_time,
+                result,
+            )
 
-        if self._surveillance:
-            self._surveillance.update()
+    def update(
+        self,
+        with_information: bool = False,
+        with_network: bool = False,
+        force: bool = False,
+    ):
+        """Updates the various instanced modules.
 
-        if self._system:
-            self._system.update()
+        Modules updated less than their update interval ago are skipped,
+        unless ``force`` is set.
+        """
+        modules = self._stale_modules(with_information, with_network, force)
+        if self._batch_requests or self._max_workers:
+            self._run_flows([module.update.__wrapped__(module) for module in modules])
+            self._mark_updated(modules)
+            return
 
-        if self._upgrade:
-            self._upgrade.update()
+        for module in modules:
+            module.update()
+            self._mark_updated([module])
+
+    def _instanced_modules(
+        self, with_information: bool = False, with_network: bool = False
+    ) -> list:
+        """Returns the instanced modules to update."""
+        modules = [
+            self._download,
+            self._information if with_information else None,
+            self._network if with_network else None,
+            self._security,
+            self._utilisation,
+            self._storage,
+            self._share,
+            self._surveillance,
+            self._system,
+            self._upgrade,
+        ]
+        return [module for module in modules if module]
+
+    def _stale_modules(
+        self,
+        with_information: bool = False,
+        with_network: bool = False,
+        force: bool = False,
+    ) -> list:
+        """Returns the instanced modules whose data is older than their interval."""
+        modules = self._instanced_modules(with_information, with_network)
+        if force:
+            return modules
+        now = time.monotonic()
+        return [
+            module
+            for module in modules
+            if module not in self._updated_at
+            or now - self._updated_at[module]
+            >= self._update_intervals.get(module.API_KEY, 0)
+        ]
+
+    def _mark_updated(self, modules: list):
+        """Records the update time of modules."""
+        now = time.monotonic()
+        for module in modules:
+            self._updated_at[module] = now
 
     def reset(self, api: any) -> bool:
         """Reset an API to avoid fetching in on update."""
@@ -378,6 +1016,9 @@ class SynologyDSM:
             if api == SynoDownloadStation.API_KEY:
                 self._download = None
                 return True
+            if api == SynoResourceMonitor.API_KEY:
+                self._resource_monitor = None
+                return True
             if api == SynoStorage.API_KEY:
                 self._storage = None
                 return True
@@ -402,6 +1043,9 @@ class SynologyDSM:
         if isinstance(api, SynoDownloadStation):
             self._download = None
             return True
+        if isinstance(api, SynoResourceMonitor):
+            self._resource_monitor = None
+            return True
         if isinstance(api, SynoStorage):
             self._storage = None
             return True
@@ -431,6 +1075,13 @@ class SynologyDSM:
             self._network = SynoDSMNetwork(self)
         return self._network
 
+    @property
+    def resource_monitor(self) -> SynoResourceMonitor:
+        """Gets NAS Resource Monitor history."""
+        if not self._resource_monitor:
+            self._resource_monitor = SynoResourceMonitor(self)
+        return self._resource_monitor
+
     @property
     def security(self) -> SynoCoreSecurity:
         """Gets NAS security informations."""
@@ -0,0 +1,392 @@
+"""Class to interact with Synology DSM using asyncio."""
+import asyncio
+import time
+from json import JSONDecodeError
+from urllib.parse import quote
+
+from .api import SynoRequest
+from .api.dsm.information import SynoDSMInformation
+from .const import API_AUTH
+from .const import API_INFO
+from .exceptions import SynologyDSMRequestException
+from .multipart import file_fields
+from .synology_dsm import SynologyDSM
+
+try:
+    import aiohttp
+    from yarl import URL
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncSynologyDSM(SynologyDSM):
+    """Class containing the main Synology DSM functions, using asyncio.
+
+    It shares the API models of ``SynologyDSM``: their ``update()`` and
+    request methods return awaitables, so one event loop can drive many NAS.
+    Requests are sent concurrently on the event loop, so ``batch_requests``
+    and ``max_workers`` are not supported, ``pool_maxsize`` limits them.
+    """
+
+    def __init__(
+        self,
+        dsm_ip: str,
+        dsm_port: int,
+        username: str,
+        password: str,
+        use_https: bool = False,
+        verify_ssl: bool = False,
+        timeout: int = None,
+        device_token: str = None,
+        debugmode: bool = False,
+        session: "aiohttp.ClientSession" = None,
+        **kwargs,
+    ):
+        """Constructor method."""
+        if aiohttp is None:
+            raise ImportError(
+                "aiohttp is required by AsyncSynologyDSM, "
+                "install python-synology[async]"
+            )
+        for name in ("batch_requests", "max_workers"):
+            if kwargs.get(name):
+                raise TypeError(f"AsyncSynologyDSM does not support {name}")
+        super().__init__(
+            dsm_ip,
+            dsm_port,
+            username,
+            password,
+            use_https,
+            verify_ssl,
+            timeout,
+            device_token,
+            debugmode,
+            **kwargs,
+        )
+        self._session = session
+        self._own_session = session is None
+        self._lock = None
+
+    async def __aenter__(self):
+        """Enters the async context."""
+        return self
+
+    async def __aexit__(self, *exc_info):
+        """Closes the session when leaving the async context."""
+        await self.close()
+
+    def _new_session(self):
+        """The aiohttp session is created on first request, inside the loop."""
+        return None
+
+    def _reset_session(self):
+        """Clears the session cookies without closing its connections.
+
+        Only the cookies of the NAS are cleared from a session passed by the
+        caller, it may be shared with other hosts.
+        """
+        if self._session is None:
+            return
+        if self._own_session:
+            self._session.cookie_jar.clear()
+        else:
+            self._session.cookie_jar.clear_domain(URL(self._base_url).host)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Returns the aiohttp session, creates it if needed."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_maxsize, force_close=not self._keep_alive
+                )
+            )
+            self._own_session = True
+        return self._session
+
+    def _get_lock(self) -> asyncio.Lock:
+        """Returns the lock guarding API discovery and login."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def close(self):
+        """Closes the aiohttp session if it was created by this instance."""
+        if self._session is not None and self._own_session:
+            await self._session.close()
+            self._session = None
+
+    async def discover_apis(self):
+        """Retreives available API infos from the NAS."""
+        if self._apis.get(API_AUTH):
+            return
+        async with self._get_lock():
+            if not self._apis.get(API_AUTH) and not self._load_cached_apis():
+                self._apis = (await self.get(API_INFO, "query"))["data"]
+                self._store_apis()
+
+    async def login(self, otp_code: str = None) -> bool:
+        """Create a logged session.
+
+        Reuses the session of the session store if there is one, a new login
+        is made only when DSM rejects it.
+        """
+        if not otp_code and self._restore_session():
+            return True
+
+        # First reset the session credentials, keeping the pooled connections
+        self._debuglog("Resetting session")
+        self._reset_session()
+
+        # Request login
+        result = await self.get(API_AUTH, "login", self._login_params(otp_code))
+        self._handle_login(result)
+
+        if not self._information:
+            self._information = SynoDSMInformation(self)
+            await self._information.update()
+
+        if self._check_cached_apis():
+            # The login may run under the lock, which is not reentrant
+            self._apis = (await self.get(API_INFO, "query"))["data"]
+            self._store_apis()
+
+        self._save_session()
+        return result["success"]
+
+    async def logout(self) -> bool:
+        """Log out of the session."""
+        result = await self.get(API_AUTH, "logout")
+        self._forget_session()
+        self._reset_session()
+        return result["success"]
+
+    async def _request(
+        self,
+        request_method: str,
+        api: str,
+        method: str,
+        params: dict = None,
+        retry_once: bool = True,
+        **kwargs,
+    ):
+        """Handles API request.
+
+        Identical read requests made concurrently share a single response.
+        """
+        if not self._is_read_request(request_method, api, method):
+            return await self._do_request(
+                request_method, api, method, params, retry_once, **kwargs
+            )
+
+        key = self._request_key(api, method, params, kwargs)
+        future = self._in_flight.get(key)
+        if future is not None:
+            self._debuglog("Waiting for in-flight request: %s", api)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # This request was cancelled
+                    raise
+            # The shared request was cancelled, send it again
+            return await self._request(
+                request_method, api, method, params, retry_once, **kwargs
+            )
+
+        future = self._in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await self._do_request(
+                request_method, api, method, params, retry_once, **kwargs
+            )
+        except Exception as exp:
+            future.set_exception(exp)
+            # Marks the exception as retrieved when no other request waits
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+
+    async def _do_request(
+        self,
+        request_method: str,
+        api: str,
+        method: str,
+        params: dict = None,
+        retry_once: bool = True,
+        **kwargs,
+    ):
+        """Executes an API request, logs in again once if the session expired."""
+        # Discover existing APIs
+        if api != API_INFO:
+            await self.discover_apis()
+            if self._is_unknown_api(api) and self._invalidate_cached_apis():
+                await self.discover_apis()
+
+        # Check if logged, only one coroutine logs in
+        if not self._session_id and api not in [API_AUTH, API_INFO]:
+            async with self._get_lock():
+                if not self._session_id:
+                    await self.login()
+
+        # The kwargs are kept whole for the retry, like the files to send again
+        request_kwargs = dict(kwargs)
+        url, params = self._prepare_request(api, method, params, request_kwargs)
+
+        # Request data
+        response = await self._execute_request(
+            request_method, url, params, **request_kwargs
+        )
+        self._debuglog("Request Method: %s", request_method)
+
+        if self._handle_response(api, response, retry_once, params.get("_sid")):
+            return await self._do_request(
+                request_method, api, method, params, False, **kwargs
+            )
+        return response
+
+    async def _execute_request(self, method: str, url: str, params: dict, **kwargs):
+        """Function to execute and handle a request.
+
+        A ``timeout`` kwarg overrides the client timeout for this request.
+        """
+        session = self._get_session()
+        timeout = aiohttp.ClientTimeout(
+            total=kwargs.pop("timeout", None) or self._timeout
+        )
+        ssl = None if self._verify else False
+        start = time.perf_counter()
+        status = None
+        size = 0
+        decode_time = 0.0
+        result = None
+        positions = []
+
+        # Execute Request
+        try:
+            if method == "GET":
+                encoded_params = "&".join(
+                    f"{key}={quote(str(value))}" for key, value in params.items()
+                )
+                response = await session.get(
+                    URL(url + encoded_params, encoded=True),
+                    timeout=timeout,
+                    ssl=ssl,
+                    **kwargs,
+                )
+            elif method == "POST":
+                data = aiohttp.FormData()
+                for key, value in {**params, **kwargs.pop("data", {})}.items():
+                    if value is not None:
+                        data.add_field(key, str(value))
+                data.add_field("mimeType", "application/json")
+                for name, filename, fileobj, content_type in file_fields(
+                    kwargs.pop("files", {})
+                ):
+                    # Streamed, from their position again after a relogin
+                    positions.append((fileobj, fileobj.tell()))
+                    data.add_field(
+                        name, fileobj, filename=filename, content_type=content_type
+                    )
+                self._debuglog("POST data: %s", self._log_payload(params))
+
+                response = await session.post(
+                    url,
+                    params={
+                        key: str(value)
+                        for key, value in params.items()
+                        if value is not None
+                    },
+                    data=data,
+                    timeout=timeout,
+                    ssl=ssl,
+                    **kwargs,
+                )
+
+            async with response:
+                self._debuglog(
+                    "Request url: %s, status_code: %s, headers: %s",
+                    self._log_payload(str(response.url)),
+                    response.status,
+                    self._log_payload(response.headers),
+                )
+                status = response.status
+
+                if response.status == 200:
+                    # We got a DSM response
+                    content = await response.read()
+                    size = len(content)
+                    if response.content_type in [
+                        "application/json",
+                        "text/json",
+                        "text/plain",  # Can happen with some API
+                    ]:
+                        decode_start = time.perf_counter()
+                        result = self._json_decoder(content)
+                        decode_time = time.perf_counter() - decode_start
+                        return result
+
+                    return content
+
+                # We got a 400, 401 or 404 ...
+                raise aiohttp.ClientError(response)
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, JSONDecodeError) as exp:
+            raise SynologyDSMRequestException(exp) from exp
+
+        finally:
+            for fileobj, position in positions:
+                fileobj.seek(position)
+            self._metrics.record_request(
+                params,
+                time.perf_counter() - start,
+                status,
+                size,
+                decode_time,
+                result,
+            )
+
+    async def _run_flow(self, flow):
+        """Executes the requests yielded by an API model request flow."""
+        try:
+            request = next(flow)
+            while True:
+                request = flow.send(await self._send(request))
+        except StopIteration as stop:
+            return stop.value
+
+    async def _send(self, request: SynoRequest):
+        """Executes a request yielded by a request flow, or a list of them.
+
+        Requests of a list are sent concurrently, up to ``pool_maxsize`` at once.
+        """
+        if isinstance(request, list):
+            return list(await asyncio.gather(*(self._send(item) for item in request)))
+        return await self._request(
+            request.request_method,
+            request.api,
+            request.method,
+            request.params,
+            **(request.kwargs or {}),
+        )
+
+    async def update(
+        self,
+        with_information: bool = False,
+        with_network: bool = False,
+        force: bool = False,
+    ):
+        """Updates the various instanced modules concurrently.
+
+        Modules updated less than their update interval ago are skipped,
+        unless ``force`` is set.
+        """
+        modules = self._stale_modules(with_information, with_network, force)
+        await asyncio.gather(*(module.update() for module in modules))
+        self._mark_updated(modules)
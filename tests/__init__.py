@@ -1,4 +1,5 @@
 """Library tests."""
+import json
 from json import JSONDecodeError
 from urllib.parse import urlencode
 
@@ -29,9 +30,12 @@ from .api_data.dsm_6 import DSM_6_CORE_UTILIZATION_ERROR_1055
 from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_INFO_CONFIG
 from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_INFO_INFO
 from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_STAT_INFO
+from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_TASK_GET_INFO_TRANSFER
 from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_TASK_LIST
 from .api_data.dsm_6 import DSM_6_DSM_INFORMATION
 from .api_data.dsm_6 import DSM_6_DSM_NETWORK_2LAN_1PPPOE
+from .api_data.dsm_6 import DSM_6_RESOURCE_MONITOR_LOG_LIST
+from .api_data.dsm_6 import DSM_6_RESOURCE_MONITOR_SETTING
 from .api_data.dsm_6 import (
     DSM_6_STORAGE_STORAGE_DS1515_PLUS_SHR2_10DISKS_1VOL_WITH_EXPANSION,
 )
@@ -48,7 +52,10 @@ from .const import DEVICE_TOKEN
 from .const import ERROR_AUTH_INVALID_CREDENTIALS
 from .const import ERROR_AUTH_MAX_TRIES
 from .const import ERROR_AUTH_OTP_AUTHENTICATE_FAILED
+from .const import ERROR_CONNECTION_TIME_OUT
 from .const import ERROR_INSUFFICIENT_USER_PRIVILEGE
+from .const import EXPIRED_SESSION_ID
+from synology_dsm import AsyncSynologyDSM
 from synology_dsm import SynologyDSM
 from synology_dsm.api.core.security import SynoCoreSecurity
 from synology_dsm.api.core.share import SynoCoreShare
@@ -58,9 +65,11 @@ from synology_dsm.api.core.utilization import SynoCoreUtilization
 from synology_dsm.api.download_station import SynoDownloadStation
 from synology_dsm.api.dsm.information import SynoDSMInformation
 from synology_dsm.api.dsm.network import SynoDSMNetwork
+from synology_dsm.api.resource_monitor import SynoResourceMonitor
 from synology_dsm.api.storage.storage import SynoStorage
 from synology_dsm.api.surveillance_station import SynoSurveillanceStation
 from synology_dsm.const import API_AUTH
+from synology_dsm.const import API_ENTRY_REQUEST
 from synology_dsm.const import API_INFO
 from synology_dsm.exceptions import SynologyDSMRequestException
 
@@ -111,6 +120,21 @@ VALID_OTP = "123456"
 USER_MAX_TRY = "user_max"
 
 
+class FakeResponse:
+    """A requests response holding JSON data."""
+
+    def __init__(self, url, status_code, data):
+        """Constructor method."""
+        self.url = url
+        self.status_code = status_code
+        self.headers = {"Content-Type": "application/json; charset=utf-8"}
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        """Decodes the content."""
+        return json.loads(self.content)
+
+
 class SynologyDSMMock(SynologyDSM):
     """Mocked SynologyDSM."""
 
@@ -127,6 +151,7 @@ class SynologyDSMMock(SynologyDSM):
         timeout=None,
         device_token=None,
         debugmode=False,
+        **kwargs,
     ):
         """Constructor method."""
         SynologyDSM.__init__(
@@ -140,6 +165,7 @@ class SynologyDSMMock(SynologyDSM):
             timeout,
             device_token,
             debugmode,
+            **kwargs,
         )
 
         self.verify_ssl = verify_ssl
@@ -216,9 +242,35 @@ class SynologyDSMMock(SynologyDSM):
             return ERROR_AUTH_INVALID_CREDENTIALS
 
         if self.API_URI in url:
+            if f"_sid={EXPIRED_SESSION_ID}" in url:
+                return ERROR_CONNECTION_TIME_OUT
+
             if not self._session_id:
                 return ERROR_INSUFFICIENT_USER_PRIVILEGE
 
+            if API_ENTRY_REQUEST in url:
+                base_url = url[: url.index("?") + 1]
+                results = []
+                for request in json.loads(kwargs["data"]["compound"]):
+                    response = SynologyDSMMock._execute_request(
+                        self, method, base_url, request
+                    )
+                    results.append(
+                        {
+                            "api": request["api"],
+                            "method": request["method"],
+                            "version": request["version"],
+                            **response,
+                        }
+                    )
+                return {
+                    "data": {
+                        "has_fail": not all(res["success"] for res in results),
+                        "result": results,
+                    },
+                    "success": True,
+                }
+
             if SynoCoreSecurity.API_KEY in url:
                 if self.error:
                     return DSM_6_CORE_SECURITY_UPDATE_OUTOFDATE
@@ -252,8 +304,65 @@ class SynologyDSMMock(SynologyDSM):
                 if "GetInfo" in url:
                     return DSM_6_DOWNLOAD_STATION_STAT_INFO
             if SynoDownloadStation.TASK_API_KEY in url:
+                if "Create" in url:
+                    return {"success": True}
+                if "GetInfo" in url:
+                    task_ids = params["id"].split(",")
+                    tasks = DSM_6_DOWNLOAD_STATION_TASK_GET_INFO_TRANSFER["data"]
+                    return {
+                        "data": {
+                            "tasks": [
+                                task
+                                for task in tasks["tasks"]
+                                if task["id"] in task_ids
+                            ]
+                        },
+                        "success": True,
+                    }
                 if "List" in url:
-                    return DSM_6_DOWNLOAD_STATION_TASK_LIST
+                    tasks = DSM_6_DOWNLOAD_STATION_TASK_LIST["data"]["tasks"]
+                    offset = int(params.get("offset", 0))
+                    limit = int(params.get("limit", -1))
+                    if limit >= 0:
+                        tasks = tasks[offset : offset + limit]
+                    else:
+                        tasks = tasks[offset:]
+                    additionals = params["additional"].split(",")
+                    return {
+                        "data": {
+                            "offset": offset,
+                            "tasks": [
+                                {
+                                    **task,
+                                    "additional": {
+                                        key: value
+                                        for key, value in task["additional"].items()
+                                        if key in additionals
+                                    },
+                                }
+                                for task in tasks
+                            ],
+                            "total": len(
+                                DSM_6_DOWNLOAD_STATION_TASK_LIST["data"]["tasks"]
+                            ),
+                        },
+                        "success": True,
+                    }
+
+            if SynoResourceMonitor.LOG_API_KEY in url:
+                logs = DSM_6_RESOURCE_MONITOR_LOG_LIST["data"]["logs"]
+                offset = int(params["offset"])
+                limit = int(params["limit"])
+                return {
+                    "data": {
+                        "logs": logs[offset : offset + limit],
+                        "offset": offset,
+                        "total": len(logs),
+                    },
+                    "success": True,
+                }
+            if SynoResourceMonitor.SETTING_API_KEY in url:
+                return DSM_6_RESOURCE_MONITOR_SETTING
 
             if SynoStorage.API_KEY in url:
                 return API_SWITCHER[self.dsm_version]["STORAGE_STORAGE"][
@@ -270,6 +379,11 @@ class SynologyDSMMock(SynologyDSM):
                     return DSM_6_SURVEILLANCE_STATION_CAMERA_EVENT_MD_PARAM_SAVE
                 if "MotionEnum" in url:
                     return DSM_6_SURVEILLANCE_STATION_CAMERA_EVENT_MOTION_ENUM
+                if "GetSnapshot" in url:
+                    if int(params["id"]) > 10:
+                        # Unknown camera
+                        return {"error": {"code": 400}, "success": False}
+                    return f"image {params['id']}".encode()
 
             if SynoSurveillanceStation.HOME_MODE_API_KEY in url:
                 if "GetInfo" in url:
@@ -294,3 +408,47 @@ class SynologyDSMMock(SynologyDSM):
             return {"success": False}
 
         return None
+
+
+class AsyncSynologyDSMMock(AsyncSynologyDSM):
+    """Mocked AsyncSynologyDSM."""
+
+    API_URI = SynologyDSMMock.API_URI
+
+    def __init__(
+        self,
+        dsm_ip,
+        dsm_port,
+        username,
+        password,
+        use_https=False,
+        verify_ssl=False,
+        timeout=None,
+        device_token=None,
+        debugmode=False,
+        **kwargs,
+    ):
+        """Constructor method."""
+        AsyncSynologyDSM.__init__(
+            self,
+            dsm_ip,
+            dsm_port,
+            username,
+            password,
+            use_https,
+            verify_ssl,
+            timeout,
+            device_token,
+            debugmode,
+            **kwargs,
+        )
+
+        self.verify_ssl = verify_ssl
+        self.dsm_version = 6  # 5 or 6
+        self.disks_redundancy = "RAID"  # RAID or SHR[number][_EXPANSION]
+        self.error = False
+        self.with_surveillance = False
+
+    async def _execute_request(self, method, url, params, **kwargs):
+        # Same responses as the synchronous mock, without the aiohttp layer
+        return SynologyDSMMock._execute_request(self, method, url, params, **kwargs)
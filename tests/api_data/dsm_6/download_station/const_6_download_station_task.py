@@ -296,3 +296,62 @@ DSM_6_DOWNLOAD_STATION_TASK_LIST = {
     },
     "success": True,
 }
+
+DSM_6_DOWNLOAD_STATION_TASK_GET_INFO_TRANSFER = {
+    "data": {
+        "tasks": [
+            {
+                "additional": {
+                    "transfer": {
+                        "downloaded_pieces": 619,
+                        "size_downloaded": 2596586484,
+                        "size_uploaded": 1048576,
+                        "speed_download": 40000000,
+                        "speed_upload": 1000,
+                    }
+                },
+                "id": "dbid_86",
+                "size": 5196586484,
+                "status": "downloading",
+                "title": "My super movie Complete 2021-2031",
+                "type": "bt",
+                "username": "Test_useR",
+            },
+            {
+                "additional": {
+                    "transfer": {
+                        "downloaded_pieces": 235,
+                        "size_downloaded": 986298376,
+                        "size_uploaded": 0,
+                        "speed_download": 49950232,
+                        "speed_upload": 0,
+                    }
+                },
+                "id": "dbid_164",
+                "size": 1986298376,
+                "status": "downloading",
+                "title": "Blade Swipper 1984.mkv",
+                "type": "bt",
+                "username": "Test_useR",
+            },
+            {
+                "additional": {
+                    "transfer": {
+                        "downloaded_pieces": 0,
+                        "size_downloaded": 0,
+                        "size_uploaded": 0,
+                        "speed_download": 0,
+                        "speed_upload": 0,
+                    }
+                },
+                "id": "dbid_486",
+                "size": 0,
+                "status": "finishing",
+                "title": "The falling State",
+                "type": "bt",
+                "username": "Test_useR",
+            },
+        ]
+    },
+    "success": True,
+}
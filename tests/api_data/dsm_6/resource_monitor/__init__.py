@@ -0,0 +1 @@
+"""DSM 6 SYNO.ResourceMonitor.* datas."""
@@ -0,0 +1,300 @@
+"""DSM 6 SYNO.ResourceMonitor.* data."""
+
+DSM_6_RESOURCE_MONITOR_LOG_LIST = {
+    "data": {
+        "logs": [
+            {
+                "cpu": {
+                    "device": "System",
+                    "other_load": 1,
+                    "system_load": 2,
+                    "user_load": 3,
+                },
+                "disk": {
+                    "disk": [
+                        {
+                            "device": "sda",
+                            "display_name": "Drive 1",
+                            "read_access": 3,
+                            "read_byte": 60000,
+                            "type": "internal",
+                            "utilization": 8,
+                            "write_access": 14,
+                            "write_byte": 400000,
+                        }
+                    ],
+                    "total": {
+                        "device": "total",
+                        "read_access": 3,
+                        "read_byte": 60000,
+                        "utilization": 8,
+                        "write_access": 14,
+                        "write_byte": 400000,
+                    },
+                },
+                "memory": {"device": "Memory", "real_usage": 20},
+                "network": [
+                    {"device": "total", "rx": 0, "tx": 0},
+                    {"device": "eth0", "rx": 0, "tx": 0},
+                ],
+                "space": {
+                    "total": {
+                        "device": "total",
+                        "read_access": 1,
+                        "read_byte": 27603,
+                        "utilization": 1,
+                        "write_access": 23,
+                        "write_byte": 132496,
+                    },
+                    "volume": [
+                        {
+                            "device": "md2",
+                            "display_name": "volume1",
+                            "read_access": 1,
+                            "read_byte": 27603,
+                            "utilization": 1,
+                            "write_access": 23,
+                            "write_byte": 132496,
+                        }
+                    ],
+                },
+                "time": 1585503221,
+            },
+            {
+                "cpu": {
+                    "device": "System",
+                    "other_load": 1,
+                    "system_load": 3,
+                    "user_load": 3,
+                },
+                "disk": {
+                    "disk": [
+                        {
+                            "device": "sda",
+                            "display_name": "Drive 1",
+                            "read_access": 3,
+                            "read_byte": 61000,
+                            "type": "internal",
+                            "utilization": 8,
+                            "write_access": 14,
+                            "write_byte": 400000,
+                        }
+                    ],
+                    "total": {
+                        "device": "total",
+                        "read_access": 3,
+                        "read_byte": 61000,
+                        "utilization": 8,
+                        "write_access": 14,
+                        "write_byte": 400000,
+                    },
+                },
+                "memory": {"device": "Memory", "real_usage": 21},
+                "network": [
+                    {"device": "total", "rx": 1000, "tx": 500},
+                    {"device": "eth0", "rx": 1000, "tx": 500},
+                ],
+                "space": {
+                    "total": {
+                        "device": "total",
+                        "read_access": 1,
+                        "read_byte": 27603,
+                        "utilization": 1,
+                        "write_access": 23,
+                        "write_byte": 132496,
+                    },
+                    "volume": [
+                        {
+                            "device": "md2",
+                            "display_name": "volume1",
+                            "read_access": 1,
+                            "read_byte": 27603,
+                            "utilization": 1,
+                            "write_access": 23,
+                            "write_byte": 132496,
+                        }
+                    ],
+                },
+                "time": 1585503281,
+            },
+            {
+                "cpu": {
+                    "device": "System",
+                    "other_load": 1,
+                    "system_load": 4,
+                    "user_load": 3,
+                },
+                "disk": {
+                    "disk": [
+                        {
+                            "device": "sda",
+                            "display_name": "Drive 1",
+                            "read_access": 3,
+                            "read_byte": 62000,
+                            "type": "internal",
+                            "utilization": 8,
+                            "write_access": 14,
+                            "write_byte": 400000,
+                        }
+                    ],
+                    "total": {
+                        "device": "total",
+                        "read_access": 3,
+                        "read_byte": 62000,
+                        "utilization": 8,
+                        "write_access": 14,
+                        "write_byte": 400000,
+                    },
+                },
+                "memory": {"device": "Memory", "real_usage": 22},
+                "network": [
+                    {"device": "total", "rx": 2000, "tx": 1000},
+                    {"device": "eth0", "rx": 2000, "tx": 1000},
+                ],
+                "space": {
+                    "total": {
+                        "device": "total",
+                        "read_access": 1,
+                        "read_byte": 27603,
+                        "utilization": 1,
+                        "write_access": 23,
+                        "write_byte": 132496,
+                    },
+                    "volume": [
+                        {
+                            "device": "md2",
+                            "display_name": "volume1",
+                            "read_access": 1,
+                            "read_byte": 27603,
+                            "utilization": 1,
+                            "write_access": 23,
+                            "write_byte": 132496,
+                        }
+                    ],
+                },
+                "time": 1585503341,
+            },
+            {
+                "cpu": {
+                    "device": "System",
+                    "other_load": 1,
+                    "system_load": 5,
+                    "user_load": 3,
+                },
+                "disk": {
+                    "disk": [
+                        {
+                            "device": "sda",
+                            "display_name": "Drive 1",
+                            "read_access": 3,
+                            "read_byte": 63000,
+                            "type": "internal",
+                            "utilization": 8,
+                            "write_access": 14,
+                            "write_byte": 400000,
+                        }
+                    ],
+                    "total": {
+                        "device": "total",
+                        "read_access": 3,
+                        "read_byte": 63000,
+                        "utilization": 8,
+                        "write_access": 14,
+                        "write_byte": 400000,
+                    },
+                },
+                "memory": {"device": "Memory", "real_usage": 23},
+                "network": [
+                    {"device": "total", "rx": 3000, "tx": 1500},
+                    {"device": "eth0", "rx": 3000, "tx": 1500},
+                    {"device": "eth1", "rx": 10, "tx": 20},
+                ],
+                "space": {
+                    "total": {
+                        "device": "total",
+                        "read_access": 1,
+                        "read_byte": 27603,
+                        "utilization": 1,
+                        "write_access": 23,
+                        "write_byte": 132496,
+                    },
+                    "volume": [
+                        {
+                            "device": "md2",
+                            "display_name": "volume1",
+                            "read_access": 1,
+                            "read_byte": 27603,
+                            "utilization": 1,
+                            "write_access": 23,
+                            "write_byte": 132496,
+                        }
+                    ],
+                },
+                "time": 1585503401,
+            },
+            {
+                "cpu": {
+                    "device": "System",
+                    "other_load": 1,
+                    "system_load": 6,
+                    "user_load": 3,
+                },
+                "disk": {
+                    "disk": [
+                        {
+                            "device": "sda",
+                            "display_name": "Drive 1",
+                            "read_access": 3,
+                            "read_byte": 64000,
+                            "type": "internal",
+                            "utilization": 8,
+                            "write_access": 14,
+                            "write_byte": 400000,
+                        }
+                    ],
+                    "total": {
+                        "device": "total",
+                        "read_access": 3,
+                        "read_byte": 64000,
+                        "utilization": 8,
+                        "write_access": 14,
+                        "write_byte": 400000,
+                    },
+                },
+                "memory": {"device": "Memory", "real_usage": 24},
+                "network": [
+                    {"device": "total", "rx": 4000, "tx": 2000},
+                    {"device": "eth0", "rx": 4000, "tx": 2000},
+                    {"device": "eth1", "rx": 10, "tx": 20},
+                ],
+                "space": {
+                    "total": {
+                        "device": "total",
+                        "read_access": 1,
+                        "read_byte": 27603,
+                        "utilization": 1,
+                        "write_access": 23,
+                        "write_byte": 132496,
+                    },
+                    "volume": [
+                        {
+                            "device": "md2",
+                            "display_name": "volume1",
+                            "read_access": 1,
+                            "read_byte": 27603,
+                            "utilization": 1,
+                            "write_access": 23,
+                            "write_byte": 132496,
+                        }
+                    ],
+                },
+                "time": 1585503461,
+            },
+        ],
+        "offset": 0,
+        "total": 5,
+    },
+    "success": True,
+}
+
+DSM_6_RESOURCE_MONITOR_SETTING = {"data": {"enable_history": True}, "success": True}
@@ -6,6 +6,7 @@
 # if data failed, add "_FAILED"
 
 SESSION_ID = "session_id"
+EXPIRED_SESSION_ID = "expired_session_id"
 SYNO_TOKEN = "Syñ0_T0k€ñ"
 DEVICE_TOKEN = "Dév!cè_T0k€ñ"
 UNIQUE_KEY = "1x2X3x!_UK"
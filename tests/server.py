@@ -0,0 +1,278 @@
+"""Fake DSM web server serving the API fixtures.
+
+It answers like ``SynologyDSMMock``, but over real HTTP, so the whole client
+stack is exercised: sessions, encoding, pooling and JSON decoding.
+Run it with ``python -m tests.server --port 5000``, then connect with
+``SynologyDSM("127.0.0.1", 5000, "valid_user", "valid_password")``.
+"""
+import argparse
+import json
+import random
+import secrets
+import threading
+import time
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from urllib.parse import parse_qsl
+from urllib.parse import urlsplit
+
+from . import SynologyDSMMock
+from . import VALID_HOST
+from . import VALID_PORT
+from synology_dsm.const import API_AUTH
+from synology_dsm.const import API_INFO
+
+# Paths served, besides the ones under /webapi/
+DSM_5_STORAGE_PATH = "/webman/modules/StorageManager/storagehandler.cgi"
+
+
+class _FixturesResponder:
+    """Holds the attributes read by ``SynologyDSMMock._execute_request``."""
+
+    API_URI = SynologyDSMMock.API_URI
+
+    def __init__(self, dsm_version, disks_redundancy, with_surveillance, session_id):
+        """Constructor method."""
+        self.dsm_version = dsm_version
+        self.disks_redundancy = disks_redundancy
+        self.with_surveillance = with_surveillance
+        self.error = False
+        self.verify_ssl = True
+        self._session_id = session_id
+
+
+class FakeDSMServer(ThreadingHTTPServer):
+    """HTTP server simulating a NAS.
+
+    ``latency`` is added to every request in seconds. ``errors`` maps DSM error
+    codes (like 105 or 119) or HTTP statuses (500 and up) to the probability
+    a request fails with them; an injected 119 also expires the session.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple = ("127.0.0.1", 0),
+        dsm_version: int = 6,
+        disks_redundancy: str = "RAID",
+        with_surveillance: bool = False,
+        latency: float = 0.0,
+        errors: dict = None,
+        seed: int = None,
+    ):
+        """Constructor method."""
+        super().__init__(address, FakeDSMRequestHandler)
+        self.dsm_version = dsm_version
+        self.disks_redundancy = disks_redundancy
+        self.with_surveillance = with_surveillance
+        self.latency = latency
+        self.errors = errors or {}
+        self.requests_count = 0
+        self.uploads = []  # Files received by the accepted requests
+        self._random = random.Random(seed)
+        self._sessions = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def host(self) -> str:
+        """Gets the address the server listens on."""
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        """Gets the port the server listens on."""
+        return self.server_address[1]
+
+    def start(self):
+        """Serves requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops serving requests."""
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def __enter__(self):
+        """Starts the server."""
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        """Stops the server."""
+        self.stop()
+
+    def expire_sessions(self):
+        """Invalidates all the sessions, like a DSM restart."""
+        with self._lock:
+            self._sessions.clear()
+
+    def handle_api(self, method: str, path: str, params: dict, data: dict, files):
+        """Returns the HTTP status and JSON data answering an API request.
+
+        The data is bytes for the camera images.
+        """
+        with self._lock:
+            self.requests_count += 1
+            error = next(
+                (
+                    code
+                    for code, probability in self.errors.items()
+                    if self._random.random() < probability
+                ),
+                None,
+            )
+        if self.latency:
+            time.sleep(self.latency)
+
+        if not path.startswith("/webapi/") and path != DSM_5_STORAGE_PATH:
+            return 404, None
+        if error and error >= 500:
+            return error, None
+
+        api = params.get("api")
+        session_id = params.get("_sid")
+        if api == API_AUTH and params.get("method") == "logout":
+            with self._lock:
+                self._sessions.discard(session_id)
+            return 200, {"success": True}
+        if api not in [API_AUTH, API_INFO]:
+            with self._lock:
+                if error == 119:
+                    self._sessions.discard(session_id)
+                if session_id not in self._sessions:
+                    return 200, {"error": {"code": 119}, "success": False}
+            if error:
+                return 200, {"error": {"code": error}, "success": False}
+
+        if files:
+            with self._lock:
+                self.uploads.append(files)
+
+        if "version" in params and params["version"].isdigit():
+            params["version"] = int(params["version"])
+        responder = _FixturesResponder(
+            self.dsm_version,
+            self.disks_redundancy,
+            self.with_surveillance,
+            session_id,
+        )
+        response = SynologyDSMMock._execute_request(
+            responder,
+            method,
+            f"https://{VALID_HOST}:{VALID_PORT}{path}?",
+            params,
+            data=data,
+            files=files,
+        )
+        if response is None:
+            return 404, None
+
+        if api == API_AUTH and response.get("success"):
+            session_id = secrets.token_urlsafe(16)
+            with self._lock:
+                self._sessions.add(session_id)
+            response = {**response, "data": {**response["data"], "sid": session_id}}
+        return 200, response
+
+
+class FakeDSMRequestHandler(BaseHTTPRequestHandler):
+    """Handles the requests of ``FakeDSMServer``."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        """Answers a GET request."""
+        self._answer("GET", {}, {})
+
+    def do_POST(self):  # noqa: N802
+        """Answers a POST request, with a form or multipart body."""
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        content_type = self.headers.get("Content-Type", "")
+        data = {}
+        files = {}
+        if content_type.startswith("multipart/form-data"):
+            message = BytesParser().parsebytes(
+                b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body
+            )
+            for part in message.get_payload():
+                name = part.get_param("name", header="content-disposition")
+                filename = part.get_filename()
+                if filename:
+                    files[name] = (filename, part.get_payload(decode=True))
+                else:
+                    data[name] = part.get_payload(decode=True).decode()
+        else:
+            data = dict(parse_qsl(body.decode()))
+        self._answer("POST", data, files)
+
+    def _answer(self, method: str, data: dict, files: dict):
+        """Writes the response of the fake NAS."""
+        url = urlsplit(self.path)
+        params = {**dict(parse_qsl(url.query)), **data}
+        status, response = self.server.handle_api(method, url.path, params, data, files)
+        if isinstance(response, bytes):
+            body, content_type = response, "image/jpeg"
+        else:
+            body = json.dumps(response).encode() if response is not None else b""
+            content_type = "application/json; charset=utf-8"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        """Silences the requests log."""
+
+
+def main():
+    """Runs the fake DSM server until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--dsm-version", type=int, choices=[5, 6], default=6)
+    parser.add_argument("--disks-redundancy", default="RAID")
+    parser.add_argument("--surveillance", action="store_true")
+    parser.add_argument("--latency", type=float, default=0.0, help="in seconds")
+    parser.add_argument(
+        "--error",
+        action="append",
+        default=[],
+        metavar="CODE=PROBABILITY",
+        help="DSM error code or HTTP status to inject, like 119=0.01",
+    )
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    errors = {}
+    for error in args.error:
+        code, probability = error.split("=")
+        errors[int(code)] = float(probability)
+
+    server = FakeDSMServer(
+        (args.host, args.port),
+        dsm_version=args.dsm_version,
+        disks_redundancy=args.disks_redundancy,
+        with_surveillance=args.surveillance,
+        latency=args.latency,
+        errors=errors,
+        seed=args.seed,
+    )
+    print(f"Fake DSM {args.dsm_version} serving on http://{server.host}:{server.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
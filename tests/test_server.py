@@ -0,0 +1,136 @@
+"""Synology DSM tests against the fake DSM server."""
+import asyncio
+import io
+from unittest import TestCase
+
+import pytest
+
+from . import VALID_PASSWORD
+from . import VALID_USER
+from .server import FakeDSMServer
+from synology_dsm import AsyncSynologyDSM
+from synology_dsm import SynologyDSM
+from synology_dsm.exceptions import SynologyDSMAPIErrorException
+from synology_dsm.exceptions import SynologyDSMRequestException
+
+
+class TestFakeDSMServer(TestCase):
+    """Clients requesting the fake DSM server over HTTP."""
+
+    def new_api(self, server, **kwargs):
+        """Returns a client of the server."""
+        return SynologyDSM(
+            server.host, server.port, VALID_USER, VALID_PASSWORD, **kwargs
+        )
+
+    def test_update(self):
+        """Test login and update of all modules."""
+        with FakeDSMServer() as server:
+            api = self.new_api(server, batch_requests=True)
+            assert api.login()
+            assert api.information.model == "DS918+"
+            assert api.security
+            assert api.share
+            assert api.storage
+            assert api.system
+            assert api.upgrade
+            assert api.utilisation
+            assert api.download_station
+            api.update()
+            assert api.logout()
+
+        assert api.security.status == "safe"
+        assert api.share.shares_uuids
+        assert api.storage.volume_status("volume_1") == "normal"
+        assert api.system.model == "DS918+"
+        assert api.upgrade.update_available
+        assert api.utilisation.cpu_total_load == 9
+        assert len(api.download_station.get_all_tasks()) == 8
+        assert api.metrics.snapshot()["requests"][("SYNO.Entry.Request", "request", 1)][
+            "statuses"
+        ] == {200: 1}
+
+    def test_surveillance_station(self):
+        """Test SurveillanceStation requests."""
+        with FakeDSMServer(with_surveillance=True) as server:
+            api = self.new_api(server)
+            api.surveillance_station.update()
+            assert api.surveillance_station.set_home_mode(True)
+        assert api.surveillance_station.get_camera(1)
+        assert api.surveillance_station.get_camera_live_view_path(1, "rtsp")
+
+    def test_surveillance_station_camera_image(self):
+        """Test camera images answered as JPEG."""
+        with FakeDSMServer(with_surveillance=True) as server:
+            api = self.new_api(server)
+            assert api.surveillance_station.get_camera_image(1) == b"image 1"
+            images = api.surveillance_station.iter_camera_images([2, 3])
+            assert sorted((image.camera_id, image.image) for image in images) == [
+                (2, b"image 2"),
+                (3, b"image 3"),
+            ]
+
+    def test_dsm_5(self):
+        """Test the DSM 5 storage URL."""
+        with FakeDSMServer(dsm_version=5) as server:
+            api = self.new_api(server)
+            api.storage.update()
+        assert api.information.version == "5967"
+        assert api.storage.volume_status("volume_1") == "normal"
+
+    def test_session_expiry(self):
+        """Test an expired session is replaced."""
+        with FakeDSMServer() as server:
+            api = self.new_api(server)
+            api.utilisation.update()
+            session_id = api._session_id
+            server.expire_sessions()
+            api.utilisation.update()
+        assert api._session_id != session_id
+        assert api.metrics.snapshot()["relogins"] == 1
+
+    def test_download_station_create_from_files(self):
+        """Test files streamed to the server, again after a relogin."""
+        with FakeDSMServer() as server:
+            api = self.new_api(server)
+            api.download_station.update()
+            server.expire_sessions()
+            torrent = io.BytesIO(b"d8:announce0:e" * 10000)
+            torrent.name = "test.torrent"
+            results = api.download_station.create_from_files([torrent])
+        assert results == [{"success": True}]
+        assert server.uploads == [{"file": ("test.torrent", b"d8:announce0:e" * 10000)}]
+        assert api.metrics.snapshot()["relogins"] == 1
+
+    def test_errors(self):
+        """Test injected errors."""
+        with FakeDSMServer(errors={105: 1}) as server:
+            api = self.new_api(server)
+            with pytest.raises(SynologyDSMAPIErrorException):
+                api.utilisation.update()
+
+        with FakeDSMServer(errors={503: 1}) as server:
+            api = self.new_api(server)
+            with pytest.raises(SynologyDSMRequestException):
+                api.utilisation.update()
+
+    def test_async(self):
+        """Test the asyncio client."""
+        pytest.importorskip("aiohttp")
+
+        async def update(server):
+            async with AsyncSynologyDSM(
+                server.host, server.port, VALID_USER, VALID_PASSWORD
+            ) as api:
+                assert api.security
+                assert api.utilisation
+                await api.update()
+                server.expire_sessions()
+                await api.update(force=True)
+                return api
+
+        with FakeDSMServer(latency=0.01) as server:
+            api = asyncio.run(update(server))
+        assert api.security.status == "safe"
+        assert api.utilisation.cpu_total_load == 9
+        assert api.metrics.snapshot()["relogins"] == 1
@@ -1,8 +1,20 @@
 """Synology DSM tests."""
+import io
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from copy import deepcopy
+from email.parser import BytesParser
 from unittest import TestCase
+from unittest.mock import patch
 
 import pytest
 
+from . import API_SWITCHER
+from . import FakeResponse
 from . import SynologyDSMMock
 from . import USER_MAX_TRY
 from . import VALID_HOST
@@ -13,12 +25,30 @@ from . import VALID_PORT
 from . import VALID_USER
 from . import VALID_USER_2SA
 from . import VALID_VERIFY_SSL
+from .api_data.dsm_6 import DSM_6_API_INFO
+from .api_data.dsm_6 import DSM_6_AUTH_LOGIN
+from .api_data.dsm_6 import DSM_6_CORE_UTILIZATION
+from .api_data.dsm_6 import DSM_6_CORE_UTILIZATION_ERROR_1055
+from .api_data.dsm_6 import DSM_6_DOWNLOAD_STATION_TASK_LIST
+from .api_data.dsm_6 import DSM_6_DSM_INFORMATION
+from .api_data.dsm_6 import DSM_6_SURVEILLANCE_STATION_CAMERA_LIST
 from .const import DEVICE_TOKEN
+from .const import EXPIRED_SESSION_ID
 from .const import SESSION_ID
 from .const import SYNO_TOKEN
 from synology_dsm.api.core.security import SynoCoreSecurity
+from synology_dsm.api.core.upgrade import SynoCoreUpgrade
+from synology_dsm.api.core.utilization import SynoCoreUtilization
+from synology_dsm.api.download_station import SynoDownloadStation
+from synology_dsm.api.download_station.task import SynoDownloadTask
 from synology_dsm.api.dsm.information import SynoDSMInformation
+from synology_dsm.api.resource_monitor import SynoResourceMonitor
+from synology_dsm.cache import SynoApiCache
+from synology_dsm.cache import SynoFileSessionStore
+from synology_dsm.cache import SynoMemorySessionStore
+from synology_dsm.cache import SynoSessionStore
 from synology_dsm.const import API_AUTH
+from synology_dsm.const import API_ENTRY_REQUEST
 from synology_dsm.const import API_INFO
 from synology_dsm.exceptions import SynologyDSMAPIErrorException
 from synology_dsm.exceptions import SynologyDSMAPINotExistsException
@@ -27,6 +57,12 @@ from synology_dsm.exceptions import SynologyDSMLogin2SARequiredException
 from synology_dsm.exceptions import SynologyDSMLoginFailedException
 from synology_dsm.exceptions import SynologyDSMLoginInvalidException
 from synology_dsm.exceptions import SynologyDSMRequestException
+from synology_dsm.logs import LogPayload
+from synology_dsm.logs import redact
+from synology_dsm.metrics import SynoMetrics
+from synology_dsm.multipart import SynoMultipartEncoder
+from synology_dsm.sampler import SynoUtilizationSampler
+from synology_dsm.synology_dsm import SynologyDSM
 
 
 class TestSynologyDSM(TestCase):
@@ -169,6 +205,192 @@ class TestSynologyDSM(TestCase):
         assert self.api._session_id == SESSION_ID
         assert self.api._syno_token == SYNO_TOKEN
 
+    def test_login_keeps_session(self):
+        """Test login and relogin keep the HTTP connection pool."""
+        session = self.api._session
+        assert self.api.login()
+        assert self.api._session is session
+        assert self.api.login()
+        assert self.api._session is session
+        self.api.logout()
+        assert self.api._session is session
+        assert not self.api._session_id
+
+    def test_session_pool(self):
+        """Test HTTP connection pool sizing."""
+        adapter = self.api._session.get_adapter(self.api._base_url)
+        assert adapter._pool_connections == 10
+        assert adapter._pool_maxsize == 10
+        assert self.api._session.headers["Connection"] == "keep-alive"
+
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            max_workers=16,
+        )
+        assert api._session.get_adapter(api._base_url)._pool_maxsize == 16
+
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            pool_connections=2,
+            pool_maxsize=32,
+            keep_alive=False,
+        )
+        adapter = api._session.get_adapter(api._base_url)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert api._session.headers["Connection"] == "close"
+
+    def test_api_cache(self):
+        """Test API discovery cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            api_cache = SynoApiCache(os.path.join(cache_dir, "apis.json"))
+
+            def new_api():
+                api = SynologyDSMMock(
+                    VALID_HOST,
+                    VALID_PORT,
+                    VALID_USER,
+                    VALID_PASSWORD,
+                    VALID_HTTPS,
+                    VALID_VERIFY_SSL,
+                    api_cache=api_cache,
+                )
+                api.execute_request = patch.object(
+                    api, "_execute_request", wraps=api._execute_request
+                ).start()
+                return api
+
+            def api_info_calls(api):
+                return [
+                    call
+                    for call in api.execute_request.call_args_list
+                    if call[0][2]["api"] == API_INFO
+                ]
+
+            # First discovery is stored with the DSM build
+            api = new_api()
+            assert api.login()
+            assert len(api_info_calls(api)) == 1
+            assert api_cache.get(api._base_url)["build"] == "24922"
+            assert api_cache.get(api._base_url)["apis"] == api.apis
+
+            # Next clients skip the discovery
+            api = new_api()
+            assert api.login()
+            assert not api_info_calls(api)
+            assert api.apis.get(API_AUTH)
+
+            # Unknown API in cache
+            apis = api_cache.get(api._base_url)["apis"]
+            del apis[SynoCoreSecurity.API_KEY]
+            api_cache.set(api._base_url, "24922", apis)
+            api = new_api()
+            assert api.login()
+            assert not api_info_calls(api)
+            api.security.update()
+            assert len(api_info_calls(api)) == 1
+            assert api.security.status == "safe"
+            assert api_cache.get(api._base_url)["apis"].get(SynoCoreSecurity.API_KEY)
+
+            # DSM build changed
+            api_cache.set(api._base_url, "15284", api.apis)
+            api = new_api()
+            assert api.login()
+            assert len(api_info_calls(api)) == 1
+            assert api.apis.get(SynoCoreSecurity.API_KEY)
+            assert api_cache.get(api._base_url)["build"] == "24922"
+            patch.stopall()
+
+    def test_session_store(self):
+        """Test session reuse from a session store."""
+        session_store = SynoMemorySessionStore()
+
+        def new_api():
+            return SynologyDSMMock(
+                VALID_HOST,
+                VALID_PORT,
+                VALID_USER,
+                VALID_PASSWORD,
+                VALID_HTTPS,
+                VALID_VERIFY_SSL,
+                session_store=session_store,
+            )
+
+        api = new_api()
+        assert api.login()
+        state = session_store.load(api._session_key)
+        assert state["session_id"] == SESSION_ID
+        assert state["syno_token"] == SYNO_TOKEN
+        assert state["information"]["model"] == "DS918+"
+
+        # Session reused without login nor information requests
+        api = new_api()
+        with patch.object(
+            api, "_execute_request", wraps=api._execute_request
+        ) as execute_request:
+            assert api.login()
+            assert api.information.model == "DS918+"
+            api.security.update()
+        assert execute_request.call_count == 2  # API info and security
+        assert api._session_id == SESSION_ID
+        assert api.security.status == "safe"
+
+        # Expired session falls back to login
+        state["session_id"] = EXPIRED_SESSION_ID
+        session_store.save(api._session_key, state)
+        api = new_api()
+        api.security.update()
+        assert api._session_id == SESSION_ID
+        assert api.security.status == "safe"
+        assert session_store.load(api._session_key)["session_id"] == SESSION_ID
+
+        # Logout forgets the session
+        api.logout()
+        assert not session_store.load(api._session_key)
+
+    def test_session_store_abstract(self):
+        """Test session stores must implement load, save and delete."""
+
+        class IncompleteSessionStore(SynoSessionStore):
+            def load(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            IncompleteSessionStore()
+
+    def test_file_session_store(self):
+        """Test file session store."""
+        with tempfile.TemporaryDirectory() as store_dir:
+            path = os.path.join(store_dir, "sessions.json")
+            session_store = SynoFileSessionStore(path)
+            api = SynologyDSMMock(
+                VALID_HOST,
+                VALID_PORT,
+                VALID_USER,
+                VALID_PASSWORD,
+                VALID_HTTPS,
+                VALID_VERIFY_SSL,
+                session_store=session_store,
+            )
+            assert api.login()
+
+            state = SynoFileSessionStore(path).load(api._session_key)
+            assert state["session_id"] == SESSION_ID
+            assert state["syno_token"] == SYNO_TOKEN
+            assert oct(os.stat(path).st_mode & 0o777) == "0o600"
+            session_store.delete(api._session_key)
+            assert not SynoFileSessionStore(path).load(api._session_key)
+
     def test_login_failed(self):
         """Test failed login."""
         api = SynologyDSMMock(
@@ -401,6 +623,555 @@ class TestSynologyDSM(TestCase):
         assert error_value["reason"] == "File does not exist"
         assert not error_value["details"]
 
+    def test_update_batch(self):
+        """Test update with compound requests."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            batch_requests=True,
+        )
+        api.login()
+        assert api.security
+        assert api.share
+        assert api.storage
+        assert api.system
+        assert api.upgrade
+        assert api.utilisation
+        assert api.download_station
+
+        with patch.object(
+            api, "_execute_request", wraps=api._execute_request
+        ) as execute_request:
+            api.update()
+        # One compound request, DownloadStation is not on entry.cgi
+        assert execute_request.call_count == 2
+        assert API_ENTRY_REQUEST in execute_request.call_args_list[0][0][2]["api"]
+
+        assert api.security.status == "safe"
+        assert api.share.shares
+        assert api.storage.volume_status("volume_1") == "normal"
+        assert api.system.model == "DS918+"
+        assert api.upgrade.update_available
+        assert api.utilisation.cpu_total_load == 9
+        assert len(api.download_station.get_all_tasks()) == 8
+
+    def test_update_batch_error(self):
+        """Test a failed compound sub-request does not stop the other modules."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            batch_requests=True,
+        )
+        api.login()
+        assert api.security
+        assert api.system
+        assert api.utilisation
+
+        with patch.dict(
+            API_SWITCHER[6], CORE_UTILIZATION=DSM_6_CORE_UTILIZATION_ERROR_1055
+        ), pytest.raises(SynologyDSMAPIErrorException) as error:
+            api.update()
+        assert error.value.args[0]["api"] == SynoCoreUtilization.API_KEY
+        assert error.value.args[0]["code"] == 1055
+
+        assert api.security.status == "safe"
+        assert api.system.model == "DS918+"
+        assert not api.utilisation.cpu_total_load
+
+    def test_map_error(self):
+        """Test a failed job does not discard the results of the others."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            max_workers=2,
+        )
+        api.login()
+        assert api.security
+        assert api.system
+        assert api.utilisation
+
+        with patch.dict(
+            API_SWITCHER[6], CORE_UTILIZATION=DSM_6_CORE_UTILIZATION_ERROR_1055
+        ), pytest.raises(SynologyDSMAPIErrorException):
+            api.update()
+        assert api.security.status == "safe"
+        assert api.system.model == "DS918+"
+
+    def test_update_batch_surveillance(self):
+        """Test update with compound requests on multiple rounds."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            batch_requests=True,
+        )
+        api.with_surveillance = True
+        api.login()
+        assert api.surveillance_station
+        assert api.utilisation
+        api.update()
+        assert api.surveillance_station.get_camera(1).is_motion_detection_enabled
+        assert api.surveillance_station.get_camera_live_view_path(1, "rtsp")
+        assert api.utilisation.cpu_total_load
+
+    def test_update_batch_motion_detection(self):
+        """Test motion settings of all cameras in one compound request."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            batch_requests=True,
+        )
+        api.with_surveillance = True
+        api.login()
+        camera = DSM_6_SURVEILLANCE_STATION_CAMERA_LIST["data"]["cameras"][0]
+        cameras = [{**camera, "id": camera_id} for camera_id in range(1, 5)]
+        with patch.dict(
+            DSM_6_SURVEILLANCE_STATION_CAMERA_LIST["data"], cameras=cameras
+        ), patch.object(
+            api, "_execute_request", wraps=api._execute_request
+        ) as execute_request:
+            api.surveillance_station.update()
+        assert [call[0][2]["method"] for call in execute_request.call_args_list] == [
+            "List",
+            "request",
+            "GetLiveViewPath",
+        ]
+        compound = json.loads(execute_request.call_args_list[1][1]["data"]["compound"])
+        assert [request["camId"] for request in compound] == [1, 2, 3, 4]
+        assert all(
+            camera.is_motion_detection_enabled
+            for camera in api.surveillance_station.get_all_cameras()
+        )
+
+    def test_update_motion_detection_pool(self):
+        """Test motion settings of the cameras requested on the default pool."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+        )
+        api.with_surveillance = True
+        api.login()
+        camera = DSM_6_SURVEILLANCE_STATION_CAMERA_LIST["data"]["cameras"][0]
+        cameras = [{**camera, "id": camera_id} for camera_id in range(1, 7)]
+
+        lock = threading.Lock()
+        running = []
+        max_running = []
+        execute_request = api._execute_request
+
+        def slow_execute_request(method, url, params, **kwargs):
+            with lock:
+                running.append(params)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(params)
+            return execute_request(method, url, params, **kwargs)
+
+        api._execute_request = slow_execute_request
+        with patch.dict(
+            DSM_6_SURVEILLANCE_STATION_CAMERA_LIST["data"], cameras=cameras
+        ):
+            api.surveillance_station.update()
+        # The 6 MotionEnum requests run 4 at a time
+        assert max(max_running) == 4
+        assert all(
+            camera.is_motion_detection_enabled
+            for camera in api.surveillance_station.get_all_cameras()
+        )
+
+    def test_update_parallel(self):
+        """Test update with a worker pool."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            max_workers=4,
+        )
+        assert api.security
+        assert api.storage
+        assert api.system
+        assert api.utilisation
+
+        lock = threading.Lock()
+        running = []
+        max_running = []
+        execute_request = api._execute_request
+
+        def slow_execute_request(method, url, params, **kwargs):
+            with lock:
+                running.append(url)
+                max_running.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(url)
+            return execute_request(method, url, params, **kwargs)
+
+        api._execute_request = slow_execute_request
+        api.update()
+        # Login is done once, then the 4 modules run together
+        assert max(max_running) == 4
+        assert api._session_id == SESSION_ID
+        assert api.security.status == "safe"
+        assert api.storage.volume_status("volume_1") == "normal"
+        assert api.system.model == "DS918+"
+        assert api.utilisation.cpu_total_load == 9
+
+    def test_update_parallel_executor(self):
+        """Test the worker pool is kept across updates until logout."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            max_workers=4,
+        )
+        assert api.security
+        assert api.utilisation
+        api.update()
+        executor = api._executor
+        assert executor
+        api.update(force=True)
+        assert api._executor is executor
+
+        api.logout()
+        assert not api._executor
+        assert executor._shutdown
+        api.update(force=True)
+        assert api._executor is not executor
+        api.close()
+        assert not api._executor
+
+    def test_update_intervals(self):
+        """Test update only refreshes modules whose data is stale."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            update_intervals={SynoCoreUtilization.API_KEY: 10},
+        )
+        api.login()
+        assert api.security
+        assert api.upgrade
+        assert api.utilisation
+
+        updated_apis = []
+        execute_request = api._execute_request
+
+        def tracking_execute_request(method, url, params, **kwargs):
+            updated_apis.append(params["api"])
+            return execute_request(method, url, params, **kwargs)
+
+        api._execute_request = tracking_execute_request
+        api.update()
+        assert sorted(updated_apis) == [
+            SynoCoreSecurity.API_KEY,
+            SynoCoreUtilization.API_KEY,
+            SynoCoreUpgrade.API_SERVER_KEY,
+        ]
+        assert api.utilisation.cpu_total_load == 9
+
+        # Fresh data is kept
+        updated_apis.clear()
+        api.update()
+        assert not updated_apis
+
+        # Stale data is refreshed according to each interval
+        now = time.monotonic()
+        with patch("synology_dsm.synology_dsm.time.monotonic", return_value=now + 10):
+            api.update()
+        assert updated_apis == [SynoCoreUtilization.API_KEY]
+
+        updated_apis.clear()
+        with patch("synology_dsm.synology_dsm.time.monotonic", return_value=now + 3600):
+            api.update()
+        assert sorted(updated_apis) == [
+            SynoCoreSecurity.API_KEY,
+            SynoCoreUtilization.API_KEY,
+            SynoCoreUpgrade.API_SERVER_KEY,
+        ]
+
+        # Forced update
+        updated_apis.clear()
+        api.update(force=True)
+        assert len(updated_apis) == 3
+
+        # A reset module is updated when instanced again
+        updated_apis.clear()
+        assert api.reset(api.security)
+        assert api.security
+        api.update()
+        assert updated_apis == [SynoCoreSecurity.API_KEY]
+
+    def test_metrics(self):
+        """Test requests statistics."""
+        responses = {
+            API_INFO: [DSM_6_API_INFO],
+            API_AUTH: [DSM_6_AUTH_LOGIN, DSM_6_AUTH_LOGIN],
+            SynoDSMInformation.API_KEY: [DSM_6_DSM_INFORMATION],
+            SynoCoreUtilization.API_KEY: [
+                DSM_6_CORE_UTILIZATION,
+                {"error": {"code": 119}, "success": False},
+                DSM_6_CORE_UTILIZATION,
+                {},
+            ],
+        }
+
+        def get(url, params, **kwargs):
+            api = dict(param.split("=") for param in params.split("&"))["api"]
+            data = responses[api].pop(0)
+            return FakeResponse(url, 200 if data else 500, data)
+
+        requests = []
+        relogins = []
+        api = SynologyDSM(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            metrics=SynoMetrics(on_request=requests.append, on_relogin=relogins.append),
+        )
+        api._session.get = get
+        api.utilisation.update()
+        api.utilisation.update()
+        with pytest.raises(SynologyDSMRequestException):
+            api.utilisation.update()
+
+        assert relogins == [SynoCoreUtilization.API_KEY]
+        assert [request["api"] for request in requests] == [
+            API_INFO,
+            API_AUTH,
+            SynoDSMInformation.API_KEY,
+            SynoCoreUtilization.API_KEY,
+            SynoCoreUtilization.API_KEY,
+            API_AUTH,
+            SynoCoreUtilization.API_KEY,
+            SynoCoreUtilization.API_KEY,
+        ]
+        assert requests[4]["error"] == 119
+        assert requests[4]["status"] == 200
+        assert requests[4]["bytes"] == 42
+
+        snapshot = api.metrics.snapshot()
+        assert snapshot["relogins"] == 1
+        stats = snapshot["requests"][(SynoCoreUtilization.API_KEY, "get", 1)]
+        assert stats["count"] == 4
+        assert stats["statuses"] == {200: 3, 500: 1}
+        assert stats["errors"] == {119: 1}
+        assert stats["bytes"] == sum(
+            request["bytes"]
+            for request in requests
+            if request["api"] == SynoCoreUtilization.API_KEY
+        )
+        assert sum(stats["histogram"].values()) == 4
+        assert stats["max_latency"] <= stats["latency"]
+        assert stats["decode_time"] > 0
+
+        api.metrics.reset()
+        assert api.metrics.snapshot() == {"requests": {}, "relogins": 0}
+
+    def test_json_decoder(self):
+        """Test the JSON decoder hook decodes the response content."""
+        decoded = []
+
+        def decoder(content):
+            decoded.append(content)
+            return json.loads(content)
+
+        api = SynologyDSM(
+            VALID_HOST, VALID_PORT, VALID_USER, VALID_PASSWORD, json_decoder=decoder
+        )
+        api._session.get = lambda url, params, **kwargs: FakeResponse(
+            url, 200, DSM_6_API_INFO
+        )
+        api.discover_apis()
+        assert api.apis == DSM_6_API_INFO["data"]
+        assert decoded == [json.dumps(DSM_6_API_INFO).encode()]
+
+    def test_metrics_compound(self):
+        """Test requests statistics of a compound request."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            batch_requests=True,
+        )
+        api.login()
+        assert api.security
+        assert api.utilisation
+        api.update()
+
+        requests = api.metrics.snapshot()["requests"]
+        assert requests[(SynoCoreSecurity.API_KEY, "system_get", 1)]["count"] == 1
+        assert requests[(SynoCoreUtilization.API_KEY, "get", 1)]["count"] == 1
+        assert not requests[(SynoCoreUtilization.API_KEY, "get", 1)]["latency"]
+
+    def test_debug_logs(self):
+        """Test debug logs are redacted."""
+        with self.assertLogs("synology_dsm", logging.DEBUG) as logs:
+            self.api.login()
+            self.api.utilisation.update()
+        output = "\n".join(logs.output)
+        assert "Successful returned data, API: SYNO.API.Auth" in output
+        assert "'sid': '***'" in output
+        assert SESSION_ID not in output
+        assert SYNO_TOKEN not in output
+
+        assert redact(
+            "https://nas:5001/webapi/auth.cgi?account=user&passwd=pass&_sid=id"
+            "&SynoToken=token&format=sid"
+        ) == (
+            "https://nas:5001/webapi/auth.cgi?account=user&passwd=***&_sid=***"
+            "&SynoToken=***&format=sid"
+        )
+        assert redact({"data": [{"passwd": "pass", "Cookie": "id=1"}]}) == {
+            "data": [{"passwd": "***", "Cookie": "***"}]
+        }
+        assert str(LogPayload("x" * 20, 10)) == "xxxxxxxxxx... (20 characters)"
+
+    def test_debug_mode(self):
+        """Test debug mode prints messages without args as is."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            debugmode=True,
+        )
+        with patch("builtins.print") as print_mock:
+            api._debuglog("100% done")
+            api._debuglog("%s%% done", 50)
+        assert [call[0][0] for call in print_mock.call_args_list] == [
+            "DEBUG: 100% done",
+            "DEBUG: 50% done",
+        ]
+
+    def test_debug_logs_disabled(self):
+        """Test payloads are not formatted when debug logs are disabled."""
+        with patch("synology_dsm.logs.redact") as redact_mock:
+            self.api.login()
+            self.api.utilisation.update()
+        assert not redact_mock.called
+
+    def test_relogin_single_flight(self):
+        """Test only one thread logs in again when the session expired."""
+        api = SynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+            max_workers=4,
+        )
+        assert api.login()
+        assert api.security
+        assert api.storage
+        assert api.system
+        assert api.utilisation
+        api._session_id = EXPIRED_SESSION_ID
+
+        lock = threading.Lock()
+        logins = []
+        execute_request = api._execute_request
+
+        def slow_execute_request(method, url, params, **kwargs):
+            if params.get("method") == "login":
+                with lock:
+                    logins.append(url)
+            time.sleep(0.05)
+            return execute_request(method, url, params, **kwargs)
+
+        api._execute_request = slow_execute_request
+        api.update()
+        assert len(logins) == 1
+        assert api._session_id == SESSION_ID
+        assert api.security.status == "safe"
+        assert api.utilisation.cpu_total_load == 9
+
+    def test_request_coalescing(self):
+        """Test identical concurrent reads share one request."""
+        execute_request = self.api._execute_request
+        self.api.login()
+
+        calls = []
+
+        def slow_execute_request(method, url, params, **kwargs):
+            calls.append(url)
+            time.sleep(0.1)
+            return execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = slow_execute_request
+        responses = []
+
+        def read():
+            responses.append(self.api.get(SynoCoreSecurity.API_KEY, "system_get"))
+
+        threads = [threading.Thread(target=read) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(responses) == 5
+        assert all(response is responses[0] for response in responses)
+        assert not self.api._in_flight
+
+        # Sequential reads are not coalesced
+        self.api.get(SynoCoreSecurity.API_KEY, "system_get")
+        assert len(calls) == 2
+
+        # Nor are writes, even sent over GET
+        threads = [
+            threading.Thread(
+                target=self.api.get,
+                args=(SynoDownloadStation.TASK_API_KEY, "Pause", {"id": "dbid_86"}),
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 4
+
     def test_reset_str_attr(self):
         """Test reset with string attr."""
         assert not self.api._security
@@ -639,6 +1410,147 @@ class TestSynologyDSM(TestCase):
         assert self.api.utilisation.network_down()
         assert self.api.utilisation.network_down(True)
 
+    def test_utilisation_devices(self):
+        """Test utilisation of each device."""
+        self.api.utilisation.update()
+        assert self.api.utilisation.networks_ids == ["eth0", "eth1"]
+        assert self.api.utilisation.network_rx("eth0") == 109549
+        assert self.api.utilisation.network_tx("eth1") == 0
+        assert self.api.utilisation.network_tx("eth0", True) == "44.0Kb"
+        assert self.api.utilisation.disks_ids == ["sdc", "sda", "sdb"]
+        assert self.api.utilisation.disk_read_bytes("sda") == 63905
+        assert self.api.utilisation.disk_write_bytes("total") == 1249878
+        assert self.api.utilisation.disk_read_access("sdb") == 3
+        assert self.api.utilisation.disk_write_access("sdb") == 15
+        assert self.api.utilisation.disk_utilization("sdc") == 12
+        assert self.api.utilisation.get_disk("sda")["display_name"] == "Drive 1"
+        assert self.api.utilisation.volumes_ids == ["md2"]
+        assert self.api.utilisation.volume_read_bytes("md2") == 27603
+        assert self.api.utilisation.volume_write_bytes("md2") == 132496
+        assert self.api.utilisation.volume_read_access("total") == 1
+        assert self.api.utilisation.volume_write_access("md2") == 23
+        assert self.api.utilisation.volume_utilization("md2") == 1
+        assert self.api.utilisation.luns_ids == []
+
+        # Non existing device
+        assert self.api.utilisation.network_rx("eth9") is None
+        assert self.api.utilisation.disk_read_bytes("sdz") is None
+        assert self.api.utilisation.volume_utilization("md9") is None
+        assert self.api.utilisation.lun_read_bytes("lun9") is None
+        assert not self.api.utilisation.get_volume("md9")
+
+        columns = self.api.utilisation.columns()
+        assert columns["disk"]["device"] == ["sdc", "sda", "sdb"]
+        assert columns["disk"]["utilization"] == [12, 8, 10]
+        assert columns["volume"]["write_byte"] == [132496]
+        assert columns["network"] == {
+            "device": ["eth0", "eth1"],
+            "rx": [109549, 0],
+            "tx": [45097, 0],
+        }
+        assert columns["lun"] == {}
+
+        # LUNs
+        self.api.utilisation._data = {
+            **self.api.utilisation._data,
+            "lun": [{"device": "lun1", "read_byte": 2048, "utilization": 3}],
+        }
+        self.api.utilisation._index()
+        assert self.api.utilisation.luns_ids == ["lun1"]
+        assert self.api.utilisation.lun_read_bytes("lun1") == 2048
+        assert self.api.utilisation.lun_write_bytes("lun1") is None
+        assert self.api.utilisation.lun_utilization("lun1") == 3
+
+    def test_utilisation_sampler(self):
+        """Test utilisation history."""
+        sampler = SynoUtilizationSampler(self.api, capacity=4)
+        self.api.utilisation.update()
+        self.api.utilisation._data = deepcopy(self.api.utilisation._data)
+        now = time.monotonic()
+        for index in range(6):
+            self.api.utilisation._data["cpu"]["user_load"] = index
+            sampler.record(now - 50 + index * 10)
+
+        assert sampler.samples_count == 4
+        assert "network.eth1.tx" in sampler.series
+        assert "disk.sda.read_byte" in sampler.series
+        assert "volume.md2.write_byte" in sampler.series
+        assert sampler.values("cpu.total_load") == [7, 8, 9, 10]
+        assert sampler.values("cpu.total_load", window=15) == [9, 10]
+        assert sampler.stats("cpu.total_load") == {
+            "count": 4,
+            "min": 7,
+            "max": 10,
+            "mean": 8.5,
+            "p95": 10,
+        }
+        assert sampler.stats("network.total.rx", window=25)["mean"] == 109549
+        assert sampler.stats("network.eth2.rx") is None
+        assert sampler.values("cpu.total_load", window=5) == [10]
+
+        # Devices appearing later miss the older samples
+        self.api.utilisation._data["network"].append(
+            {"device": "eth2", "rx": 5, "tx": 1}
+        )
+        sampler.record()
+        assert sampler.values("network.eth2.rx") == [5]
+        assert sampler.values("network.eth0.rx") == [109549] * 4
+
+    def test_utilisation_sampler_thread(self):
+        """Test utilisation sampled in the background."""
+        sampler = SynoUtilizationSampler(self.api, interval=0.01).start()
+        time.sleep(0.1)
+        sampler.stop()
+        count = sampler.samples_count
+        assert count > 1
+        assert sampler.stats("memory.real_usage")["max"] == 24
+        time.sleep(0.05)
+        assert sampler.samples_count == count
+
+    def test_resource_monitor(self):
+        """Test utilisation history."""
+        assert self.api.resource_monitor.get_setting()["data"]["enable_history"]
+        history = self.api.resource_monitor.get_history()
+        assert list(history["time"]) == [1585503221 + 60 * i for i in range(5)]
+        assert list(history["cpu.total_load"]) == [6, 7, 8, 9, 10]
+        assert list(history["memory.real_usage"]) == [20, 21, 22, 23, 24]
+        assert list(history["disk.sda.read_byte"]) == [
+            60000,
+            61000,
+            62000,
+            63000,
+            64000,
+        ]
+        assert list(history["volume.md2.write_byte"]) == [132496] * 5
+        # Device missing from the first logs
+        assert str(list(history["network.eth1.rx"])) == "[nan, nan, nan, 10.0, 10.0]"
+
+    def test_resource_monitor_paging(self):
+        """Test utilisation history by pages."""
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            history = self.api.resource_monitor.get_history(
+                start_time=1585503221, end_time=1585503521, page_size=2
+            )
+        assert len(history["time"]) == 5
+        pages = [
+            call[0][2]
+            for call in execute_request.call_args_list
+            if call[0][2]["api"] == SynoResourceMonitor.LOG_API_KEY
+        ]
+        assert [(page["offset"], page["limit"]) for page in pages] == [
+            (0, 2),
+            (2, 2),
+            (4, 2),
+        ]
+        assert pages[0]["start_time"] == 1585503221
+        assert pages[0]["end_time"] == 1585503521
+
+        history = self.api.resource_monitor.get_history(offset=1, limit=3, page_size=2)
+        assert list(history["cpu.total_load"]) == [7, 8, 9]
+        assert not self.api.resource_monitor.get_history(offset=5)["time"]
+
     def test_storage(self):
         """Test storage roots."""
         assert self.api.storage
@@ -864,6 +1776,63 @@ class TestSynologyDSM(TestCase):
         assert self.api.storage.disk_below_remain_life_thr("test_disk") is None
         assert self.api.storage.disk_temp("test_disk") is None
 
+    def test_storage_pools(self):
+        """Test storage pools lookups."""
+        self.api.disks_redundancy = "SHR1"
+        self.api.storage.update()
+        assert self.api.storage.get_storage_pool("reuse_1")["disks"] == ["sda"]
+        assert self.api.storage.get_disk_storage_pool("sdb")["id"] == "reuse_2"
+        assert not self.api.storage.get_storage_pool("not_a_pool")
+        assert not self.api.storage.get_disk_storage_pool("not_a_disk")
+
+        # Indexes follow the updates
+        self.api.disks_redundancy = "RAID"
+        self.api.storage.update()
+        assert self.api.storage.get_disk_storage_pool("sdb")["id"] == "reuse_1"
+        assert [
+            disk.id for disk in self.api.storage._get_disks_for_volume("volume_1")
+        ] == ["sda", "sdb", "sdc"]
+        assert not self.api.storage.get_volume("volume_2")
+
+    def test_storage_models(self):
+        """Test storage parsed models."""
+        self.api.disks_redundancy = "SHR2"
+        self.api.storage.update()
+        disk = self.api.storage.disk_models["sda"]
+        assert disk.name == "Drive 1"
+        assert disk.model == "WD80EFAX-68KNBN0"
+        assert disk.size_total == 8001563222016
+        assert disk.exceed_bad_sector_thr is False
+        assert disk.is_ssd is False
+        volume = self.api.storage.volume_models["volume_1"]
+        assert volume.size_total == 38378964738048
+        assert volume.percentage_used == 69.6
+        assert volume.is_writable is True
+        pool = self.api.storage.storage_pool_models["reuse_1"]
+        assert len(pool.disks) == 8
+        assert pool.volumes_ids == ("volume_1",)
+        assert pool.size_total == 39978100850688
+        env = self.api.storage.env_model
+        assert env.model_name == "DS1819+"
+        assert env.bay_number == 8
+        assert env.system_crashed is False
+        assert env.volume_full_warning == 0.2
+        with pytest.raises(AttributeError):
+            disk.temp = 0
+
+    def test_storage_release_raw_data(self):
+        """Test storage keeping only the parsed models."""
+        self.api.storage.keep_raw_data = False
+        self.api.storage.update()
+        assert not self.api.storage.disks
+        assert not self.api.storage.env
+        assert not self.api.storage.get_volume("volume_1")
+        assert self.api.storage.volumes_ids == ["test_volume", "volume_1"]
+        assert self.api.storage.volume_size_total("volume_1") == 7672030584832
+        assert self.api.storage.volume_disk_temp_max("volume_1") == 24
+        assert self.api.storage.disk_temp("sda") == 24
+        assert self.api.storage.env_model.model_name == "DS918+"
+
     def test_download_station(self):
         """Test DownloadStation."""
         assert self.api.download_station
@@ -894,6 +1863,345 @@ class TestSynologyDSM(TestCase):
         )
         assert self.api.download_station.get_task("dbid_549").type == "https"
 
+    def test_download_station_paging(self):
+        """Test DownloadStation tasks listed by pages."""
+        download_station = self.api.download_station
+        download_station.page_size = 3
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            download_station.update()
+        pages = [
+            (call[0][2].get("offset"), call[0][2]["limit"])
+            for call in execute_request.call_args_list
+            if call[0][2]["api"] == SynoDownloadStation.TASK_API_KEY
+        ]
+        assert pages == [(None, 3), (3, 3), (6, 3)]
+        assert len(download_station.get_all_tasks()) == 8
+
+        # Tasks are kept across updates
+        task = download_station.get_task("dbid_86")
+        download_station.update(additionals=["detail"])
+        assert download_station.get_task("dbid_86") is task
+        assert not task.additional.get("file")
+
+    def test_download_station_batch(self):
+        """Test DownloadStation actions sent together."""
+        download_station = self.api.download_station
+        batch = download_station.batch()
+        batch.pause("dbid_86")
+        batch.pause(["dbid_164", "dbid_486"])
+        batch.resume("dbid_518")
+        batch.delete("dbid_533", force_complete=True)
+        batch.delete("dbid_549")
+        batch.create("magnet:?xt=1")
+        batch.create("magnet:?xt=2")
+        assert len(batch) == 5
+
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            assert len(batch.flush()) == 5
+        requests = [
+            (call[0][2]["method"], call[0][2].get("id") or call[0][2].get("uri"))
+            for call in execute_request.call_args_list
+            if call[0][2]["api"] == SynoDownloadStation.TASK_API_KEY
+        ]
+        assert requests == [
+            ("Pause", "dbid_86,dbid_164,dbid_486"),
+            ("Resume", "dbid_518"),
+            ("Delete", "dbid_533"),
+            ("Delete", "dbid_549"),
+            ("Create", "magnet:?xt=1,magnet:?xt=2"),
+            ("List", None),
+        ]
+        assert not len(batch)
+        assert not batch.flush()
+
+    def test_download_station_refresh_after_action(self):
+        """Test DownloadStation tasks patched or refreshed lazily."""
+        download_station = self.api.download_station
+        download_station.update()
+
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            download_station.refresh_after_action = "patch"
+            download_station.pause(["dbid_86", "dbid_164"])
+            download_station.resume("dbid_518")
+            download_station.delete("dbid_549")
+            assert download_station.get_task("dbid_86").status == "paused"
+            assert download_station.get_task("dbid_518").status == "waiting"
+            assert "dbid_549" not in [
+                task.id for task in download_station.get_all_tasks()
+            ]
+            assert execute_request.call_count == 3
+
+            # New tasks are listed
+            download_station.create("magnet:?xt=1")
+            assert execute_request.call_count == 5
+            assert download_station.get_task("dbid_86").status == "downloading"
+
+            download_station.refresh_after_action = "lazy"
+            download_station.pause("dbid_86")
+            assert execute_request.call_count == 6
+            assert download_station.stale
+            assert download_station.get_task("dbid_86").status == "downloading"
+        download_station.update()
+        assert not download_station.stale
+
+    def test_download_station_patch_changes(self):
+        """Test DownloadStation task changes notified after patched actions."""
+        download_station = self.api.download_station
+        download_station.update()
+        download_station.refresh_after_action = "patch"
+        notified = []
+        download_station.subscribe(notified.append)
+
+        download_station.pause(["dbid_86", "dbid_164"])
+        assert len(notified) == 1
+        assert [task.id for task in notified[0].status_changed] == [
+            "dbid_86",
+            "dbid_164",
+        ]
+        assert not notified[0].removed
+
+        download_station.delete("dbid_549")
+        assert len(notified) == 2
+        assert [task.id for task in notified[1].removed] == ["dbid_549"]
+        assert not notified[1].status_changed
+
+        # Already paused
+        download_station.pause("dbid_86")
+        assert len(notified) == 2
+
+    def test_download_station_progress(self):
+        """Test DownloadStation transfer polling."""
+        download_station = self.api.download_station
+        download_station.update()
+        task = download_station.get_task("dbid_86")
+        assert download_station.transfer_totals()["speed_download"] == 0
+
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            download_station.update_progress(with_stat=True)
+        params = execute_request.call_args_list[0][0][2]
+        assert params["method"] == "GetInfo"
+        assert params["id"] == "dbid_86,dbid_164,dbid_486"
+        assert params["additional"] == "transfer"
+        assert execute_request.call_count == 2
+
+        assert download_station.get_task("dbid_86") is task
+        assert task.additional["transfer"]["speed_download"] == 40000000
+        assert task.additional["file"]
+        assert download_station.get_task("dbid_486").status == "finishing"
+        assert download_station.transfer_totals() == {
+            "speed_download": 89950232,
+            "speed_upload": 1000,
+            "size_downloaded": 3582884860,
+            "size_uploaded": 1048576,
+            "eta": 40,
+            "stat_speed_download": 89950232,
+            "stat_speed_upload": 0,
+        }
+
+        # Paused tasks keep their last transfer data, without their speed
+        download_station.refresh_after_action = "patch"
+        download_station.pause("dbid_86")
+        totals = download_station.transfer_totals()
+        assert totals["speed_download"] == 89950232 - 40000000
+        assert totals["size_downloaded"] == 3582884860
+
+    def test_download_station_progress_chunks(self):
+        """Test DownloadStation transfer polling split in several requests."""
+        download_station = self.api.download_station
+        download_station.update()
+
+        with patch(
+            "synology_dsm.api.download_station._PROGRESS_IDS_PER_REQUEST", 2
+        ), patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            download_station.update_progress()
+        assert sorted(call[0][2]["id"] for call in execute_request.call_args_list) == [
+            "dbid_486",
+            "dbid_86,dbid_164",
+        ]
+        assert download_station.get_task("dbid_486").status == "finishing"
+
+        task = SynoDownloadTask({"id": "dbid_1", "status": "downloading"})
+        assert task.additional == {}
+
+    def test_download_station_create_from_files(self):
+        """Test DownloadStation tasks created from files."""
+        download_station = self.api.download_station
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "test.torrent")
+            with open(path, "wb") as file:
+                file.write(b"d8:announce0:e")
+
+            with patch.object(
+                self.api, "_execute_request", wraps=self.api._execute_request
+            ) as execute_request:
+                results = download_station.create_from_files(
+                    [path, io.BytesIO(b"nzb")], destination="downloads"
+                )
+        assert len(results) == 2
+        calls = [
+            call
+            for call in execute_request.call_args_list
+            if call[0][2]["api"] == SynoDownloadStation.TASK_API_KEY
+        ]
+        assert [call[0][2]["method"] for call in calls] == ["Create", "Create", "List"]
+        assert calls[0][0][2]["destination"] == "downloads"
+        filename, fileobj, _ = calls[0][1]["files"]["file"]
+        assert filename == "test.torrent"
+        assert fileobj.closed
+        assert calls[1][1]["files"]["file"][0] == "task"
+
+    def test_multipart_encoder(self):
+        """Test multipart bodies read by chunks."""
+        fileobj = io.BytesIO(b"skipped" + b"x" * 100000)
+        fileobj.seek(7)
+        body = SynoMultipartEncoder(
+            {"api": "SYNO.DownloadStation.Task", "destination": None},
+            {"file": ("test.torrent", fileobj, "application/x-bittorrent")},
+        )
+        chunks = list(body)
+        assert len(chunks) > 1
+        content = b"".join(chunks)
+        assert len(content) == len(body)
+        assert not body.read()
+
+        message = BytesParser().parsebytes(
+            b"Content-Type: " + body.content_type.encode() + b"\r\n\r\n" + content
+        )
+        parts = message.get_payload()
+        assert len(parts) == 2
+        assert parts[0].get_param("name", header="content-disposition") == "api"
+        assert parts[0].get_payload() == "SYNO.DownloadStation.Task"
+        assert parts[1].get_filename() == "test.torrent"
+        assert parts[1].get_content_type() == "application/x-bittorrent"
+        assert parts[1].get_payload(decode=True) == b"x" * 100000
+
+        body.rewind()
+        assert fileobj.tell() == 7
+        assert body.read(10) + body.read() == content
+
+    def test_multipart_encoder_escapes(self):
+        """Test multipart header params cannot break the part headers."""
+        body = SynoMultipartEncoder(
+            {},
+            {
+                'fi"le': (
+                    'evil".torrent\r\nX-Injected: 1',
+                    io.BytesIO(b"x"),
+                    "application/x-bittorrent",
+                )
+            },
+        )
+        header = body.read().split(b"\r\n\r\n")[0].decode()
+        assert header.splitlines()[1:] == [
+            'Content-Disposition: form-data; name="fi%22le"; '
+            'filename="evil%22.torrent%0D%0AX-Injected: 1"',
+            "Content-Type: application/x-bittorrent",
+        ]
+
+    def test_download_station_changes(self):
+        """Test DownloadStation task changes."""
+        download_station = self.api.download_station
+        notified = []
+        download_station.subscribe(notified.append)
+        changes = download_station.update()
+        assert len(changes.added) == 8
+        assert not changes.removed
+        assert notified == [changes]
+
+        assert not download_station.update()
+        assert len(notified) == 1
+
+        tasks = DSM_6_DOWNLOAD_STATION_TASK_LIST["data"]["tasks"]
+        download_station.get_task("dbid_164").patch(status="paused")
+        with patch.dict(DSM_6_DOWNLOAD_STATION_TASK_LIST["data"], tasks=tasks[1:]):
+            changes = download_station.update()
+        assert not changes.added
+        assert [task.id for task in changes.removed] == ["dbid_86"]
+        assert [task.id for task in changes.status_changed] == ["dbid_164"]
+        assert not changes.progress_changed
+
+        changes = download_station.update()
+        assert [task.id for task in changes.added] == ["dbid_86"]
+        changes = download_station.update_progress()
+        assert [task.id for task in changes.status_changed] == ["dbid_486"]
+        assert [task.id for task in changes.progress_changed] == [
+            "dbid_86",
+            "dbid_164",
+        ]
+        assert len(notified) == 4
+
+        download_station.unsubscribe(notified.append)
+        download_station.get_task("dbid_164").patch(status="paused")
+        assert download_station.update().status_changed
+        assert len(notified) == 4
+
+    def test_download_station_iter_tasks(self):
+        """Test DownloadStation tasks iteration."""
+        download_station = self.api.download_station
+        tasks = download_station.iter_tasks(page_size=3)
+        assert next(tasks).id == "dbid_86"
+        assert len(list(tasks)) == 7
+        assert not download_station.get_all_tasks()
+
+        assert [
+            task.id
+            for task in download_station.iter_tasks(
+                additionals=["detail"], offset=2, limit=4, page_size=3
+            )
+        ] == ["dbid_486", "dbid_518", "dbid_522", "dbid_531"]
+        assert all(
+            "file" not in task.additional
+            for task in download_station.iter_tasks(additionals=["detail"])
+        )
+
+    def test_surveillance_station_camera_images(self):
+        """Test SurveillanceStation camera images fetched concurrently."""
+        self.api.with_surveillance = True
+        surveillance = self.api.surveillance_station
+        surveillance.update()
+        assert list(surveillance.iter_camera_images()) == [(1, b"image 1", None)]
+
+        lock = threading.Lock()
+        running = []
+        max_running = []
+        timeouts = []
+        execute_request = self.api._execute_request
+
+        def slow_execute_request(method, url, params, **kwargs):
+            with lock:
+                running.append(params["id"])
+                max_running.append(len(running))
+                timeouts.append(kwargs.get("timeout"))
+            time.sleep(0.2 if params["id"] == 1 else 0.01)
+            with lock:
+                running.remove(params["id"])
+            return execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = slow_execute_request
+        images = list(
+            surveillance.iter_camera_images(
+                [1, 2, 3, 4, 11], max_concurrency=2, timeout=2
+            )
+        )
+        assert max(max_running) == 2
+        assert timeouts == [2] * 5
+        # The slowest image comes last
+        assert images[-1] == (1, b"image 1", None)
+        images_by_id = {image.camera_id: image for image in images}
+        assert images_by_id[4].image == b"image 4"
+        assert images_by_id[11].image is None
+        assert isinstance(images_by_id[11].error, SynologyDSMAPIErrorException)
+
     def test_surveillance_station(self):
         """Test SurveillanceStation."""
         self.api.with_surveillance = True
@@ -910,6 +2218,33 @@ class TestSynologyDSM(TestCase):
         assert self.api.surveillance_station.enable_motion_detection(1).get("success")
         assert self.api.surveillance_station.disable_motion_detection(1).get("success")
 
+        # Motion settings are cached, until changed
+        camera = self.api.surveillance_station.get_camera(1)
+        with patch.object(
+            self.api, "_execute_request", wraps=self.api._execute_request
+        ) as execute_request:
+            self.api.surveillance_station.update()
+            self.api.surveillance_station.update()
+            self.api.surveillance_station.enable_motion_detection(1)
+            self.api.surveillance_station.update()
+            self.api.surveillance_station.motion_detection_ttl = 0
+            self.api.surveillance_station.update()
+        assert [call[0][2]["method"] for call in execute_request.call_args_list] == [
+            "List",
+            "MotionEnum",
+            "GetLiveViewPath",
+            "List",
+            "GetLiveViewPath",
+            "MDParamSave",
+            "List",
+            "MotionEnum",
+            "GetLiveViewPath",
+            "List",
+            "MotionEnum",
+            "GetLiveViewPath",
+        ]
+        assert self.api.surveillance_station.get_camera(1) is camera
+
         # Home mode
         assert self.api.surveillance_station.get_home_mode_status()
         assert self.api.surveillance_station.set_home_mode(False)
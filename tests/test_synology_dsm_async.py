@@ -0,0 +1,294 @@
+"""Synology DSM asyncio tests."""
+import asyncio
+from unittest import TestCase
+
+import pytest
+
+from . import AsyncSynologyDSMMock
+from . import VALID_HOST
+from . import VALID_HTTPS
+from . import VALID_PASSWORD
+from . import VALID_PORT
+from . import VALID_USER
+from . import VALID_VERIFY_SSL
+from .const import EXPIRED_SESSION_ID
+from .const import SESSION_ID
+from .const import SYNO_TOKEN
+from synology_dsm.api.core.security import SynoCoreSecurity
+from synology_dsm.const import API_AUTH
+from synology_dsm.exceptions import SynologyDSMAPINotExistsException
+from synology_dsm.exceptions import SynologyDSMLoginInvalidException
+from synology_dsm.sampler import SynoUtilizationSampler
+
+aiohttp = pytest.importorskip("aiohttp")
+URL = pytest.importorskip("yarl").URL
+
+
+class TestAsyncSynologyDSM(TestCase):
+    """AsyncSynologyDSM test cases."""
+
+    api = None
+
+    def setUp(self):
+        """Context initialisation called for all tests."""
+        self.api = AsyncSynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            VALID_USER,
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+        )
+
+    def test_login(self):
+        """Test login."""
+        assert asyncio.run(self.api.login())
+        assert self.api.apis.get(API_AUTH)
+        assert self.api._session_id == SESSION_ID
+        assert self.api._syno_token == SYNO_TOKEN
+        assert self.api.information.model == "DS918+"
+
+    def test_login_shared_session(self):
+        """Test login only clears the NAS cookies of a session passed in."""
+
+        async def login():
+            async with aiohttp.ClientSession() as session:
+                session.cookie_jar.update_cookies(
+                    {"id": "nas"}, URL(f"https://{VALID_HOST}/")
+                )
+                session.cookie_jar.update_cookies(
+                    {"id": "other"}, URL("https://other.example.com/")
+                )
+                api = AsyncSynologyDSMMock(
+                    VALID_HOST,
+                    VALID_PORT,
+                    VALID_USER,
+                    VALID_PASSWORD,
+                    VALID_HTTPS,
+                    VALID_VERIFY_SSL,
+                    session=session,
+                )
+                assert await api.login()
+                await api.close()
+                assert not session.closed
+                return [cookie.value for cookie in session.cookie_jar]
+
+        assert asyncio.run(login()) == ["other"]
+
+    def test_unsupported_options(self):
+        """Test options of the synchronous client are refused."""
+        for option in ({"batch_requests": True}, {"max_workers": 4}):
+            with pytest.raises(TypeError):
+                AsyncSynologyDSMMock(
+                    VALID_HOST,
+                    VALID_PORT,
+                    VALID_USER,
+                    VALID_PASSWORD,
+                    VALID_HTTPS,
+                    VALID_VERIFY_SSL,
+                    **option,
+                )
+
+    def test_login_failed(self):
+        """Test failed login."""
+        api = AsyncSynologyDSMMock(
+            VALID_HOST,
+            VALID_PORT,
+            "user",
+            VALID_PASSWORD,
+            VALID_HTTPS,
+            VALID_VERIFY_SSL,
+        )
+        with pytest.raises(SynologyDSMLoginInvalidException):
+            asyncio.run(api.login())
+        assert not api._session_id
+
+    def test_request_get_failed(self):
+        """Test failed get request."""
+        with pytest.raises(SynologyDSMAPINotExistsException):
+            asyncio.run(self.api.get("SYNO.Virtualization.API.Task.Info", "list"))
+
+    def test_update(self):
+        """Test concurrent update of the instanced modules."""
+
+        async def update():
+            assert self.api.security
+            assert self.api.storage
+            assert self.api.utilisation
+            await self.api.update()
+
+        asyncio.run(update())
+        assert self.api._session_id == SESSION_ID
+        assert self.api.security.status == "safe"
+        assert self.api.storage.volume_status("volume_1") == "normal"
+        assert self.api.utilisation.cpu_total_load == 9
+
+    def test_request_coalescing(self):
+        """Test identical concurrent reads share one request."""
+        asyncio.run(self.api.login())
+        execute_request = self.api._execute_request
+        calls = []
+
+        async def slow_execute_request(method, url, params, **kwargs):
+            calls.append(url)
+            await asyncio.sleep(0.05)
+            return await execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = slow_execute_request
+
+        async def read():
+            return await asyncio.gather(
+                *(
+                    self.api.get(SynoCoreSecurity.API_KEY, "system_get")
+                    for _ in range(5)
+                )
+            )
+
+        responses = asyncio.run(read())
+        assert len(calls) == 1
+        assert all(response is responses[0] for response in responses)
+        assert not self.api._in_flight
+
+    def test_request_coalescing_cancelled(self):
+        """Test a cancelled read does not block the identical ones."""
+        asyncio.run(self.api.login())
+        execute_request = self.api._execute_request
+
+        async def slow_execute_request(method, url, params, **kwargs):
+            await asyncio.sleep(0.05)
+            return await execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = slow_execute_request
+
+        async def read():
+            leader = asyncio.ensure_future(
+                self.api.get(SynoCoreSecurity.API_KEY, "system_get")
+            )
+            await asyncio.sleep(0.01)
+            waiter = asyncio.ensure_future(
+                self.api.get(SynoCoreSecurity.API_KEY, "system_get")
+            )
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            response = await asyncio.wait_for(waiter, 1)
+            assert not self.api._in_flight
+            return response, await asyncio.wait_for(
+                self.api.get(SynoCoreSecurity.API_KEY, "system_get"), 1
+            )
+
+        responses = asyncio.run(read())
+        assert all(response["success"] for response in responses)
+        assert not self.api._in_flight
+
+    def test_relogin_single_flight(self):
+        """Test only one coroutine logs in again when the session expired."""
+        asyncio.run(self.api.login())
+        assert self.api.security
+        assert self.api.storage
+        assert self.api.utilisation
+        self.api._session_id = EXPIRED_SESSION_ID
+        execute_request = self.api._execute_request
+        logins = []
+
+        async def counting_execute_request(method, url, params, **kwargs):
+            if params.get("method") == "login":
+                logins.append(url)
+            await asyncio.sleep(0.01)
+            return await execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = counting_execute_request
+        asyncio.run(self.api.update())
+        assert len(logins) == 1
+        assert self.api._session_id == SESSION_ID
+        assert self.api.security.status == "safe"
+
+    def test_storage(self):
+        """Test awaitable storage update."""
+        asyncio.run(self.api.storage.update())
+        assert self.api.storage.disks_ids
+        assert self.api.storage.volume_disk_temp_avg("volume_1") == 24.0
+
+    def test_download_station(self):
+        """Test awaitable DownloadStation."""
+        assert asyncio.run(self.api.download_station.get_info())["data"]["version"]
+        asyncio.run(self.api.download_station.update())
+        assert len(self.api.download_station.get_all_tasks()) == 8
+
+        async def iter_tasks():
+            return [
+                task.id
+                async for task in self.api.download_station.iter_tasks(page_size=5)
+            ]
+
+        assert len(asyncio.run(iter_tasks())) == 8
+
+        batch = self.api.download_station.batch()
+        batch.pause(["dbid_86", "dbid_164"])
+        batch.delete("dbid_549")
+        assert len(asyncio.run(batch.flush())) == 2
+
+    def test_surveillance_station(self):
+        """Test awaitable SurveillanceStation."""
+        self.api.with_surveillance = True
+        asyncio.run(self.api.surveillance_station.update())
+        assert self.api.surveillance_station.get_camera(1)
+        assert self.api.surveillance_station.get_camera_live_view_path(1, "rtsp")
+        assert self.api.surveillance_station.is_motion_detection_enabled(1)
+        assert asyncio.run(self.api.surveillance_station.get_home_mode_status())
+        assert asyncio.run(self.api.surveillance_station.set_home_mode(True))
+
+    def test_surveillance_station_camera_images(self):
+        """Test SurveillanceStation camera images fetched concurrently."""
+        self.api.with_surveillance = True
+
+        async def fetch():
+            return [
+                image
+                async for image in self.api.surveillance_station.iter_camera_images(
+                    [1, 2, 11], max_concurrency=2, timeout=2
+                )
+            ]
+
+        images = {image.camera_id: image for image in asyncio.run(fetch())}
+        assert images[1].image == b"image 1"
+        assert images[2].image == b"image 2"
+        assert images[11].error
+
+    def test_surveillance_station_camera_images_break(self):
+        """Test camera images fetched again after stopping the iteration."""
+        self.api.with_surveillance = True
+        execute_request = self.api._execute_request
+
+        async def slow_execute_request(method, url, params, **kwargs):
+            if params.get("method") == "GetSnapshot":
+                await asyncio.sleep(0.02 * params["id"])
+            return await execute_request(method, url, params, **kwargs)
+
+        self.api._execute_request = slow_execute_request
+        surveillance = self.api.surveillance_station
+
+        async def fetch():
+            async for image in surveillance.iter_camera_images([1, 2, 3]):
+                break
+            return image, [
+                await asyncio.wait_for(surveillance.get_camera_image(camera_id), 1)
+                for camera_id in (2, 3)
+            ]
+
+        image, images = asyncio.run(fetch())
+        assert image == (1, b"image 1", None)
+        assert images == [b"image 2", b"image 3"]
+        assert not self.api._in_flight
+
+    def test_utilisation_sampler(self):
+        """Test utilisation sampled in an asyncio task."""
+
+        async def sample():
+            sampler = SynoUtilizationSampler(self.api, interval=0.01).start()
+            await asyncio.sleep(0.1)
+            sampler.stop()
+            return sampler
+
+        sampler = asyncio.run(sample())
+        assert sampler.samples_count > 1
+        assert sampler.stats("cpu.total_load")["p95"] == 9